@@ -1,29 +1,146 @@
-from flask import Flask, render_template, request, jsonify, session, redirect, url_for
+from flask import Blueprint, Flask, Response, current_app, g, has_app_context, has_request_context, render_template, request, jsonify, session, redirect, stream_with_context, url_for
+from flask.cli import AppGroup
 from flask_sqlalchemy import SQLAlchemy
+from collections import OrderedDict
 from datetime import datetime, date, timedelta
-from sqlalchemy import func
+from sqlalchemy import case, cast, event, func, inspect, literal, select, text, true, tuple_, union_all, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError, OperationalError
+from urllib.parse import quote
+from json_provider import create_json_provider
+from metrics import Metrics
+from xlsx_writer import stream_xlsx
+import base64
+import click
+import csv
+import io
+import itertools
+import json
+import math
 import os
+import random
+import tempfile
+import threading
+import time
+import zlib
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
 
 # 한국 시간 헬퍼 함수
 def kst_now():
     return datetime.utcnow() + timedelta(hours=9)
 
-app = Flask(__name__)
+# 연월(YYYY-MM)의 시작일과 다음 달 시작일
+# 연월 문자열 검증 - strptime('%Y-%m')은 '2030-3'도 받으므로 저장 형식(YYYY-MM)과 같은지까지 확인
+def is_year_month(value):
+    try:
+        return datetime.strptime(value, '%Y-%m').strftime('%Y-%m') == value
+    except (TypeError, ValueError):
+        return False
+
+def month_range(year_month):
+    year, month = map(int, year_month.split('-'))
+    month_start = date(year, month, 1)
+    if month == 12:
+        month_end = date(year + 1, 1, 1)
+    else:
+        month_end = date(year, month + 1, 1)
+    return month_start, month_end
 
 # PostgreSQL (production) or SQLite (local development)
-database_url = os.environ.get('DATABASE_URL')
-if database_url:
-    # Render PostgreSQL URL fix (postgres:// -> postgresql://)
-    if database_url.startswith('postgres://'):
-        database_url = database_url.replace('postgres://', 'postgresql://', 1)
-    app.config['SQLALCHEMY_DATABASE_URI'] = database_url
-else:
+def database_uri():
+    database_url = os.environ.get('DATABASE_URL')
+    if database_url:
+        # Render PostgreSQL URL fix (postgres:// -> postgresql://)
+        if database_url.startswith('postgres://'):
+            database_url = database_url.replace('postgres://', 'postgresql://', 1)
+        return database_url
     # Local development
-    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///noti_plan.db'
-
-app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-app.config['SECRET_KEY'] = 'noti_plan_secret_key_2848'
-db = SQLAlchemy(app)
+    return 'sqlite:///noti_plan.db'
+
+# DB 연결 프로필 - DB_PROFILE(web / batch)로 선택하고 항목별로 환경 변수로 덮어씀
+# (DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_RECYCLE, DB_POOL_TIMEOUT, DB_POOL_PRE_PING, DB_STATEMENT_TIMEOUT_MS)
+DB_PROFILES = {
+    # 웹 워커: 스레드 16개가 동시에 커넥션을 잡아도 기다리지 않도록 최대 20개,
+    # 오래 걸리는 쿼리는 끊어서 커넥션을 반환
+    'web': {
+        'pool_size': 5,
+        'max_overflow': 15,
+        'pool_recycle': 1800,
+        'pool_timeout': 10,
+        'pool_pre_ping': True,
+        'statement_timeout_ms': 15000,
+    },
+    # CLI / 배치 작업: 커넥션 하나, 시간 제한 없음
+    'batch': {
+        'pool_size': 1,
+        'max_overflow': 2,
+        'pool_recycle': 1800,
+        'pool_timeout': 30,
+        'pool_pre_ping': True,
+        'statement_timeout_ms': 0,
+    },
+}
+
+# SQLite 연결마다 적용하는 PRAGMA - WAL로 읽기와 쓰기가 서로 막지 않고,
+# 쓰기 잠금은 busy_timeout 동안 기다림 (SQLITE_JOURNAL_MODE, SQLITE_SYNCHRONOUS, SQLITE_BUSY_TIMEOUT_MS, SQLITE_MMAP_SIZE)
+SQLITE_PRAGMAS = {
+    'journal_mode': os.environ.get('SQLITE_JOURNAL_MODE', 'WAL'),
+    'synchronous': os.environ.get('SQLITE_SYNCHRONOUS', 'NORMAL'),
+    'busy_timeout': int(os.environ.get('SQLITE_BUSY_TIMEOUT_MS', 5000)),
+    'mmap_size': int(os.environ.get('SQLITE_MMAP_SIZE', 256 * 1024 * 1024)),
+}
+
+def db_profile(name=None):
+    name = name or os.environ.get('DB_PROFILE', 'web')
+    if name not in DB_PROFILES:
+        raise ValueError(f'알 수 없는 DB_PROFILE: {name} ({", ".join(DB_PROFILES)})')
+    profile = dict(DB_PROFILES[name])
+    for key, value in profile.items():
+        env_value = os.environ.get(f'DB_{key.upper()}')
+        if env_value is None:
+            continue
+        if isinstance(value, bool):
+            profile[key] = env_value.lower() in ('1', 'true', 'yes', 'on')
+        else:
+            profile[key] = int(env_value)
+    return profile
+
+# SQLAlchemy create_engine 옵션 (DB별)
+def engine_options(database_uri, profile):
+    if database_uri.startswith('sqlite'):
+        # 쓰기 잠금 대기는 busy_timeout PRAGMA로 처리 (메모리 DB는 스레드별 단일 연결이라 풀 설정 없음)
+        options = {'connect_args': {'timeout': SQLITE_PRAGMAS['busy_timeout'] / 1000}}
+        if database_uri not in ('sqlite://', 'sqlite:///:memory:'):
+            options.update(pool_size=profile['pool_size'], max_overflow=profile['max_overflow'],
+                           pool_timeout=profile['pool_timeout'])
+        return options
+    options = {key: value for key, value in profile.items() if key != 'statement_timeout_ms'}
+    if database_uri.startswith('postgresql') and profile['statement_timeout_ms']:
+        options['connect_args'] = {'options': f"-c statement_timeout={profile['statement_timeout_ms']}"}
+    return options
+
+def configure_sqlite_connection(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in SQLITE_PRAGMAS.items():
+            cursor.execute(f'PRAGMA {name} = {value}')
+    finally:
+        cursor.close()
+
+# 현재 트랜잭션의 쿼리 시간 제한 해제 (PostgreSQL, 오래 걸리는 CLI 작업용)
+def disable_statement_timeout():
+    if db.engine.dialect.name == 'postgresql':
+        db.session.execute(text('SET LOCAL statement_timeout = 0'))
+
+# 앱과 연결되지 않은 확장 / 블루프린트 - create_app()에서 앱에 등록
+# (라우트, 에러 핸들러, 요청 훅, CLI 명령은 모두 블루프린트에 모아 두고 등록 시점에 앱에 붙음)
+db = SQLAlchemy()
+bp = Blueprint('noti_plan', __name__, cli_group=None)
 
 ADMIN_PASSWORD = '2848'
 
@@ -56,6 +173,8 @@ class MonthlyQuota(db.Model):
 class SendRequest(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     service_id = db.Column(db.Integer, db.ForeignKey('service.id'), nullable=False)
+    # 조회용 비정규화 컬럼 (service.organization_id와 동기화)
+    organization_id = db.Column(db.Integer, db.ForeignKey('organization.id'), nullable=False)
     send_date = db.Column(db.Date, nullable=False)
     send_time = db.Column(db.String(5))  # HH:MM
     channel = db.Column(db.String(20), nullable=False, default='naver')  # naver, payco, talktalk
@@ -65,6 +184,42 @@ class SendRequest(db.Model):
     created_at = db.Column(db.DateTime, default=kst_now)
     updated_at = db.Column(db.DateTime, default=kst_now, onupdate=kst_now)
 
+    __table_args__ = (
+        db.Index('ix_send_request_org_channel_date', 'organization_id', 'channel', 'send_date'),
+        db.Index('ix_send_request_service_date', 'service_id', 'send_date'),
+        # 목록 페이지네이션 (send_date, created_at, id)
+        db.Index('ix_send_request_list', 'send_date', 'created_at', 'id'),
+        db.Index('ix_send_request_org_list', 'organization_id', 'send_date', 'created_at', 'id'),
+    )
+
+# 월간 사용량 원장 (조직/월/채널별 신청 물량 합계)
+class MonthlyUsage(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    organization_id = db.Column(db.Integer, db.ForeignKey('organization.id'), nullable=False)
+    year_month = db.Column(db.String(7), nullable=False)  # YYYY-MM
+    channel = db.Column(db.String(20), nullable=False)
+    requested = db.Column(db.BigInteger, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=kst_now, onupdate=kst_now)
+
+    __table_args__ = (db.UniqueConstraint('organization_id', 'year_month', 'channel'),)
+
+# 서비스별 월간 사용량 롤업 (기간별 분석용)
+# 신청/삭제/승인 시 증분 갱신하고, 프리징 시 해당 월을 SendRequest 기준으로 다시 만듦
+class MonthlyRollup(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    organization_id = db.Column(db.Integer, db.ForeignKey('organization.id'), nullable=False)
+    service_id = db.Column(db.Integer, db.ForeignKey('service.id'), nullable=False)
+    year_month = db.Column(db.String(7), nullable=False)  # YYYY-MM
+    channel = db.Column(db.String(20), nullable=False)
+    requested = db.Column(db.BigInteger, nullable=False, default=0)
+    request_count = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=kst_now, onupdate=kst_now)
+
+    __table_args__ = (
+        db.UniqueConstraint('service_id', 'year_month', 'channel'),
+        db.Index('ix_monthly_rollup_month', 'year_month', 'organization_id'),
+    )
+
 # 프리징 관리
 class MonthlyFreeze(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -107,14 +262,934 @@ class ChangeRequest(db.Model):
     service = db.relationship('Service', backref='change_requests')
     original_request = db.relationship('SendRequest', backref='change_requests', foreign_keys=[original_request_id])
 
+    __table_args__ = (
+        # 목록 페이지네이션 (created_at, id)
+        db.Index('ix_change_request_list', 'created_at', 'id'),
+        db.Index('ix_change_request_status_list', 'status', 'created_at', 'id'),
+    )
+
+# 참조 데이터 캐시 세대 (워커 간 캐시 무효화용, 변경 시마다 새 난수 값으로 교체)
+class CacheGeneration(db.Model):
+    name = db.Column(db.String(50), primary_key=True)
+    generation = db.Column(db.Integer, nullable=False, default=0)
+
+# 조직/월 단위 데이터 버전 (달력 응답 ETag용, 변경 시마다 새 난수 값으로 교체)
+# organization_id = 0 은 해당 월 전체 조직 범위
+class DataVersion(db.Model):
+    organization_id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    year_month = db.Column(db.String(7), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+
+# 변경 로그 (실시간 스트림용, 모든 워커가 공유)
+# organization_id = 0 은 해당 월 전체 조직에 대한 변경 (프리징)
+class ChangeEvent(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    organization_id = db.Column(db.Integer, nullable=False)
+    year_month = db.Column(db.String(7), nullable=False)
+    kind = db.Column(db.String(20), nullable=False)  # create, delete, approval, quota, freeze, service
+    created_at = db.Column(db.DateTime, default=kst_now)
+
+    __table_args__ = (
+        db.Index('ix_change_event_scope', 'year_month', 'organization_id', 'id'),
+    )
+
+# 스키마 버전 관리
+class SchemaMigration(db.Model):
+    version = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(100), nullable=False)
+    applied_at = db.Column(db.DateTime, default=kst_now)
+
+# 마이그레이션 0001: SendRequest.organization_id 추가 및 조회 인덱스 생성
+def migrate_send_request_organization_id():
+    columns = {c['name'] for c in inspect(db.engine).get_columns('send_request')}
+    if 'organization_id' not in columns:
+        db.session.execute(text(
+            'ALTER TABLE send_request ADD COLUMN organization_id INTEGER REFERENCES organization (id)'
+        ))
+
+    # 기존 데이터 백필
+    db.session.execute(text(
+        'UPDATE send_request SET organization_id = '
+        '(SELECT service.organization_id FROM service WHERE service.id = send_request.service_id) '
+        'WHERE organization_id IS NULL'
+    ))
+
+    if db.engine.dialect.name == 'postgresql':
+        db.session.execute(text('ALTER TABLE send_request ALTER COLUMN organization_id SET NOT NULL'))
+
+    db.session.execute(text(
+        'CREATE INDEX IF NOT EXISTS ix_send_request_org_channel_date '
+        'ON send_request (organization_id, channel, send_date)'
+    ))
+    db.session.execute(text(
+        'CREATE INDEX IF NOT EXISTS ix_send_request_service_date '
+        'ON send_request (service_id, send_date)'
+    ))
+
+# 마이그레이션 0002: 월간 사용량 원장 백필
+def migrate_monthly_usage():
+    rebuild_monthly_usage()
+
+# 마이그레이션 0003: 목록 페이지네이션 인덱스
+def migrate_list_pagination_indexes():
+    for statement in [
+        'CREATE INDEX IF NOT EXISTS ix_send_request_list ON send_request (send_date, created_at, id)',
+        'CREATE INDEX IF NOT EXISTS ix_send_request_org_list '
+        'ON send_request (organization_id, send_date, created_at, id)',
+        'CREATE INDEX IF NOT EXISTS ix_change_request_list ON change_request (created_at, id)',
+        'CREATE INDEX IF NOT EXISTS ix_change_request_status_list ON change_request (status, created_at, id)',
+    ]:
+        db.session.execute(text(statement))
+
+# 마이그레이션 0004: 서비스별 월간 롤업 백필
+def migrate_monthly_rollup():
+    rebuild_monthly_rollup()
+
+# (버전, 이름, 함수) - 새 마이그레이션은 항상 뒤에 추가
+MIGRATIONS = [
+    (1, 'send_request_organization_id', migrate_send_request_organization_id),
+    (2, 'monthly_usage', migrate_monthly_usage),
+    (3, 'list_pagination_indexes', migrate_list_pagination_indexes),
+    (4, 'monthly_rollup', migrate_monthly_rollup),
+]
+
+# 스키마 생성 및 미적용 마이그레이션 실행 - 이번에 적용한 (버전, 이름) 목록 반환
+def run_migrations():
+    db.create_all()
+    applied = {m.version for m in SchemaMigration.query.all()}
+
+    newly_applied = []
+    for version, name, migrate in MIGRATIONS:
+        if version in applied:
+            continue
+        disable_statement_timeout()
+        migrate()
+        db.session.add(SchemaMigration(version=version, name=name))
+        try:
+            db.session.commit()
+            newly_applied.append((version, name))
+        except IntegrityError:
+            # 다른 프로세스가 먼저 적용한 경우
+            db.session.rollback()
+    return newly_applied
+
+# CLI: flask db upgrade / flask db status (배포 시 앱 시작 전에 한 번 실행)
+schema_cli = AppGroup('db', help='스키마 마이그레이션')
+
+@schema_cli.command('upgrade')
+def schema_upgrade_command():
+    newly_applied = run_migrations()
+    for version, name in newly_applied:
+        click.echo(f'적용: {version:04d} {name}')
+    click.echo(f'스키마가 최신 상태입니다. (마이그레이션 {len(newly_applied)}건 적용)')
+
+@schema_cli.command('status')
+def schema_status_command():
+    applied = {}
+    if inspect(db.engine).has_table(SchemaMigration.__tablename__):
+        applied = {m.version: m.applied_at for m in SchemaMigration.query.all()}
+    for version, name, _ in MIGRATIONS:
+        state = f'적용 ({applied[version]:%Y-%m-%d %H:%M})' if version in applied else '미적용'
+        click.echo(f'{version:04d} {name}: {state}')
+    pending = [version for version, _, _ in MIGRATIONS if version not in applied]
+    if pending:
+        raise click.ClickException(f'미적용 마이그레이션 {len(pending)}건 - `flask db upgrade`로 적용하세요.')
+
+bp.cli.add_command(schema_cli)
+
+# 날짜 컬럼 -> 'YYYY-MM' SQL 표현식 (DB별)
+def sql_year_month(column):
+    if db.engine.dialect.name == 'postgresql':
+        return func.to_char(column, 'YYYY-MM')
+    return func.strftime('%Y-%m', column)
+
+# 월간 사용량 원장 조회
+def get_usage(organization_id, year_month, channel):
+    usage = MonthlyUsage.query.filter_by(
+        organization_id=organization_id,
+        year_month=year_month,
+        channel=channel
+    ).first()
+    return usage.requested if usage else 0
+
+# ON CONFLICT를 지원하는 INSERT 구문 (PostgreSQL / SQLite)
+def dialect_insert(model):
+    if db.engine.dialect.name == 'postgresql':
+        return postgresql.insert(model)
+    return sqlite.insert(model)
+
+# 데이터 버전 갱신 - 커밋 직전에 한 번에 기록됨 (write_pending_changes)
+# (조직 범위와 전체 조직 범위(0)를 함께 올림)
+def bump_data_version(organization_id, year_month):
+    pending = g.setdefault('pending_data_versions', set())
+    pending.add((organization_id, year_month))
+    pending.add((0, year_month))
+
+CHANGE_EVENT_RETENTION = timedelta(days=1)
+CHANGE_EVENT_PRUNE_RATE = 0.01  # 커밋마다 오래된 로그를 정리할 확률
+
+# 변경 로그 기록 - 커밋 직전에 한 번에 기록됨 (같은 트랜잭션 안의 중복 기록은 생략)
+def record_change(organization_id, year_month, kind):
+    g.setdefault('pending_changes', set()).add((organization_id, year_month, kind))
+
+# 요청 동안 모은 데이터 버전 / 변경 로그를 커밋하는 트랜잭션에 함께 기록
+# (영향받은 조직/월 수와 관계없이 executemany 한 번씩만 실행)
+@event.listens_for(db.session, 'before_commit')
+def write_pending_changes(session):
+    if not has_app_context():
+        return
+    versions = g.pop('pending_data_versions', None)
+    changes = g.pop('pending_changes', None)
+
+    if versions:
+        stmt = dialect_insert(DataVersion)
+        session.execute(stmt.on_conflict_do_update(
+            index_elements=['organization_id', 'year_month'],
+            set_={'version': stmt.excluded.version}
+        ), [{
+            'organization_id': organization_id,
+            'year_month': year_month,
+            'version': random.getrandbits(31)
+        } for organization_id, year_month in sorted(versions)])
+
+    if changes:
+        now = kst_now()
+        session.execute(ChangeEvent.__table__.insert(), [{
+            'organization_id': organization_id,
+            'year_month': year_month,
+            'kind': kind,
+            'created_at': now
+        } for organization_id, year_month, kind in sorted(changes)])
+
+        # 가끔씩 오래된 로그 정리
+        if random.random() < CHANGE_EVENT_PRUNE_RATE:
+            session.execute(ChangeEvent.__table__.delete().where(
+                ChangeEvent.created_at < now - CHANGE_EVENT_RETENTION
+            ))
+
+# 롤백된 트랜잭션의 데이터 버전 / 변경 로그는 버림
+@event.listens_for(db.session, 'after_rollback')
+def discard_pending_changes(session):
+    if has_app_context():
+        g.pop('pending_data_versions', None)
+        g.pop('pending_changes', None)
+
+# 월간 사용량 원장 증감 (호출한 쪽의 트랜잭션에서 함께 커밋)
+def adjust_usage(organization_id, year_month, channel, delta):
+    adjust_usages({(organization_id, year_month, channel): delta})
+
+# 여러 (조직, 월, 채널)의 원장 증감을 한 번에 반영 - {(조직, 월, 채널): 증감}
+def adjust_usages(deltas):
+    deltas = {key: delta for key, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    for organization_id, year_month, _ in deltas:
+        bump_data_version(organization_id, year_month)
+    now = kst_now()
+    stmt = dialect_insert(MonthlyUsage)
+    db.session.execute(stmt.on_conflict_do_update(
+        index_elements=['organization_id', 'year_month', 'channel'],
+        set_={
+            'requested': MonthlyUsage.requested + stmt.excluded.requested,
+            'updated_at': stmt.excluded.updated_at
+        }
+    ), [{
+        'organization_id': organization_id,
+        'year_month': year_month,
+        'channel': channel,
+        'requested': delta,
+        'updated_at': now
+    } for (organization_id, year_month, channel), delta in sorted(deltas.items())])
+
+# 물량 예약 - 남은 물량 안에서만 원장을 원자적으로 증가시킴
+# (조건부 UPDATE가 원장 행을 잠그므로 여러 워커가 동시에 신청해도 물량을 초과하지 않음)
+def reserve_usage(organization_id, year_month, channel, quantity):
+    return reserve_usages({(organization_id, year_month, channel): quantity})
+
+# 여러 (조직, 월, 채널)을 조건부 UPDATE 한 번으로 예약 - {(조직, 월, 채널): 물량}
+# 하나라도 물량이 부족하면 False를 반환하며, 이때 일부 그룹만 반영되었을 수 있으므로 호출한 쪽에서 롤백해야 함
+def reserve_usages(quantities):
+    keys = sorted(quantities)
+    if not keys:
+        return True
+    db.session.execute(dialect_insert(MonthlyUsage).on_conflict_do_nothing(
+        index_elements=['organization_id', 'year_month', 'channel']
+    ), [{
+        'organization_id': organization_id,
+        'year_month': year_month,
+        'channel': channel,
+        'requested': 0
+    } for organization_id, year_month, channel in keys])
+
+    total_quota = select(MonthlyQuota.total_quota).where(
+        MonthlyQuota.organization_id == MonthlyUsage.organization_id,
+        MonthlyQuota.year_month == MonthlyUsage.year_month,
+        MonthlyQuota.channel == MonthlyUsage.channel
+    ).scalar_subquery()
+    if len(keys) == 1:
+        quantity = literal(quantities[keys[0]])
+    else:
+        quantity = case(*[(db.and_(
+            MonthlyUsage.organization_id == organization_id,
+            MonthlyUsage.year_month == year_month,
+            MonthlyUsage.channel == channel
+        ), quantities[(organization_id, year_month, channel)]) for organization_id, year_month, channel in keys])
+
+    result = db.session.execute(update(MonthlyUsage).where(
+        tuple_(MonthlyUsage.organization_id, MonthlyUsage.year_month, MonthlyUsage.channel).in_(keys),
+        MonthlyUsage.requested + quantity <= total_quota
+    ).values(
+        requested=MonthlyUsage.requested + quantity,
+        updated_at=kst_now()
+    ).execution_options(synchronize_session=False))
+    if result.rowcount != len(keys):
+        return False
+    for organization_id, year_month, _ in keys:
+        bump_data_version(organization_id, year_month)
+    return True
+
+# 동시 쓰기 충돌 응답 (DB 잠금 대기 초과 등)
+def conflict_response():
+    db.session.rollback()
+    response = jsonify({'success': False, 'message': '다른 신청과 동시에 처리되어 충돌이 발생했습니다. 잠시 후 다시 시도해주세요.'})
+    response.headers['Retry-After'] = '1'
+    return response, 409
+
+# SendRequest 집계로 계산한 (조직, 월, 채널) -> 신청 물량
+def aggregate_usage():
+    year_month = sql_year_month(SendRequest.send_date)
+    rows = db.session.query(
+        SendRequest.organization_id,
+        year_month,
+        SendRequest.channel,
+        func.sum(SendRequest.quantity)
+    ).group_by(SendRequest.organization_id, year_month, SendRequest.channel).all()
+    return {(org_id, ym, channel): int(total) for org_id, ym, channel, total in rows}
+
+# 월간 사용량 원장 재생성
+def rebuild_monthly_usage():
+    MonthlyUsage.query.delete(synchronize_session=False)
+    db.session.bulk_insert_mappings(MonthlyUsage, [{
+        'organization_id': org_id,
+        'year_month': year_month,
+        'channel': channel,
+        'requested': total
+    } for (org_id, year_month, channel), total in aggregate_usage().items()])
+
+# 월간 사용량 원장 검증 - [(키, 원장 값, 실제 값)] 불일치 목록 반환
+def verify_monthly_usage():
+    expected = aggregate_usage()
+    ledger = {
+        (u.organization_id, u.year_month, u.channel): u.requested
+        for u in MonthlyUsage.query.all()
+    }
+    mismatches = []
+    for key in sorted(set(expected) | set(ledger)):
+        if expected.get(key, 0) != ledger.get(key, 0):
+            mismatches.append((key, ledger.get(key, 0), expected.get(key, 0)))
+    return mismatches
+
+# 서비스별 월간 롤업 증감 (호출한 쪽의 트랜잭션에서 함께 커밋)
+def adjust_rollup(service_id, organization_id, year_month, channel, quantity, count):
+    adjust_rollups({(service_id, organization_id, year_month, channel): (quantity, count)})
+
+# 여러 롤업 행 증감을 한 번에 반영 - {(서비스, 조직, 월, 채널): (물량 증감, 건수 증감)}
+def adjust_rollups(deltas):
+    rows = [(key, quantity, count) for key, (quantity, count) in sorted(deltas.items()) if quantity or count]
+    if not rows:
+        return
+    now = kst_now()
+    stmt = dialect_insert(MonthlyRollup)
+    db.session.execute(stmt.on_conflict_do_update(
+        index_elements=['service_id', 'year_month', 'channel'],
+        set_={
+            'organization_id': stmt.excluded.organization_id,
+            'requested': MonthlyRollup.requested + stmt.excluded.requested,
+            'request_count': MonthlyRollup.request_count + stmt.excluded.request_count,
+            'updated_at': stmt.excluded.updated_at
+        }
+    ), [{
+        'service_id': service_id,
+        'organization_id': organization_id,
+        'year_month': year_month,
+        'channel': channel,
+        'requested': quantity,
+        'request_count': count,
+        'updated_at': now
+    } for (service_id, organization_id, year_month, channel), quantity, count in rows])
+
+# SendRequest 집계 쿼리 - (조직, 서비스, 월, 채널, 물량 합계, 건수)
+def rollup_source(year_month=None):
+    sql_month = sql_year_month(SendRequest.send_date)
+    query = select(
+        SendRequest.organization_id,
+        SendRequest.service_id,
+        sql_month,
+        SendRequest.channel,
+        func.sum(SendRequest.quantity),
+        func.count(SendRequest.id)
+    ).group_by(SendRequest.organization_id, SendRequest.service_id, sql_month, SendRequest.channel)
+    if year_month:
+        month_start, month_end = month_range(year_month)
+        query = query.where(SendRequest.send_date >= month_start, SendRequest.send_date < month_end)
+    return query
+
+# 서비스별 월간 롤업 재생성 (year_month가 주어지면 해당 월만) - INSERT ... SELECT
+def rebuild_monthly_rollup(year_month=None):
+    delete_query = MonthlyRollup.query
+    if year_month:
+        delete_query = delete_query.filter(MonthlyRollup.year_month == year_month)
+    delete_query.delete(synchronize_session=False)
+
+    db.session.execute(MonthlyRollup.__table__.insert().from_select(
+        ['organization_id', 'service_id', 'year_month', 'channel', 'requested', 'request_count'],
+        rollup_source(year_month)
+    ))
+
+# 서비스별 월간 롤업 검증 - [(키, 롤업 값, 실제 값)] 불일치 목록 반환
+def verify_monthly_rollup():
+    expected = {
+        (service_id, ym, channel): (int(total), count)
+        for _, service_id, ym, channel, total, count in db.session.execute(rollup_source()).all()
+    }
+    rollup = {
+        (r.service_id, r.year_month, r.channel): (r.requested, r.request_count)
+        for r in MonthlyRollup.query.all()
+    }
+    mismatches = []
+    for key in sorted(set(expected) | set(rollup)):
+        if expected.get(key, (0, 0)) != rollup.get(key, (0, 0)):
+            mismatches.append((key, rollup.get(key, (0, 0)), expected.get(key, (0, 0))))
+    return mismatches
+
+# CLI: flask usage rebuild / flask usage verify
+usage_cli = AppGroup('usage', help='월간 사용량 원장 관리')
+
+@usage_cli.command('rebuild')
+def rebuild_usage_command():
+    disable_statement_timeout()
+    rebuild_monthly_usage()
+    rebuild_monthly_rollup()
+    db.session.commit()
+    click.echo(f'월간 사용량 원장을 재생성했습니다. ({MonthlyUsage.query.count()}건)')
+    click.echo(f'서비스별 월간 롤업을 재생성했습니다. ({MonthlyRollup.query.count()}건)')
+
+@usage_cli.command('verify')
+def verify_usage_command():
+    mismatches = verify_monthly_usage()
+    for (org_id, year_month, channel), ledger, actual in mismatches:
+        click.echo(f'불일치: 조직 {org_id} / {year_month} / {channel} - 원장 {ledger:,}, 실제 {actual:,}')
+    rollup_mismatches = verify_monthly_rollup()
+    for (service_id, year_month, channel), (rollup, rollup_count), (actual, actual_count) in rollup_mismatches:
+        click.echo(f'불일치: 서비스 {service_id} / {year_month} / {channel} - 롤업 {rollup:,}({rollup_count}건), '
+                   f'실제 {actual:,}({actual_count}건)')
+    mismatches += rollup_mismatches
+    if mismatches:
+        raise click.ClickException(f'{len(mismatches)}건의 불일치가 있습니다. `flask usage rebuild`로 재생성하세요.')
+    click.echo('월간 사용량 원장과 서비스별 롤업이 일치합니다.')
+
+bp.cli.add_command(usage_cli)
+
+# 기준 조직 / 서비스 목록 (flask seed) - 조직 -> [(서비스, 담당자)]
+REFERENCE_ORGANIZATIONS = {
+    'AD사업개발': [('프리미엄패키지', '박종호')],
+    '내부제휴서비스': [('사용자마케팅', '유진')],
+    '내자산': [('내자산 신규 등록', '김정희')],
+    '대출': [
+        ('신용대출비교', '정채연'),
+        ('신용대환대출', '정채연'),
+        ('신용점수', '서원교'),
+        ('신차리스', '허호필'),
+        ('전월세대출비교', '정채연'),
+        ('주택담보대출비교', '정채연'),
+        ('중고차론', '허호필'),
+    ],
+    '마이카': [('내차등록', '허호필')],
+    '마케팅스튜디오': [
+        ('마케팅부스팅', '오인숙'),
+        ('애플', '최승민'),
+        ('프로모션', '최용우'),
+    ],
+    '보험': [
+        ('내자산 신규 등록(보험)', '조은수'),
+        ('보험가입', '이은혜'),
+        ('자동차보험중개', '강경필'),
+        ('해외여행보험중개', '강경필'),
+    ],
+    '외부제휴서비스': [
+        ('외부제휴_서비스', '임태경'),
+        ('외부제휴_쇼핑', '임태경'),
+    ],
+    '증권': [('증권토론', '정인아')],
+    '카드CPA': [
+        ('KB카드', '강창민'),
+        ('네이버페이 머니카드', '정민주'),
+        ('롯데카드 CPA', '강창민'),
+        ('삼성카드 제휴 CPA', '강창민'),
+        ('신한카드 CPA', '강창민'),
+        ('신한카드 제휴 CPA', '강창민'),
+        ('우리카드 CPA', '강창민'),
+        ('현대카드 CPA', '강창민'),
+    ],
+    '페이앱': [('페이앱설치', '이재형')],
+    '현장결제': [
+        ('오프라인 현장결제', '신현확'),
+        ('오프라인 해외결제', '김민지'),
+    ],
+}
+
+# 합성 데이터 분포 (flask seed --orgs N)
+SEED_BATCH_SIZE = 50000
+SEED_CHANNELS = ['naver', 'payco', 'talktalk']
+SEED_CHANNEL_WEIGHTS = [6, 3, 1]
+SEED_WEEKDAY_WEIGHTS = [10, 10, 10, 10, 9, 3, 2]  # 월~일 (주말 발송은 드묾)
+SEED_CAMPAIGN_THEMES = ['혜택 안내', '신규 가입', '리마인드', '이벤트', '재방문 유도', '프로모션', '공지']
+
+# 테이블 컬럼의 Python 쪽 기본값 (드라이버로 직접 적재할 때는 SQLAlchemy 기본값을 거치지 않으므로 직접 채움)
+def column_defaults(table):
+    defaults = {}
+    for column in table.columns:
+        if column.primary_key or column.default is None:
+            continue
+        if not (column.default.is_scalar or column.default.is_callable):
+            continue
+        defaults[column.name] = column.default.arg(None) if column.default.is_callable else column.default.arg
+    return defaults
+
+# PostgreSQL COPY ... FROM STDIN (CSV) - 현재 세션의 연결/트랜잭션에서 실행
+def copy_rows(cursor, table, columns, values):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerows(values)  # 빈 칸(따옴표 없음)은 NULL로 적재됨
+    buffer.seek(0)
+    quote_name = db.engine.dialect.identifier_preparer.quote
+    cursor.copy_expert(
+        f'COPY {quote_name(table.name)} ({", ".join(quote_name(name) for name in columns)}) FROM STDIN WITH (FORMAT csv)',
+        buffer
+    )
+
+# 대량 INSERT - batch_size 행씩 드라이버로 직접 적재 (PostgreSQL은 COPY, SQLite는 executemany)
+# SQLAlchemy의 행별 파라미터 처리를 건너뛰고 컬럼 기본값은 배치마다 한 번만 계산
+# (rows는 같은 키를 가진 dict의 iterable, 적재한 행 수 반환)
+def bulk_insert(table, rows, batch_size=SEED_BATCH_SIZE, progress=None):
+    dialect = db.engine.dialect
+    rows = iter(rows)
+    inserted = 0
+    while True:
+        batch = [row for _, row in zip(range(batch_size), rows)]
+        if not batch:
+            return inserted
+        if dialect.name not in ('postgresql', 'sqlite'):
+            db.session.execute(table.insert(), batch)
+        else:
+            defaults = column_defaults(table)
+            columns = list(batch[0]) + [name for name in defaults if name not in batch[0]]
+            values = [[row[name] if name in row else defaults[name] for name in columns] for row in batch]
+            for i, name in enumerate(columns):
+                processor = table.c[name].type.dialect_impl(dialect).bind_processor(dialect)
+                if processor:
+                    for value in values:
+                        value[i] = processor(value[i])
+            cursor = db.session.connection().connection.cursor()
+            try:
+                if dialect.name == 'postgresql':
+                    copy_rows(cursor, table, columns, values)
+                else:
+                    cursor.executemany(
+                        f'INSERT INTO {table.name} ({", ".join(columns)}) VALUES ({", ".join("?" * len(columns))})',
+                        values
+                    )
+            finally:
+                cursor.close()
+        inserted += len(batch)
+        if progress:
+            progress(table.name, inserted)
+
+# 기준 조직 / 서비스 적재 (이미 있는 이름은 건너뜀) - (조직 수, 서비스 수) 반환
+def seed_reference():
+    existing_orgs = {name for name, in db.session.query(Organization.name)}
+    org_count = bulk_insert(Organization.__table__, [
+        {'name': name} for name in REFERENCE_ORGANIZATIONS if name not in existing_orgs
+    ])
+    org_ids = dict(db.session.query(Organization.name, Organization.id).filter(
+        Organization.name.in_(list(REFERENCE_ORGANIZATIONS))
+    ).order_by(Organization.id.desc()))
+    existing_services = set(db.session.query(Service.organization_id, Service.name))
+    service_count = bulk_insert(Service.__table__, [{
+        'name': service_name,
+        'organization_id': org_ids[org_name],
+        'manager_name': manager_name
+    } for org_name, services in REFERENCE_ORGANIZATIONS.items()
+        for service_name, manager_name in services
+        if (org_ids[org_name], service_name) not in existing_services])
+    return org_count, service_count
+
+# 합성 데이터 생성 - 조직 / 서비스 / 월간 물량 / 캠페인 / 변경 요청 (테이블별 적재 행 수 반환)
+# 서비스별 캠페인 수는 파레토 분포, 발송일은 평일 위주, 발송 시간은 오후 1시 전후 정규분포,
+# 물량은 로그정규분포로 생성. quota가 없으면 조직/월/채널별 신청 합계의 105~150%로 물량을 설정
+def seed_generated(orgs, services, requests=0, change_requests=0, months=12, start_month=None,
+                   quota=None, rng_seed=0, batch_size=SEED_BATCH_SIZE, progress=None):
+    rng = random.Random(rng_seed)
+    start_month = start_month or kst_now().strftime('%Y-%m')
+    year, month = map(int, start_month.split('-'))
+    end_index = year * 12 + month - 1 + months - 1
+    year_months = month_list(start_month, f'{end_index // 12}-{end_index % 12 + 1:02d}')
+    first_day, _ = month_range(year_months[0])
+    _, last_day = month_range(year_months[-1])
+    days = [first_day + timedelta(days=i) for i in range((last_day - first_day).days)]
+    day_weights = list(itertools.accumulate(SEED_WEEKDAY_WEIGHTS[day.weekday()] for day in days))
+    time_slots = [f'{hour:02d}:{minute:02d}' for hour in range(8, 22) for minute in (0, 30)]
+    time_weights = list(itertools.accumulate(
+        math.exp(-((int(slot[:2]) + int(slot[3:]) / 60 - 13) / 3) ** 2 / 2) for slot in time_slots
+    ))
+    counts = {}
+
+    max_org_id = db.session.query(func.max(Organization.id)).scalar() or 0
+    counts['organization'] = bulk_insert(Organization.__table__, (
+        {'name': f'조직{max_org_id + i + 1:04d}'} for i in range(orgs)
+    ), batch_size, progress)
+    org_ids = [org_id for org_id, in db.session.query(Organization.id).filter(
+        Organization.id > max_org_id
+    ).order_by(Organization.id)]
+    if not org_ids:
+        return counts
+
+    max_service_id = db.session.query(func.max(Service.id)).scalar() or 0
+    counts['service'] = bulk_insert(Service.__table__, ({
+        'name': f'서비스{max_service_id + i + 1:05d}',
+        'organization_id': org_ids[i % len(org_ids)],
+        'manager_name': f'담당자{rng.randrange(max(len(org_ids) * 3, 1)):04d}'
+    } for i in range(services)), batch_size, progress)
+    service_rows = db.session.query(Service.id, Service.organization_id).filter(
+        Service.id > max_service_id
+    ).order_by(Service.id).all()
+
+    max_request_id = db.session.query(func.max(SendRequest.id)).scalar() or 0
+    if service_rows:
+        service_weights = list(itertools.accumulate(rng.paretovariate(1.2) for _ in service_rows))
+
+        def campaigns():
+            remaining = requests
+            while remaining > 0:
+                count = min(batch_size, remaining)
+                remaining -= count
+                picked = rng.choices(service_rows, cum_weights=service_weights, k=count)
+                send_dates = rng.choices(days, cum_weights=day_weights, k=count)
+                send_times = rng.choices(time_slots, cum_weights=time_weights, k=count)
+                channels = rng.choices(SEED_CHANNELS, weights=SEED_CHANNEL_WEIGHTS, k=count)
+                themes = rng.choices(SEED_CAMPAIGN_THEMES, k=count)
+                for (service_id, org_id), send_date, send_time, channel, theme in zip(
+                        picked, send_dates, send_times, channels, themes):
+                    yield {
+                        'service_id': service_id,
+                        'organization_id': org_id,
+                        'send_date': send_date,
+                        'send_time': send_time,
+                        'channel': channel,
+                        'campaign_name': f'{send_date.month}월 {theme}',
+                        'quantity': max(int(rng.lognormvariate(10.5, 1.0)) // 1000, 1) * 1000
+                    }
+
+        # 빈 테이블이면 보조 인덱스를 지우고 적재한 뒤 한 번에 다시 생성 (행마다 인덱스를 갱신하지 않음)
+        deferred_indexes = list(SendRequest.__table__.indexes) if not max_request_id else []
+        for index in deferred_indexes:
+            index.drop(db.session.connection())
+        counts['send_request'] = bulk_insert(SendRequest.__table__, campaigns(), batch_size, progress)
+        for index in deferred_indexes:
+            index.create(db.session.connection())
+
+    new_org_ids = set(org_ids)
+    usage = {key: total for key, total in aggregate_usage().items() if key[0] in new_org_ids}
+    counts['monthly_quota'] = bulk_insert(MonthlyQuota.__table__, ({
+        'organization_id': org_id,
+        'year_month': year_month,
+        'channel': channel,
+        'total_quota': quota if quota is not None else max(
+            int(usage.get((org_id, year_month, channel), 0) * rng.uniform(1.05, 1.5)) // 10000 * 10000, 100000)
+    } for org_id in org_ids for year_month in year_months for channel in SEED_CHANNELS), batch_size, progress)
+
+    last_request_id = db.session.query(func.max(SendRequest.id)).scalar() or 0
+    if service_rows and change_requests:
+
+        def change_rows():
+            for _ in range(change_requests):
+                service_id, _ = rng.choice(service_rows)
+                request_type = rng.choices(['add', 'modify', 'delete'], weights=[5, 3, 2])[0]
+                send_date = rng.choices(days, cum_weights=day_weights)[0]
+                status = rng.choices(['pending', 'approved', 'rejected'], weights=[2, 6, 2])[0]
+                original_id = None
+                if request_type != 'add' and last_request_id > max_request_id:
+                    original_id = rng.randrange(max_request_id + 1, last_request_id + 1)
+                yield {
+                    'year_month': send_date.strftime('%Y-%m'),
+                    'request_type': request_type,
+                    'service_id': service_id,
+                    'original_request_id': original_id,
+                    'send_date': send_date if request_type != 'delete' else None,
+                    'send_time': f'{rng.randrange(9, 19):02d}:00' if request_type != 'delete' else None,
+                    'channel': rng.choices(SEED_CHANNELS, weights=SEED_CHANNEL_WEIGHTS)[0] if request_type == 'add' else None,
+                    'campaign_name': f'{send_date.month}월 {rng.choice(SEED_CAMPAIGN_THEMES)}' if request_type == 'add' else None,
+                    'quantity': rng.randrange(1, 100) * 1000 if request_type != 'delete' else None,
+                    'reason': '일정 변경',
+                    'requester_name': f'담당자{rng.randrange(max(len(org_ids) * 3, 1)):04d}',
+                    'status': status,
+                    'processed_by': '관리자' if status != 'pending' else None,
+                    'processed_at': kst_now() if status != 'pending' else None
+                }
+
+        counts['change_request'] = bulk_insert(ChangeRequest.__table__, change_rows(), batch_size, progress)
+
+    for org_id in org_ids:
+        for year_month in year_months:
+            bump_data_version(org_id, year_month)
+    return counts
+
+# CLI: flask seed (기준 조직/서비스) / flask seed --orgs N ... (합성 데이터)
+@bp.cli.command('seed', help='기준 조직/서비스 또는 부하 테스트용 합성 데이터 적재')
+@click.option('--reset', is_flag=True, help='모든 테이블을 지우고 다시 생성한 뒤 적재')
+@click.option('--yes', is_flag=True, help='--reset 확인 없이 진행')
+@click.option('--orgs', type=int, default=0, help='생성할 조직 수 (0이면 기준 조직/서비스 적재)')
+@click.option('--services', type=int, help='생성할 서비스 수 (기본: 조직당 10개)')
+@click.option('--requests', type=int, default=0, help='생성할 캠페인(발송 신청) 수')
+@click.option('--change-requests', type=int, default=0, help='생성할 변경 요청 수')
+@click.option('--months', type=int, default=12, help='데이터를 분포시킬 개월 수')
+@click.option('--start', 'start_month', help='시작 연월 YYYY-MM (기본: 이번 달)')
+@click.option('--quota', type=int, help='조직/월/채널별 물량 (기본: 신청 합계의 105~150%)')
+@click.option('--seed', 'rng_seed', type=int, default=0, help='난수 시드')
+@click.option('--batch-size', type=int, default=SEED_BATCH_SIZE, help='INSERT / COPY 한 번에 적재할 행 수')
+def seed_command(reset, yes, orgs, services, requests, change_requests, months, start_month, quota,
+                 rng_seed, batch_size):
+    if start_month:
+        try:
+            month_range(start_month)
+        except ValueError:
+            raise click.BadParameter('YYYY-MM 형식이어야 합니다.', param_hint='--start')
+    if months < 1 or batch_size < 1:
+        raise click.BadParameter('1 이상이어야 합니다.', param_hint='--months / --batch-size')
+    if reset:
+        if not yes:
+            click.confirm(f'{db.engine.url.render_as_string(hide_password=True)}의 모든 데이터를 삭제합니다. 계속할까요?',
+                          abort=True)
+        db.drop_all()
+    run_migrations()
+    disable_statement_timeout()
+
+    started = time.perf_counter()
+    current = []  # 진행 상황을 표시 중인 테이블
+
+    # 대량 적재 진행 상황 (테이블마다 한 줄)
+    def progress(table_name, inserted):
+        if current and current[-1] != table_name:
+            click.echo()
+        current.append(table_name)
+        click.echo(f'\r{table_name}: {inserted:,}건', nl=False)
+
+    if orgs:
+        counts = seed_generated(
+            orgs, orgs * 10 if services is None else services, requests, change_requests, months,
+            start_month, quota, rng_seed, batch_size, progress
+        )
+        if current:
+            click.echo()
+    else:
+        org_count, service_count = seed_reference()
+        counts = {'organization': org_count, 'service': service_count}
+
+    rebuild_monthly_usage()
+    rebuild_monthly_rollup()
+    bump_cache_generation(CACHE_ORGANIZATIONS, CACHE_SERVICES, CACHE_FREEZES)
+    db.session.commit()
+    for table_name, count in counts.items():
+        click.echo(f'{table_name}: {count:,}건 적재')
+    click.echo(f'완료 ({time.perf_counter() - started:.1f}초)')
+
+# 목록 페이지네이션 (keyset)
+PAGE_SIZE_DEFAULT = 200
+PAGE_SIZE_MAX = 1000
+
+class InvalidCursor(ValueError):
+    pass
+
+@bp.app_errorhandler(InvalidCursor)
+def handle_invalid_cursor(error):
+    return jsonify({'success': False, 'message': '잘못된 페이지 정보입니다.'}), 400
+
+def encode_cursor(values):
+    raw = json.dumps([v.isoformat() if isinstance(v, (date, datetime)) else v for v in values])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+def decode_cursor(cursor, types):
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+        if len(values) != len(types):
+            raise ValueError(cursor)
+        return [t.fromisoformat(v) if t in (date, datetime) else t(v) for t, v in zip(types, values)]
+    except (ValueError, TypeError):
+        raise InvalidCursor(cursor)
+
+# keyset 내림차순 페이지 조회 - (rows, next_cursor) 반환
+# keys: 정렬 컬럼 (마지막은 유일한 id), cursor_of: row -> 정렬 컬럼 값
+def paginate(query, keys, cursor_of):
+    limit = max(1, min(request.args.get('limit', PAGE_SIZE_DEFAULT, type=int), PAGE_SIZE_MAX))
+    cursor = request.args.get('cursor')
+
+    if cursor:
+        values = decode_cursor(cursor, [k.type.python_type for k in keys])
+        query = query.filter(tuple_(*keys) < tuple_(*[literal(v, k.type) for k, v in zip(keys, values)]))
+
+    rows = query.order_by(*[k.desc() for k in keys]).limit(limit + 1).all()
+    if len(rows) > limit:
+        return rows[:limit], encode_cursor(cursor_of(rows[limit - 1]))
+    return rows, None
+
+# 목록 응답 - 본문은 기존과 같은 배열, 다음 페이지 커서는 헤더로 전달
+def paginated_response(items, next_cursor):
+    response = jsonify(items)
+    if next_cursor:
+        response.headers['X-Next-Cursor'] = next_cursor
+    return response
+
+# 목록 날짜 필터 (YYYY-MM-DD) - 형식이 잘못되면 400
+class InvalidDateFilter(ValueError):
+    pass
+
+@bp.app_errorhandler(InvalidDateFilter)
+def handle_invalid_date_filter(error):
+    return jsonify({'success': False, 'message': '조회 기간이 올바르지 않습니다. (YYYY-MM-DD)'}), 400
+
+def date_filter_args():
+    try:
+        return tuple(
+            datetime.strptime(request.args[name], '%Y-%m-%d').date() if request.args.get(name) else None
+            for name in ('date_from', 'date_to')
+        )
+    except ValueError:
+        raise InvalidDateFilter(request.args.get('date_from'), request.args.get('date_to'))
+
+# 목록 공통 필터 (date_from, date_to, channel, service_id, status)
+def filter_send_requests(query):
+    date_from, date_to = date_filter_args()
+    channel = request.args.get('channel')
+    service_id = request.args.get('service_id', type=int)
+    status = request.args.get('status')
+
+    if date_from:
+        query = query.filter(SendRequest.send_date >= date_from)
+    if date_to:
+        query = query.filter(SendRequest.send_date <= date_to)
+    if channel:
+        query = query.filter(SendRequest.channel == channel)
+    if service_id:
+        query = query.filter(SendRequest.service_id == service_id)
+    if status:
+        query = query.filter(SendRequest.status == status)
+    return query
+
+SEND_REQUEST_LIST_KEYS = (SendRequest.send_date, SendRequest.created_at, SendRequest.id)
+
+# 참조 데이터(조직, 서비스, 프리징) 프로세스 내 캐시
+# - 변경 API는 같은 트랜잭션에서 cache_generation을 올림 (bump_cache_generation)
+# - 요청마다 한 번 세대를 조회해 로컬 캐시와 다르면 다시 로드하므로 다른 워커의 변경도 즉시 반영됨
+CACHE_ORGANIZATIONS = 'organizations'
+CACHE_SERVICES = 'services'
+CACHE_FREEZES = 'freezes'
+
+class ReferenceCache:
+    def __init__(self):
+        self._entries = {}  # name -> (generation, value)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, name, loader):
+        # 세대를 먼저 확인한 뒤 로드해야 오래된 데이터가 새 세대로 저장되지 않음
+        generation = cache_generations().get(name, 0)
+        entry = self._entries.get(name)
+        if entry and entry[0] == generation:
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        value = loader()
+        self._entries[name] = (generation, value)
+        return value
+
+    def clear(self):
+        self._entries.clear()
+
+reference_cache = ReferenceCache()
+
+# 현재 캐시 세대 (요청당 한 번만 조회)
+def cache_generations():
+    if 'cache_generations' not in g:
+        g.cache_generations = dict(db.session.query(CacheGeneration.name, CacheGeneration.generation).all())
+    return g.cache_generations
+
+# 캐시 무효화 - 호출한 쪽의 트랜잭션에서 함께 커밋
+# (테이블을 다시 만들어도 이전 세대와 겹치지 않도록 증가값 대신 난수 사용)
+def bump_cache_generation(*names):
+    for name in names:
+        stmt = dialect_insert(CacheGeneration).values(name=name, generation=random.getrandbits(31))
+        db.session.execute(stmt.on_conflict_do_update(
+            index_elements=['name'],
+            set_={'generation': stmt.excluded.generation}
+        ))
+    # 이 요청 안에서는 다시 세대를 조회하도록
+    g.pop('cache_generations', None)
+
+def load_organizations():
+    return [{
+        'id': o.id,
+        'name': o.name,
+        'created_at': o.created_at
+    } for o in Organization.query.order_by(Organization.id).all()]
+
+def load_services():
+    rows = db.session.query(Service, Organization.name).join(
+        Organization, Service.organization_id == Organization.id
+    ).order_by(Service.id).all()
+    services = [{
+        'id': s.id,
+        'name': s.name,
+        'organization_id': s.organization_id,
+        'organization_name': org_name,
+        'manager_name': s.manager_name,
+        'created_at': s.created_at
+    } for s, org_name in rows]
+    by_org = {}
+    for s in services:
+        by_org.setdefault(s['organization_id'], []).append(s)
+    return {'all': services, 'by_id': {s['id']: s for s in services}, 'by_org': by_org}
+
+def load_freezes():
+    return {f.year_month: {
+        'is_frozen': bool(f.is_frozen),
+        'frozen_at': f.frozen_at,
+        'frozen_by': f.frozen_by
+    } for f in MonthlyFreeze.query.all()}
+
+def cached_organizations():
+    return reference_cache.get(CACHE_ORGANIZATIONS, load_organizations)
+
+def cached_services():
+    return reference_cache.get(CACHE_SERVICES, load_services)
+
+def cached_service(service_id):
+    return cached_services()['by_id'].get(service_id)
+
+def cached_freezes():
+    return reference_cache.get(CACHE_FREEZES, load_freezes)
+
+def is_frozen(year_month):
+    freeze = cached_freezes().get(year_month)
+    return bool(freeze and freeze['is_frozen'])
+
 # 관리자 로그인 페이지
-@app.route('/')
-@app.route('/admin/login')
+@bp.route('/')
+@bp.route('/admin/login')
 def admin_login():
     return render_template('admin_login.html')
 
 # 관리자 로그인 처리
-@app.route('/api/admin/login', methods=['POST'])
+@bp.route('/api/admin/login', methods=['POST'])
 def admin_login_process():
     data = request.json
     password = data.get('password')
@@ -126,39 +1201,35 @@ def admin_login_process():
         return jsonify({'success': False, 'message': '비밀번호가 올바르지 않습니다.'}), 401
 
 # 관리자 로그아웃
-@app.route('/admin/logout')
+@bp.route('/admin/logout')
 def admin_logout():
     session.pop('admin_logged_in', None)
-    return redirect(url_for('admin_login'))
+    return redirect(url_for('.admin_login'))
 
 # 관리자 화면 - 조직별 물량 설정
-@app.route('/admin')
+@bp.route('/admin')
 def admin_page():
     if not session.get('admin_logged_in'):
-        return redirect(url_for('admin_login'))
-    organizations = Organization.query.all()
-    return render_template('admin.html', organizations=organizations)
+        return redirect(url_for('.admin_login'))
+    return render_template('admin.html', organizations=cached_organizations())
 
 # 서비스 담당자 화면 - 물량 신청
-@app.route('/request')
+@bp.route('/request')
 def request_page():
-    organizations = Organization.query.all()
-    return render_template('request.html', organizations=organizations)
+    return render_template('request.html', organizations=cached_organizations())
 
 # 달력 화면 - 물량 현황
-@app.route('/calendar')
+@bp.route('/calendar')
 def calendar_page():
-    organizations = Organization.query.all()
-    return render_template('calendar.html', organizations=organizations)
+    return render_template('calendar.html', organizations=cached_organizations())
 
 # 변경 요청 화면
-@app.route('/change-requests')
+@bp.route('/change-requests')
 def change_requests_page():
-    organizations = Organization.query.all()
-    return render_template('change_requests.html', organizations=organizations)
+    return render_template('change_requests.html', organizations=cached_organizations())
 
 # API: 조직별 월간 물량 설정
-@app.route('/api/quota', methods=['POST'])
+@bp.route('/api/quota', methods=['POST'])
 def set_quota():
     data = request.json
     organization_id = data.get('organization_id')
@@ -183,11 +1254,13 @@ def set_quota():
         )
         db.session.add(quota)
 
+    bump_data_version(organization_id, year_month)
+    record_change(organization_id, year_month, 'quota')
     db.session.commit()
     return jsonify({'success': True, 'message': '물량이 설정되었습니다.'})
 
 # API: 조직별 월간 물량 조회
-@app.route('/api/quota/<int:org_id>/<year_month>')
+@bp.route('/api/quota/<int:org_id>/<year_month>')
 def get_quota(org_id, year_month):
     quota = MonthlyQuota.query.filter_by(
         organization_id=org_id,
@@ -200,8 +1273,269 @@ def get_quota(org_id, year_month):
         })
     return jsonify({'total_quota': 0})
 
+QUOTA_SUMMARY_MAX_PAIRS = 200
+
+# (조직, 월, 채널)별 총 물량과 신청 물량을 집계하는 서브쿼리
+# 물량과 사용량 원장을 UNION ALL 후 한 번의 GROUP BY로 집계 (물량이 삭제된 채널의 사용량도 포함)
+# condition: 모델(MonthlyQuota / MonthlyUsage)을 받아 조건식을 돌려주는 함수
+def quota_usage_subquery(condition):
+    quota_rows = select(
+        MonthlyQuota.organization_id.label('organization_id'),
+        MonthlyQuota.year_month.label('year_month'),
+        MonthlyQuota.channel.label('channel'),
+        MonthlyQuota.total_quota.label('total_quota'),
+        literal(0).label('requested')
+    ).where(condition(MonthlyQuota))
+    usage_rows = select(
+        MonthlyUsage.organization_id,
+        MonthlyUsage.year_month,
+        MonthlyUsage.channel,
+        literal(0),
+        MonthlyUsage.requested
+    ).where(condition(MonthlyUsage))
+    combined = quota_rows.union_all(usage_rows).subquery()
+
+    return select(
+        combined.c.organization_id,
+        combined.c.year_month,
+        combined.c.channel,
+        func.sum(combined.c.total_quota).label('total_quota'),
+        func.sum(combined.c.requested).label('requested')
+    ).group_by(
+        combined.c.organization_id,
+        combined.c.year_month,
+        combined.c.channel
+    ).subquery()
+
+# 사용률(%) - 물량이 없으면 None
+def percent_used(total_quota, requested):
+    if not total_quota:
+        return None
+    return round(requested * 100 / total_quota, 1)
+
+# (조직, 월) 목록 -> {(조직, 월): {채널: (총 물량, 신청 물량)}}
+def quota_summary(pairs):
+    summary_query = quota_usage_subquery(
+        lambda model: tuple_(model.organization_id, model.year_month).in_(pairs)
+    )
+    rows = db.session.execute(select(summary_query)).all()
+
+    summary = {pair: {} for pair in pairs}
+    for organization_id, year_month, channel, total_quota, requested in rows:
+        summary[(organization_id, year_month)][channel] = (int(total_quota or 0), int(requested or 0))
+    return summary
+
+# API: 물량 요약 조회 (채널별 총 물량 / 신청 물량 / 잔여 물량)
+# ?org_id=1&year_month=2026-01 또는 ?pairs=1:2026-01,2:2026-02
+@bp.route('/api/quota/summary')
+def get_quota_summary():
+    if request.args.get('pairs'):
+        raw_pairs = [p.split(':', 1) for p in request.args['pairs'].split(',') if p]
+    else:
+        raw_pairs = [(request.args.get('org_id', ''), request.args.get('year_month', ''))]
+
+    pairs = []
+    try:
+        for org_id, year_month in raw_pairs:
+            if not is_year_month(year_month):
+                raise ValueError(year_month)
+            pair = (int(org_id), year_month)
+            if pair not in pairs:
+                pairs.append(pair)
+    except ValueError:
+        return jsonify({'success': False, 'message': '조직 ID와 연월(YYYY-MM)을 올바르게 입력해주세요.'}), 400
+    if len(pairs) > QUOTA_SUMMARY_MAX_PAIRS:
+        return jsonify({'success': False, 'message': f'한 번에 최대 {QUOTA_SUMMARY_MAX_PAIRS}개까지 조회할 수 있습니다.'}), 400
+
+    summary = quota_summary(pairs)
+
+    result = []
+    for organization_id, year_month in pairs:
+        channels = {
+            channel: {
+                'total_quota': total_quota,
+                'requested': requested,
+                'remaining': total_quota - requested
+            } for channel, (total_quota, requested) in sorted(summary[(organization_id, year_month)].items())
+        }
+        total_quota = sum(c['total_quota'] for c in channels.values())
+        total_requested = sum(c['requested'] for c in channels.values())
+        result.append({
+            'organization_id': organization_id,
+            'year_month': year_month,
+            'channels': channels,
+            'total_quota': total_quota,
+            'total_requested': total_requested,
+            'remaining': total_quota - total_requested
+        })
+
+    return jsonify(result)
+
+# API: 월간 조직 × 채널 물량 사용률
+@bp.route('/api/utilization/<year_month>')
+def get_utilization(year_month):
+    if not session.get('admin_logged_in'):
+        return jsonify({'success': False, 'message': '권한이 없습니다.'}), 403
+
+    try:
+        datetime.strptime(year_month, '%Y-%m')
+    except ValueError:
+        return jsonify({'success': False, 'message': '연월(YYYY-MM)을 올바르게 입력해주세요.'}), 400
+
+    # 전체 조직 LEFT JOIN 채널별 집계 - 한 번의 쿼리
+    summary_query = quota_usage_subquery(lambda model: model.year_month == year_month)
+    rows = db.session.query(
+        Organization.id,
+        Organization.name,
+        summary_query.c.channel,
+        summary_query.c.total_quota,
+        summary_query.c.requested
+    ).outerjoin(
+        summary_query, summary_query.c.organization_id == Organization.id
+    ).order_by(Organization.name, Organization.id).all()
+
+    channels = list(CHANNEL_NAMES)
+    organizations = {}
+    for org_id, org_name, channel, total_quota, requested in rows:
+        org = organizations.setdefault(org_id, {
+            'organization_id': org_id,
+            'organization_name': org_name,
+            'channels': {}
+        })
+        if channel is None:
+            continue
+        if channel not in channels:
+            channels.append(channel)
+        org['channels'][channel] = (int(total_quota or 0), int(requested or 0))
+
+    def cell(total_quota, requested):
+        return {
+            'total_quota': total_quota,
+            'requested': requested,
+            'remaining': total_quota - requested,
+            'percent_used': percent_used(total_quota, requested)
+        }
+
+    channel_totals = {channel: [0, 0] for channel in channels}
+    result = []
+    for org in organizations.values():
+        values = org['channels']
+        org['channels'] = {}
+        for channel in channels:
+            total_quota, requested = values.get(channel, (0, 0))
+            org['channels'][channel] = cell(total_quota, requested)
+            channel_totals[channel][0] += total_quota
+            channel_totals[channel][1] += requested
+        org.update(cell(
+            sum(c['total_quota'] for c in org['channels'].values()),
+            sum(c['requested'] for c in org['channels'].values())
+        ))
+        result.append(org)
+
+    totals = {'channels': {channel: cell(*channel_totals[channel]) for channel in channels}}
+    totals.update(cell(
+        sum(t[0] for t in channel_totals.values()),
+        sum(t[1] for t in channel_totals.values())
+    ))
+
+    return jsonify({
+        'year_month': year_month,
+        'channels': channels,
+        'organizations': result,
+        'totals': totals
+    })
+
+USAGE_MAX_MONTHS = 120
+USAGE_GROUP_COLUMNS = {
+    'org': MonthlyRollup.organization_id,
+    'service': MonthlyRollup.service_id,
+    'channel': MonthlyRollup.channel,
+}
+
+# 'YYYY-MM' 범위의 연월 목록
+def month_list(from_month, to_month):
+    months = []
+    current, _ = month_range(from_month)
+    last, _ = month_range(to_month)
+    while current <= last:
+        months.append(current.strftime('%Y-%m'))
+        _, current = month_range(months[-1])
+    return months
+
+# API: 기간별 사용량 추이 (서비스별 월간 롤업 기반)
+# ?from=YYYY-MM&to=YYYY-MM&group_by=org|service|channel (선택: org_id, channel)
+@bp.route('/api/usage')
+def get_usage_trend():
+    from_month = request.args.get('from', '')
+    to_month = request.args.get('to', '')
+    group_by = request.args.get('group_by', 'org')
+
+    if group_by not in USAGE_GROUP_COLUMNS:
+        return jsonify({'success': False, 'message': 'group_by는 org, service, channel 중 하나여야 합니다.'}), 400
+    try:
+        datetime.strptime(from_month, '%Y-%m')
+        datetime.strptime(to_month, '%Y-%m')
+    except ValueError:
+        return jsonify({'success': False, 'message': '기간(from, to)을 YYYY-MM 형식으로 입력해주세요.'}), 400
+    if from_month > to_month:
+        return jsonify({'success': False, 'message': '시작 월이 종료 월보다 늦을 수 없습니다.'}), 400
+
+    months = month_list(from_month, to_month)
+    if len(months) > USAGE_MAX_MONTHS:
+        return jsonify({'success': False, 'message': f'최대 {USAGE_MAX_MONTHS}개월까지 조회할 수 있습니다.'}), 400
+
+    group_column = USAGE_GROUP_COLUMNS[group_by]
+    query = db.session.query(
+        group_column,
+        MonthlyRollup.year_month,
+        func.sum(MonthlyRollup.requested),
+        func.sum(MonthlyRollup.request_count)
+    ).filter(
+        MonthlyRollup.year_month >= from_month,
+        MonthlyRollup.year_month <= to_month
+    )
+    if request.args.get('org_id', type=int):
+        query = query.filter(MonthlyRollup.organization_id == request.args.get('org_id', type=int))
+    if request.args.get('channel'):
+        query = query.filter(MonthlyRollup.channel == request.args['channel'])
+    rows = query.group_by(group_column, MonthlyRollup.year_month).all()
+
+    if group_by == 'org':
+        names = {o['id']: o['name'] for o in cached_organizations()}
+    elif group_by == 'service':
+        names = {s['id']: f"{s['organization_name']} - {s['name']}" for s in cached_services()['all']}
+    else:
+        names = CHANNEL_NAMES
+
+    month_index = {ym: i for i, ym in enumerate(months)}
+    groups = {}
+    for key, year_month, requested, request_count in rows:
+        group = groups.setdefault(key, {
+            'key': key,
+            'name': names.get(key, key),
+            'requested': [0] * len(months),
+            'request_count': [0] * len(months)
+        })
+        group['requested'][month_index[year_month]] = int(requested or 0)
+        group['request_count'][month_index[year_month]] = int(request_count or 0)
+
+    result = []
+    for group in groups.values():
+        group['total_requested'] = sum(group['requested'])
+        group['total_request_count'] = sum(group['request_count'])
+        result.append(group)
+    result.sort(key=lambda group: -group['total_requested'])
+
+    return jsonify({
+        'from': from_month,
+        'to': to_month,
+        'group_by': group_by,
+        'months': months,
+        'groups': result
+    })
+
 # API: 전체 물량 목록 조회
-@app.route('/api/quotas')
+@bp.route('/api/quotas')
 def get_all_quotas():
     if not session.get('admin_logged_in'):
         return jsonify({'success': False, 'message': '권한이 없습니다.'}), 403
@@ -233,7 +1567,7 @@ def get_all_quotas():
     } for quota, org_name in quotas])
 
 # API: 물량 수정
-@app.route('/api/quota/<int:quota_id>', methods=['PUT'])
+@bp.route('/api/quota/<int:quota_id>', methods=['PUT'])
 def update_quota(quota_id):
     if not session.get('admin_logged_in'):
         return jsonify({'success': False, 'message': '권한이 없습니다.'}), 403
@@ -246,12 +1580,14 @@ def update_quota(quota_id):
         return jsonify({'success': False, 'message': '물량을 찾을 수 없습니다.'}), 404
 
     quota.total_quota = new_quota
+    bump_data_version(quota.organization_id, quota.year_month)
+    record_change(quota.organization_id, quota.year_month, 'quota')
     db.session.commit()
 
     return jsonify({'success': True, 'message': '물량이 수정되었습니다.'})
 
 # API: 물량 삭제
-@app.route('/api/quota/<int:quota_id>', methods=['DELETE'])
+@bp.route('/api/quota/<int:quota_id>', methods=['DELETE'])
 def delete_quota(quota_id):
     if not session.get('admin_logged_in'):
         return jsonify({'success': False, 'message': '권한이 없습니다.'}), 403
@@ -261,62 +1597,280 @@ def delete_quota(quota_id):
         return jsonify({'success': False, 'message': '물량을 찾을 수 없습니다.'}), 404
 
     db.session.delete(quota)
+    bump_data_version(quota.organization_id, quota.year_month)
+    record_change(quota.organization_id, quota.year_month, 'quota')
     db.session.commit()
 
     return jsonify({'success': True, 'message': '물량이 삭제되었습니다.'})
 
+QUOTA_COPY_MAX_MONTHS = 24
+
 # API: 특정 월의 전체 물량 복사
-@app.route('/api/quotas/copy', methods=['POST'])
+# - target_year_month 또는 target_from ~ target_to (여러 달)
+# - scale: 전체 배율, channel_scale: {채널: 배율} (채널별로 우선 적용)
+# - 대상 월에 이미 있는 (조직, 채널)은 건너뜀
+@bp.route('/api/quotas/copy', methods=['POST'])
 def copy_quotas():
     if not session.get('admin_logged_in'):
         return jsonify({'success': False, 'message': '권한이 없습니다.'}), 403
 
     data = request.json
     source_year_month = data.get('source_year_month')
-    target_year_month = data.get('target_year_month')
+    target_from = data.get('target_from') or data.get('target_year_month')
+    target_to = data.get('target_to') or target_from
 
-    if not source_year_month or not target_year_month:
+    if not source_year_month or not target_from:
         return jsonify({'success': False, 'message': '원본 월과 대상 월을 선택해주세요.'}), 400
 
-    if source_year_month == target_year_month:
-        return jsonify({'success': False, 'message': '원본 월과 대상 월이 같을 수 없습니다.'}), 400
-
-    # 원본 월의 물량 조회
-    source_quotas = MonthlyQuota.query.filter_by(year_month=source_year_month).all()
+    try:
+        datetime.strptime(source_year_month, '%Y-%m')
+        datetime.strptime(target_from, '%Y-%m')
+        datetime.strptime(target_to, '%Y-%m')
+    except ValueError:
+        return jsonify({'success': False, 'message': '연월(YYYY-MM)을 올바르게 입력해주세요.'}), 400
 
-    if not source_quotas:
-        return jsonify({'success': False, 'message': '원본 월에 설정된 물량이 없습니다.'}), 404
+    if target_from > target_to:
+        return jsonify({'success': False, 'message': '대상 시작 월이 종료 월보다 늦을 수 없습니다.'}), 400
 
-    # 대상 월에 이미 존재하는 물량 확인
-    existing_quotas = MonthlyQuota.query.filter_by(year_month=target_year_month).all()
-    existing_org_ids = {q.organization_id for q in existing_quotas}
+    target_months = [ym for ym in month_list(target_from, target_to) if ym != source_year_month]
+    if not target_months:
+        return jsonify({'success': False, 'message': '원본 월과 대상 월이 같을 수 없습니다.'}), 400
+    if len(target_months) > QUOTA_COPY_MAX_MONTHS:
+        return jsonify({'success': False, 'message': f'최대 {QUOTA_COPY_MAX_MONTHS}개월까지 복사할 수 있습니다.'}), 400
+
+    scale = data.get('scale', 1)
+    channel_scale = data.get('channel_scale') or {}
+    if not isinstance(channel_scale, dict) or not all(
+        isinstance(f, (int, float)) and not isinstance(f, bool) and f >= 0
+        for f in [scale] + list(channel_scale.values())
+    ):
+        return jsonify({'success': False, 'message': '배율은 0 이상의 숫자여야 합니다.'}), 400
+
+    # 원본 월의 물량 (조직, 채널)
+    source_rows = db.session.query(MonthlyQuota.organization_id).filter(
+        MonthlyQuota.year_month == source_year_month
+    ).all()
 
-    copied_count = 0
-    skipped_count = 0
+    if not source_rows:
+        return jsonify({'success': False, 'message': '원본 월에 설정된 물량이 없습니다.'}), 404
 
-    for source_quota in source_quotas:
-        if source_quota.organization_id in existing_org_ids:
-            skipped_count += 1
-            continue
+    # 대상 월 목록 x 원본 물량 -> INSERT ... SELECT ... ON CONFLICT DO NOTHING
+    targets = union_all(*[select(literal(ym).label('year_month')) for ym in target_months]).subquery('targets')
 
-        new_quota = MonthlyQuota(
-            organization_id=source_quota.organization_id,
-            year_month=target_year_month,
-            total_quota=source_quota.total_quota
+    factor = literal(scale)
+    if channel_scale:
+        factor = case(
+            {channel: literal(value) for channel, value in channel_scale.items()},
+            value=MonthlyQuota.channel,
+            else_=literal(scale)
         )
-        db.session.add(new_quota)
-        copied_count += 1
 
+    copy_query = select(
+        MonthlyQuota.organization_id,
+        targets.c.year_month,
+        MonthlyQuota.channel,
+        cast(func.round(MonthlyQuota.total_quota * factor), db.Integer),
+        literal(kst_now())
+    ).select_from(MonthlyQuota).join(targets, true()).where(
+        MonthlyQuota.year_month == source_year_month
+    )
+    result = db.session.execute(dialect_insert(MonthlyQuota).from_select(
+        ['organization_id', 'year_month', 'channel', 'total_quota', 'created_at'],
+        copy_query
+    ).on_conflict_do_nothing(index_elements=['organization_id', 'year_month', 'channel']))
+
+    copied_count = result.rowcount
+    skipped_count = len(source_rows) * len(target_months) - copied_count
+
+    if copied_count:
+        for org_id in {org_id for org_id, in source_rows}:
+            for ym in target_months:
+                bump_data_version(org_id, ym)
+                record_change(org_id, ym, 'quota')
     db.session.commit()
 
-    message = f'{copied_count}개 조직의 물량이 복사되었습니다.'
+    message = f'{len(target_months)}개월에 {copied_count}건의 물량이 복사되었습니다.'
     if skipped_count > 0:
-        message += f' ({skipped_count}개 조직은 이미 존재하여 건너뜀)'
+        message += f' ({skipped_count}건은 이미 존재하여 건너뜀)'
+
+    return jsonify({
+        'success': True,
+        'message': message,
+        'copied_count': copied_count,
+        'skipped_count': skipped_count,
+        'target_months': target_months
+    })
+
+QUOTA_BULK_MAX_ROWS = 5000
+
+# CSV 헤더 (영문 / 한글 모두 허용)
+QUOTA_CSV_COLUMNS = {
+    'organization_id': 'organization',
+    'organization': 'organization',
+    '조직': 'organization',
+    '조직명': 'organization',
+    'year_month': 'year_month',
+    '연월': 'year_month',
+    'channel': 'channel',
+    '채널': 'channel',
+    'total_quota': 'total_quota',
+    '총 물량': 'total_quota',
+    '물량': 'total_quota',
+}
+
+def parse_quota_csv(text):
+    reader = csv.reader(io.StringIO(text))
+    header = [QUOTA_CSV_COLUMNS.get(h.strip()) for h in next(reader, [])]
+    return [
+        {key: value.strip() for key, value in zip(header, values) if key}
+        for values in reader if any(v.strip() for v in values)
+    ]
+
+# 물량 일괄 등록 행 검증 -> ((조직, 월, 채널), 총 물량) 또는 오류 메시지
+def validate_quota_row(row, org_ids, org_by_name, channel_by_name):
+    if not isinstance(row, dict):
+        return None, '잘못된 항목입니다.'
+
+    organization = row.get('organization', row.get('organization_id'))
+    if isinstance(organization, int) or (isinstance(organization, str) and organization.isdigit()):
+        organization_id = int(organization) if int(organization) in org_ids else None
+    else:
+        organization_id = org_by_name.get(organization) if isinstance(organization, str) else None
+    if organization_id is None:
+        return None, f'조직을 찾을 수 없습니다: {organization}'
+
+    year_month = str(row.get('year_month') or '')
+    if not is_year_month(year_month):
+        return None, f'연월이 올바르지 않습니다: {year_month}'
+
+    channel = channel_by_name.get(row.get('channel')) if isinstance(row.get('channel'), str) else None
+    if not channel:
+        return None, f'채널이 올바르지 않습니다: {row.get("channel")}'
+
+    total_quota = row.get('total_quota')
+    if isinstance(total_quota, str):
+        total_quota = total_quota.replace(',', '')
+        total_quota = int(total_quota) if total_quota.isdigit() else None
+    if not isinstance(total_quota, int) or isinstance(total_quota, bool) or total_quota < 0:
+        return None, f'물량이 올바르지 않습니다: {row.get("total_quota")}'
+
+    return ((organization_id, year_month, channel), total_quota), None
+
+# API: 물량 일괄 등록/수정 (JSON 또는 CSV)
+# - JSON: {"quotas": [{"organization_id" 또는 "organization", "year_month", "channel", "total_quota"}], "dry_run": false}
+# - CSV: multipart 'file' 또는 text/csv 본문 (헤더: organization, year_month, channel, total_quota)
+# - 하나라도 오류가 있으면 전체를 적용하지 않음, dry_run이면 변경 내역만 반환
+@bp.route('/api/quotas/bulk', methods=['POST'])
+def bulk_upsert_quotas():
+    if not session.get('admin_logged_in'):
+        return jsonify({'success': False, 'message': '권한이 없습니다.'}), 403
+
+    try:
+        if 'file' in request.files:
+            rows = parse_quota_csv(request.files['file'].read().decode('utf-8-sig'))
+            dry_run = request.form.get('dry_run') in ('1', 'true')
+        elif request.mimetype == 'text/csv':
+            rows = parse_quota_csv(request.get_data(as_text=True).lstrip('\ufeff'))
+            dry_run = request.args.get('dry_run') in ('1', 'true')
+        else:
+            data = request.get_json(silent=True) or {}
+            rows = data.get('quotas') or []
+            dry_run = bool(data.get('dry_run'))
+    except UnicodeDecodeError:
+        return jsonify({'success': False, 'message': 'CSV 파일은 UTF-8 인코딩이어야 합니다.'}), 400
+
+    if not isinstance(rows, list):
+        return jsonify({'success': False, 'message': '물량 목록(quotas)은 배열이어야 합니다.'}), 400
+
+    if not rows:
+        return jsonify({'success': False, 'message': '등록할 물량이 없습니다.'}), 400
+    if len(rows) > QUOTA_BULK_MAX_ROWS:
+        return jsonify({'success': False, 'message': f'한 번에 최대 {QUOTA_BULK_MAX_ROWS:,}건까지 등록할 수 있습니다.'}), 400
+
+    organizations = cached_organizations()
+    org_ids = {o['id'] for o in organizations}
+    org_by_name = {o['name']: o['id'] for o in organizations}
+    channel_by_name = {code: code for code in CHANNEL_NAMES}
+    channel_by_name.update({name: code for code, name in CHANNEL_NAMES.items()})
+
+    results = []
+    values = {}
+    has_error = False
+    for index, row in enumerate(rows):
+        parsed, error = validate_quota_row(row, org_ids, org_by_name, channel_by_name)
+        if parsed and parsed[0] in values:
+            parsed, error = None, '같은 조직/연월/채널이 중복되었습니다.'
+        if error:
+            has_error = True
+            results.append({'index': index, 'status': 'error', 'message': error})
+            continue
+        key, total_quota = parsed
+        values[key] = total_quota
+        results.append({
+            'index': index,
+            'organization_id': key[0],
+            'year_month': key[1],
+            'channel': key[2],
+            'after': total_quota
+        })
+
+    if has_error:
+        return jsonify({
+            'success': False,
+            'message': '오류가 있는 행이 있어 적용하지 않았습니다.',
+            'results': results
+        }), 400
 
-    return jsonify({'success': True, 'message': message, 'copied_count': copied_count, 'skipped_count': skipped_count})
+    # 기존 값 한 번에 조회 후 행별 변경 내역 계산
+    existing = dict(
+        ((org_id, ym, channel), total)
+        for org_id, ym, channel, total in db.session.query(
+            MonthlyQuota.organization_id,
+            MonthlyQuota.year_month,
+            MonthlyQuota.channel,
+            MonthlyQuota.total_quota
+        ).filter(
+            tuple_(MonthlyQuota.organization_id, MonthlyQuota.year_month, MonthlyQuota.channel).in_(list(values))
+        ).all()
+    )
+    counts = {'created': 0, 'updated': 0, 'unchanged': 0}
+    for result in results:
+        before = existing.get((result['organization_id'], result['year_month'], result['channel']))
+        result['before'] = before
+        if before is None:
+            result['status'] = 'created'
+        elif before != result['after']:
+            result['status'] = 'updated'
+        else:
+            result['status'] = 'unchanged'
+        counts[result['status']] += 1
+
+    changed = {key: total for key, total in values.items() if existing.get(key) != total}
+    if not dry_run and changed:
+        now = kst_now()
+        stmt = dialect_insert(MonthlyQuota)
+        db.session.execute(stmt.on_conflict_do_update(
+            index_elements=['organization_id', 'year_month', 'channel'],
+            set_={'total_quota': stmt.excluded.total_quota}
+        ), [{
+            'organization_id': org_id,
+            'year_month': ym,
+            'channel': channel,
+            'total_quota': total,
+            'created_at': now
+        } for (org_id, ym, channel), total in changed.items()])
+        for org_id, ym in {(org_id, ym) for org_id, ym, _ in changed}:
+            bump_data_version(org_id, ym)
+            record_change(org_id, ym, 'quota')
+        db.session.commit()
+
+    message = f"생성 {counts['created']}건, 수정 {counts['updated']}건, 변경 없음 {counts['unchanged']}건"
+    if dry_run:
+        message = '[미리보기] ' + message
+    return jsonify({'success': True, 'message': message, 'dry_run': dry_run, **counts, 'results': results})
 
 # API: 조직 추가
-@app.route('/api/organization', methods=['POST'])
+@bp.route('/api/organization', methods=['POST'])
 def add_organization():
     if not session.get('admin_logged_in'):
         return jsonify({'success': False, 'message': '권한이 없습니다.'}), 403
@@ -334,12 +1888,13 @@ def add_organization():
 
     org = Organization(name=name)
     db.session.add(org)
+    bump_cache_generation(CACHE_ORGANIZATIONS)
     db.session.commit()
 
     return jsonify({'success': True, 'message': '조직이 추가되었습니다.', 'id': org.id})
 
 # API: 조직 수정
-@app.route('/api/organization/<int:org_id>', methods=['PUT'])
+@bp.route('/api/organization/<int:org_id>', methods=['PUT'])
 def update_organization(org_id):
     if not session.get('admin_logged_in'):
         return jsonify({'success': False, 'message': '권한이 없습니다.'}), 403
@@ -360,12 +1915,13 @@ def update_organization(org_id):
         return jsonify({'success': False, 'message': '이미 존재하는 조직명입니다.'}), 400
 
     org.name = name
+    bump_cache_generation(CACHE_ORGANIZATIONS, CACHE_SERVICES)
     db.session.commit()
 
     return jsonify({'success': True, 'message': '조직이 수정되었습니다.'})
 
 # API: 조직 삭제
-@app.route('/api/organization/<int:org_id>', methods=['DELETE'])
+@bp.route('/api/organization/<int:org_id>', methods=['DELETE'])
 def delete_organization(org_id):
     if not session.get('admin_logged_in'):
         return jsonify({'success': False, 'message': '권한이 없습니다.'}), 403
@@ -385,12 +1941,13 @@ def delete_organization(org_id):
         return jsonify({'success': False, 'message': f'이 조직에 {quotas}개의 물량 정보가 있습니다. 먼저 물량 정보를 삭제해주세요.'}), 400
 
     db.session.delete(org)
+    bump_cache_generation(CACHE_ORGANIZATIONS)
     db.session.commit()
 
     return jsonify({'success': True, 'message': '조직이 삭제되었습니다.'})
 
 # API: 서비스 추가
-@app.route('/api/service', methods=['POST'])
+@bp.route('/api/service', methods=['POST'])
 def add_service():
     if not session.get('admin_logged_in'):
         return jsonify({'success': False, 'message': '권한이 없습니다.'}), 403
@@ -405,12 +1962,13 @@ def add_service():
 
     service = Service(name=name, organization_id=organization_id, manager_name=manager_name)
     db.session.add(service)
+    bump_cache_generation(CACHE_SERVICES)
     db.session.commit()
 
     return jsonify({'success': True, 'message': '서비스가 추가되었습니다.', 'id': service.id})
 
 # API: 서비스 수정
-@app.route('/api/service/<int:service_id>', methods=['PUT'])
+@bp.route('/api/service/<int:service_id>', methods=['PUT'])
 def update_service(service_id):
     if not session.get('admin_logged_in'):
         return jsonify({'success': False, 'message': '권한이 없습니다.'}), 403
@@ -429,15 +1987,39 @@ def update_service(service_id):
 
     service.name = name
     # organization_id가 제공되면 업데이트, 없으면 기존 값 유지
-    if organization_id:
+    if organization_id and organization_id != service.organization_id:
+        # 월간 사용량 원장을 새 조직으로 이동
+        year_month = sql_year_month(SendRequest.send_date)
+        moved_usage = db.session.query(
+            year_month,
+            SendRequest.channel,
+            func.sum(SendRequest.quantity)
+        ).filter(SendRequest.service_id == service_id
+        ).group_by(year_month, SendRequest.channel).all()
+        deltas = {}
+        for ym, channel, total in moved_usage:
+            deltas[(service.organization_id, ym, channel)] = -total
+            deltas[(organization_id, ym, channel)] = total
+            record_change(service.organization_id, ym, 'service')
+            record_change(organization_id, ym, 'service')
+        adjust_usages(deltas)
+
         service.organization_id = organization_id
+        # 비정규화된 SendRequest.organization_id / 롤업 동기화
+        SendRequest.query.filter_by(service_id=service_id).update(
+            {'organization_id': organization_id}, synchronize_session=False
+        )
+        MonthlyRollup.query.filter_by(service_id=service_id).update(
+            {'organization_id': organization_id}, synchronize_session=False
+        )
     service.manager_name = manager_name
+    bump_cache_generation(CACHE_SERVICES)
     db.session.commit()
 
     return jsonify({'success': True, 'message': '서비스가 수정되었습니다.'})
 
 # API: 서비스 삭제
-@app.route('/api/service/<int:service_id>', methods=['DELETE'])
+@bp.route('/api/service/<int:service_id>', methods=['DELETE'])
 def delete_service(service_id):
     if not session.get('admin_logged_in'):
         return jsonify({'success': False, 'message': '권한이 없습니다.'}), 403
@@ -451,63 +2033,76 @@ def delete_service(service_id):
     if requests > 0:
         return jsonify({'success': False, 'message': f'이 서비스에 {requests}개의 캠페인 신청이 있습니다. 먼저 캠페인을 삭제해주세요.'}), 400
 
+    MonthlyRollup.query.filter_by(service_id=service_id).delete(synchronize_session=False)
     db.session.delete(service)
+    bump_cache_generation(CACHE_SERVICES)
     db.session.commit()
 
     return jsonify({'success': True, 'message': '서비스가 삭제되었습니다.'})
 
 # API: 조직의 서비스 목록 조회
-@app.route('/api/services/<int:org_id>')
+@bp.route('/api/services/<int:org_id>')
 def get_services(org_id):
-    services = Service.query.filter_by(organization_id=org_id).all()
+    services = cached_services()['by_org'].get(org_id, [])
     return jsonify([{
-        'id': s.id,
-        'name': s.name,
-        'manager_name': s.manager_name
+        'id': s['id'],
+        'name': s['name'],
+        'manager_name': s['manager_name']
     } for s in services])
 
 # API: 모든 서비스 목록 조회
-@app.route('/api/services')
+@bp.route('/api/services')
 def get_all_services():
-    services = Service.query.join(Organization).all()
+    services = cached_services()['all']
     return jsonify([{
-        'id': s.id,
-        'name': s.name,
-        'organization_name': s.organization.name,
-        'manager_name': s.manager_name,
-        'created_at': s.created_at.strftime('%Y-%m-%d %H:%M') if hasattr(s, 'created_at') and s.created_at else '-'
+        'id': s['id'],
+        'name': s['name'],
+        'organization_id': s['organization_id'],
+        'organization_name': s['organization_name'],
+        'manager_name': s['manager_name'],
+        'created_at': s['created_at'].strftime('%Y-%m-%d %H:%M') if s['created_at'] else '-'
     } for s in services])
 
 # API: 모든 조직 목록 조회
-@app.route('/api/organizations')
+@bp.route('/api/organizations')
 def get_all_organizations():
-    orgs = Organization.query.all()
+    orgs = cached_organizations()
     return jsonify([{
-        'id': o.id,
-        'name': o.name,
-        'created_at': o.created_at.strftime('%Y-%m-%d %H:%M') if hasattr(o, 'created_at') and o.created_at else '-'
+        'id': o['id'],
+        'name': o['name'],
+        'created_at': o['created_at'].strftime('%Y-%m-%d %H:%M') if o['created_at'] else '-'
     } for o in orgs])
 
 # API: 물량 신청
-@app.route('/api/request', methods=['POST'])
+@bp.route('/api/request', methods=['POST'])
 def create_request():
     data = request.json
-    service_id = data.get('service_id')
+    # 캐시 조회는 키가 정확히 같아야 하므로 "1" 같은 문자열 ID는 정수로 변환
+    try:
+        service_id = int(data.get('service_id'))
+    except (TypeError, ValueError):
+        return jsonify({'success': False, 'message': '서비스 ID가 올바르지 않습니다.'}), 400
     send_date = datetime.strptime(data.get('send_date'), '%Y-%m-%d').date()
     channel = data.get('channel', 'naver')
     quantity = data.get('quantity')
 
+    # 음수 물량은 조건부 UPDATE를 통과해 사용량을 줄이므로 예약 전에 거부
+    if isinstance(quantity, bool) or not isinstance(quantity, int) or quantity <= 0:
+        return jsonify({'success': False, 'message': '발송 물량이 올바르지 않습니다.'}), 400
+
     # 해당 월의 조직별 총 물량 확인
-    service = Service.query.get(service_id)
+    service = cached_service(service_id)
+    if not service:
+        return jsonify({'success': False, 'message': '서비스를 찾을 수 없습니다.'}), 404
+    organization_id = service['organization_id']
     year_month = send_date.strftime('%Y-%m')
 
     # 프리징 체크
-    freeze = MonthlyFreeze.query.filter_by(year_month=year_month).first()
-    if freeze and freeze.is_frozen:
+    if is_frozen(year_month):
         return jsonify({'success': False, 'message': f'{year_month}은(는) 프리징되었습니다. 변경 요청을 이용해주세요.'}), 403
 
     quota = MonthlyQuota.query.filter_by(
-        organization_id=service.organization_id,
+        organization_id=organization_id,
         year_month=year_month,
         channel=channel
     ).first()
@@ -515,87 +2110,374 @@ def create_request():
     if not quota:
         return jsonify({'success': False, 'message': f'해당 월의 {channel} 채널 물량이 설정되지 않았습니다.'}), 400
 
-    # 해당 월의 조직 전체 신청 물량 계산 (채널별)
-    month_start = datetime.strptime(year_month + '-01', '%Y-%m-%d').date()
-    if send_date.month == 12:
-        month_end = datetime.strptime(f'{send_date.year + 1}-01-01', '%Y-%m-%d').date()
-    else:
-        month_end = datetime.strptime(f'{send_date.year}-{send_date.month + 1:02d}-01', '%Y-%m-%d').date()
+    send_time = data.get('send_time')
+    campaign_name = data.get('campaign_name')
 
-    total_requested = db.session.query(func.sum(SendRequest.quantity)).join(Service).filter(
-        Service.organization_id == service.organization_id,
-        SendRequest.channel == channel,
-        SendRequest.send_date >= month_start,
-        SendRequest.send_date < month_end
-    ).scalar() or 0
+    try:
+        # 해당 월의 조직 전체 신청 물량 (채널별) 안에서 원자적으로 예약
+        if not reserve_usage(organization_id, year_month, channel, quantity):
+            db.session.rollback()
+            remaining = quota.total_quota - get_usage(organization_id, year_month, channel)
+            return jsonify({
+                'success': False,
+                'message': f'{channel} 채널 물량을 초과합니다. 남은 물량: {remaining:,}건',
+                'remaining': remaining
+            }), 409
+
+        send_request = SendRequest(
+            service_id=service_id,
+            organization_id=organization_id,
+            send_date=send_date,
+            send_time=send_time,
+            channel=channel,
+            campaign_name=campaign_name,
+            quantity=quantity
+        )
+        db.session.add(send_request)
+        adjust_rollup(service_id, organization_id, year_month, channel, quantity, 1)
+        record_change(organization_id, year_month, 'create')
+        db.session.commit()
+    except OperationalError:
+        return conflict_response()
+
+    return jsonify({'success': True, 'message': '물량이 신청되었습니다.'})
 
-    if total_requested + quantity > quota.total_quota:
-        remaining = quota.total_quota - total_requested
+BATCH_MAX_ITEMS = 1000
+
+# API: 물량 일괄 신청
+# mode: all_or_nothing (하나라도 실패하면 전체 취소) / best_effort (가능한 항목만 신청)
+@bp.route('/api/requests/batch', methods=['POST'])
+def create_requests_batch():
+    data = request.json or {}
+    items = data.get('items') or []
+    mode = data.get('mode', 'all_or_nothing')
+
+    if mode not in ('all_or_nothing', 'best_effort'):
+        return jsonify({'success': False, 'message': '잘못된 신청 방식입니다.'}), 400
+    if not isinstance(items, list):
+        return jsonify({'success': False, 'message': '신청 목록(items)은 배열이어야 합니다.'}), 400
+    if not items:
+        return jsonify({'success': False, 'message': '신청할 캠페인이 없습니다.'}), 400
+    if len(items) > BATCH_MAX_ITEMS:
+        return jsonify({'success': False, 'message': f'한 번에 최대 {BATCH_MAX_ITEMS:,}건까지 신청할 수 있습니다.'}), 400
+
+    services = cached_services()['by_id']
+
+    # 항목 검증 및 (조직, 월, 채널) 그룹핑
+    results = [None] * len(items)
+    rows = {}
+    groups = {}
+    for index, item in enumerate(items):
+        if not isinstance(item, dict):
+            results[index] = {'index': index, 'success': False, 'message': '잘못된 신청 항목입니다.'}
+            continue
+        service_id = item.get('service_id')
+        service = services.get(service_id) if isinstance(service_id, int) else None
+        quantity = item.get('quantity')
+        channel = item.get('channel', 'naver')
+        try:
+            send_date = datetime.strptime(item.get('send_date') or '', '%Y-%m-%d').date()
+        except (ValueError, TypeError):
+            send_date = None
+
+        if not service:
+            results[index] = {'index': index, 'success': False, 'message': '서비스를 찾을 수 없습니다.'}
+        elif not send_date:
+            results[index] = {'index': index, 'success': False, 'message': '발송 날짜가 올바르지 않습니다.'}
+        elif isinstance(quantity, bool) or not isinstance(quantity, int) or quantity <= 0:
+            results[index] = {'index': index, 'success': False, 'message': '발송 물량이 올바르지 않습니다.'}
+        elif not isinstance(channel, str):
+            results[index] = {'index': index, 'success': False, 'message': '채널이 올바르지 않습니다.'}
+        else:
+            key = (service['organization_id'], send_date.strftime('%Y-%m'), channel)
+            groups.setdefault(key, []).append(index)
+            rows[index] = {
+                'service_id': service['id'],
+                'organization_id': service['organization_id'],
+                'send_date': send_date,
+                'send_time': item.get('send_time'),
+                'channel': channel,
+                'campaign_name': item.get('campaign_name'),
+                'quantity': quantity
+            }
+    has_invalid = len(rows) < len(items)
+
+    # 프리징 / 물량 / 사용량을 그룹 전체에 대해 한 번씩 조회
+    frozen_months = {ym for _, ym, _ in groups if is_frozen(ym)}
+
+    quota_rows = db.session.query(
+        MonthlyQuota.organization_id,
+        MonthlyQuota.year_month,
+        MonthlyQuota.channel,
+        MonthlyQuota.total_quota,
+        func.coalesce(MonthlyUsage.requested, 0)
+    ).outerjoin(MonthlyUsage, db.and_(
+        MonthlyUsage.organization_id == MonthlyQuota.organization_id,
+        MonthlyUsage.year_month == MonthlyQuota.year_month,
+        MonthlyUsage.channel == MonthlyQuota.channel
+    )).filter(
+        tuple_(MonthlyQuota.organization_id, MonthlyQuota.year_month, MonthlyQuota.channel).in_(list(groups))
+    ).all() if groups else []
+    remaining_by_group = {
+        (org_id, ym, channel): total_quota - requested
+        for org_id, ym, channel, total_quota, requested in quota_rows
+    }
+
+    accepted = {}
+    for key, indexes in groups.items():
+        org_id, year_month, channel = key
+        if year_month in frozen_months:
+            message = f'{year_month}은(는) 프리징되었습니다. 변경 요청을 이용해주세요.'
+            for index in indexes:
+                results[index] = {'index': index, 'success': False, 'message': message}
+            continue
+        if key not in remaining_by_group:
+            message = f'해당 월의 {channel} 채널 물량이 설정되지 않았습니다.'
+            for index in indexes:
+                results[index] = {'index': index, 'success': False, 'message': message}
+            continue
+
+        remaining = remaining_by_group[key]
+        group_total = sum(rows[index]['quantity'] for index in indexes)
+        if mode == 'all_or_nothing' and group_total > remaining:
+            message = f'{channel} 채널 물량을 초과합니다. 남은 물량: {remaining:,}건, 신청 물량: {group_total:,}건'
+            for index in indexes:
+                results[index] = {'index': index, 'success': False, 'message': message}
+            continue
+
+        # best_effort: 신청 순서대로 남은 물량 안에서 수락
+        for index in indexes:
+            quantity = rows[index]['quantity']
+            if quantity <= remaining:
+                remaining -= quantity
+                accepted.setdefault(key, []).append(index)
+            else:
+                results[index] = {
+                    'index': index,
+                    'success': False,
+                    'message': f'{channel} 채널 물량을 초과합니다. 남은 물량: {remaining:,}건'
+                }
+
+    failed = any(result is not None for result in results)
+    if mode == 'all_or_nothing' and failed:
+        for index, result in enumerate(results):
+            if result is None:
+                results[index] = {'index': index, 'success': False, 'message': '다른 항목의 오류로 신청되지 않았습니다.'}
         return jsonify({
             'success': False,
-            'message': f'{channel} 채널 물량을 초과합니다. 남은 물량: {remaining:,}건'
-        }), 400
+            'message': '일부 항목을 신청할 수 없어 전체 신청이 취소되었습니다.',
+            'created_count': 0,
+            'failed_count': len(items),
+            'results': results
+        }), 400 if has_invalid else 409
+
+    try:
+        # 그룹별 원자적 예약 (조회 이후 다른 신청이 들어온 경우 대비)
+        if mode == 'all_or_nothing':
+            if not reserve_usages({
+                key: sum(rows[index]['quantity'] for index in indexes) for key, indexes in accepted.items()
+            }):
+                return conflict_response()
+        else:
+            for key, indexes in list(accepted.items()):
+                if reserve_usage(*key, sum(rows[index]['quantity'] for index in indexes)):
+                    continue
+                for index in accepted.pop(key):
+                    results[index] = {'index': index, 'success': False, 'message': '다른 신청과 충돌하여 물량이 부족합니다.'}
+
+        insert_rows = [rows[index] for indexes in accepted.values() for index in indexes]
+        if insert_rows:
+            db.session.execute(SendRequest.__table__.insert(), insert_rows)
+
+        # 서비스별 월간 롤업
+        rollup = {}
+        for row in insert_rows:
+            key = (row['service_id'], row['organization_id'], row['send_date'].strftime('%Y-%m'), row['channel'])
+            quantity, count = rollup.get(key, (0, 0))
+            rollup[key] = (quantity + row['quantity'], count + 1)
+        adjust_rollups(rollup)
+        for org_id, year_month, _ in accepted:
+            record_change(org_id, year_month, 'create')
+        db.session.commit()
+    except OperationalError:
+        return conflict_response()
 
-    send_time = data.get('send_time')
-    campaign_name = data.get('campaign_name')
+    for indexes in accepted.values():
+        for index in indexes:
+            results[index] = {'index': index, 'success': True, 'message': '물량이 신청되었습니다.'}
+
+    created_count = sum(len(indexes) for indexes in accepted.values())
+    return jsonify({
+        'success': created_count == len(items),
+        'message': f'{created_count:,}건이 신청되었습니다.',
+        'created_count': created_count,
+        'failed_count': len(items) - created_count,
+        'results': results
+    })
 
-    send_request = SendRequest(
-        service_id=service_id,
-        send_date=send_date,
-        send_time=send_time,
-        channel=channel,
-        campaign_name=campaign_name,
-        quantity=quantity
+# 달력 조회 방식
+# - 기본: 캠페인별 상세 (calendar_data)
+# - detail=summary: 일별/채널별 합계만 DB에서 GROUP BY로 집계 (daily_summary)
+# - date=YYYY-MM-DD: 해당 일자의 캠페인 상세만 조회 (월 그리드에서 일자 선택 시 지연 로딩)
+class InvalidCalendarDate(ValueError):
+    pass
+
+@bp.app_errorhandler(InvalidCalendarDate)
+def handle_invalid_calendar_date(error):
+    return jsonify({'success': False, 'message': '조회 일자가 올바르지 않습니다.'}), 400
+
+def calendar_period(year_month):
+    month_start, month_end = month_range(year_month)
+    day = request.args.get('date')
+    if not day:
+        return month_start, month_end
+    try:
+        day = datetime.strptime(day, '%Y-%m-%d').date()
+    except ValueError:
+        raise InvalidCalendarDate(day)
+    if not month_start <= day < month_end:
+        raise InvalidCalendarDate(day)
+    return day, day + timedelta(days=1)
+
+def is_calendar_summary():
+    return request.args.get('detail') == 'summary'
+
+# 일별/채널별 합계 - {날짜: {채널: {'count': 건수, 'quantity': 물량}}}
+def calendar_daily_summary(*criteria):
+    rows = db.session.query(
+        SendRequest.send_date,
+        SendRequest.channel,
+        func.count(SendRequest.id),
+        func.sum(SendRequest.quantity)
+    ).filter(*criteria).group_by(SendRequest.send_date, SendRequest.channel).all()
+
+    daily = {}
+    for send_date, channel, count, quantity in rows:
+        daily.setdefault(send_date.strftime('%Y-%m-%d'), {})[channel] = {
+            'count': count,
+            'quantity': int(quantity or 0)
+        }
+    return daily
+
+# 달력 응답 캐시 (프로세스 내 LRU)
+# - (범위, 월, 쿼리 파라미터) -> (ETag, 직렬화된 본문)
+# - ETag는 데이터 버전과 조직/서비스 캐시 세대로 만들므로 다른 워커의 변경도 바로 반영됨
+# - 클라이언트가 같은 ETag를 보내면 본문 없이 304 응답
+CALENDAR_CACHE_SIZE = 512
+
+class CalendarCache:
+    def __init__(self, size):
+        self.size = size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, etag):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] == etag:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            return None
+
+    def put(self, key, etag, body):
+        with self._lock:
+            self._entries[key] = (etag, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+calendar_cache = CalendarCache(CALENDAR_CACHE_SIZE)
+
+def data_version(organization_id, year_month):
+    version = db.session.query(DataVersion.version).filter_by(
+        organization_id=organization_id,
+        year_month=year_month
+    ).scalar()
+    return version or 0
+
+# 버전 기반 조건부 GET 응답 - build()는 캐시에 없을 때만 호출됨
+def calendar_response(scope, year_month, organization_id, build):
+    variant = '&'.join(f'{k}={v}' for k, v in sorted(request.args.items(multi=True)))
+    generations = cache_generations()
+    etag = '{}-{}-{}-{}'.format(
+        data_version(organization_id, year_month),
+        generations.get(CACHE_ORGANIZATIONS, 0),
+        generations.get(CACHE_SERVICES, 0),
+        zlib.crc32(f'{scope}|{year_month}|{variant}'.encode())
     )
-    db.session.add(send_request)
-    db.session.commit()
 
-    return jsonify({'success': True, 'message': '물량이 신청되었습니다.'})
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    else:
+        key = (scope, year_month, variant)
+        body = calendar_cache.get(key, etag)
+        if body is None:
+            body = current_app.json.dumps(build())
+            calendar_cache.put(key, etag, body)
+        response = Response(body, mimetype='application/json')
+
+    # 압축 여부와 관계없이 같은 검증자를 쓰도록 항상 약한 ETag (압축 응답도 같은 값, 304도 같은 값)
+    response.set_etag(etag, weak=True)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
 
 # API: 달력용 물량 현황 조회 (조직별, 채널별)
-@app.route('/api/calendar/<int:org_id>/<year_month>')
+@bp.route('/api/calendar/<int:org_id>/<year_month>')
 def get_calendar_data(org_id, year_month):
-    channel = request.args.get('channel', 'all')  # all, naver, payco, talktalk
+    return calendar_response(f'org:{org_id}', year_month, org_id,
+                             lambda: build_calendar_data(org_id, year_month))
 
-    month_start = datetime.strptime(year_month + '-01', '%Y-%m-%d').date()
-    year = int(year_month.split('-')[0])
-    month = int(year_month.split('-')[1])
-
-    if month == 12:
-        month_end = date(year + 1, 1, 1)
-    else:
-        month_end = date(year, month + 1, 1)
+def build_calendar_data(org_id, year_month):
+    channel = request.args.get('channel', 'all')  # all, naver, payco, talktalk
 
-    query = db.session.query(
-        SendRequest.send_date,
-        Service.name,
-        SendRequest.channel,
-        SendRequest.quantity,
-        SendRequest.send_time,
-        SendRequest.campaign_name
-    ).join(Service).filter(
-        Service.organization_id == org_id,
-        SendRequest.send_date >= month_start,
-        SendRequest.send_date < month_end
-    )
+    period_start, period_end = calendar_period(year_month)
 
+    criteria = [
+        SendRequest.organization_id == org_id,
+        SendRequest.send_date >= period_start,
+        SendRequest.send_date < period_end
+    ]
     if channel != 'all':
-        query = query.filter(SendRequest.channel == channel)
+        criteria.append(SendRequest.channel == channel)
 
-    requests = query.all()
-
-    calendar_data = {}
-    for req in requests:
-        date_str = req.send_date.strftime('%Y-%m-%d')
-        if date_str not in calendar_data:
-            calendar_data[date_str] = []
-        calendar_data[date_str].append({
-            'service': req.name,
-            'channel': req.channel,
-            'quantity': req.quantity,
-            'time': req.send_time,
-            'campaign_name': req.campaign_name
-        })
+    if is_calendar_summary():
+        requests = []
+    else:
+        requests = db.session.query(
+            SendRequest.send_date,
+            Service.name,
+            SendRequest.channel,
+            SendRequest.quantity,
+            SendRequest.send_time,
+            SendRequest.campaign_name
+        ).join(Service).filter(*criteria).all()
+
+    if is_columnar():
+        calendar_data = columnar_payload([
+            ('date', 'day'), ('service', 'dict'), ('channel', 'dict'),
+            ('quantity', None), ('time', None), ('campaign_name', None)
+        ], requests, month_range(year_month)[0], labels={'channel': CHANNEL_NAMES})
+    else:
+        calendar_data = {}
+        for req in requests:
+            date_str = req.send_date.strftime('%Y-%m-%d')
+            if date_str not in calendar_data:
+                calendar_data[date_str] = []
+            calendar_data[date_str].append({
+                'service': req.name,
+                'channel': req.channel,
+                'quantity': req.quantity,
+                'time': req.send_time,
+                'campaign_name': req.campaign_name
+            })
 
     # 채널별 물량 정보
     quotas = {}
@@ -616,63 +2498,81 @@ def get_calendar_data(org_id, year_month):
             quotas[channel] = quota.total_quota
 
     total_quota = sum(quotas.values())
-    total_requested = sum(req.quantity for req in requests)
 
-    return jsonify({
-        'calendar_data': calendar_data,
+    # 신청 물량 합계 (사용량 원장)
+    usage_query = db.session.query(func.sum(MonthlyUsage.requested)).filter(
+        MonthlyUsage.organization_id == org_id,
+        MonthlyUsage.year_month == year_month
+    )
+    if channel != 'all':
+        usage_query = usage_query.filter(MonthlyUsage.channel == channel)
+    total_requested = usage_query.scalar() or 0
+
+    result = {
         'total_quota': total_quota,
         'quotas_by_channel': quotas,
         'total_requested': total_requested,
         'remaining': total_quota - total_requested
-    })
+    }
+    if is_calendar_summary():
+        result['daily_summary'] = calendar_daily_summary(*criteria)
+    else:
+        result['calendar_data'] = calendar_data
+    return result
 
 # API: 달력용 전체 물량 현황 조회 (모든 조직)
-@app.route('/api/calendar/all/<year_month>')
+@bp.route('/api/calendar/all/<year_month>')
 def get_calendar_data_all(year_month):
-    channel = request.args.get('channel', 'all')
+    return calendar_response('all', year_month, 0,
+                             lambda: build_calendar_data_all(year_month))
 
-    month_start = datetime.strptime(year_month + '-01', '%Y-%m-%d').date()
-    year = int(year_month.split('-')[0])
-    month = int(year_month.split('-')[1])
-
-    if month == 12:
-        month_end = date(year + 1, 1, 1)
-    else:
-        month_end = date(year, month + 1, 1)
+def build_calendar_data_all(year_month):
+    channel = request.args.get('channel', 'all')
 
-    # 전체 조직의 신청 내역 조회
-    query = db.session.query(
-        SendRequest.send_date,
-        Service.name,
-        Organization.name.label('org_name'),
-        SendRequest.channel,
-        SendRequest.quantity,
-        SendRequest.send_time,
-        SendRequest.campaign_name
-    ).join(Service, SendRequest.service_id == Service.id
-    ).join(Organization, Service.organization_id == Organization.id
-    ).filter(
-        SendRequest.send_date >= month_start,
-        SendRequest.send_date < month_end
-    )
+    period_start, period_end = calendar_period(year_month)
 
+    criteria = [
+        SendRequest.send_date >= period_start,
+        SendRequest.send_date < period_end
+    ]
     if channel != 'all':
-        query = query.filter(SendRequest.channel == channel)
+        criteria.append(SendRequest.channel == channel)
 
-    requests = query.all()
-
-    calendar_data = {}
-    for req in requests:
-        date_str = req.send_date.strftime('%Y-%m-%d')
-        if date_str not in calendar_data:
-            calendar_data[date_str] = []
-        calendar_data[date_str].append({
-            'service': f"{req.org_name} - {req.name}",
-            'channel': req.channel,
-            'quantity': req.quantity,
-            'time': req.send_time,
-            'campaign_name': req.campaign_name
-        })
+    # 전체 조직의 신청 내역 조회
+    if is_calendar_summary():
+        requests = []
+    else:
+        requests = db.session.query(
+            SendRequest.send_date,
+            Service.name,
+            Organization.name.label('org_name'),
+            SendRequest.channel,
+            SendRequest.quantity,
+            SendRequest.send_time,
+            SendRequest.campaign_name
+        ).join(Service, SendRequest.service_id == Service.id
+        ).join(Organization, SendRequest.organization_id == Organization.id
+        ).filter(*criteria).all()
+
+    if is_columnar():
+        # 행 형식의 '조직 - 서비스' 대신 조직과 서비스를 각각 사전 인코딩
+        calendar_data = columnar_payload([
+            ('date', 'day'), ('service', 'dict'), ('org', 'dict'), ('channel', 'dict'),
+            ('quantity', None), ('time', None), ('campaign_name', None)
+        ], requests, month_range(year_month)[0], labels={'channel': CHANNEL_NAMES})
+    else:
+        calendar_data = {}
+        for req in requests:
+            date_str = req.send_date.strftime('%Y-%m-%d')
+            if date_str not in calendar_data:
+                calendar_data[date_str] = []
+            calendar_data[date_str].append({
+                'service': f"{req.org_name} - {req.name}",
+                'channel': req.channel,
+                'quantity': req.quantity,
+                'time': req.send_time,
+                'campaign_name': req.campaign_name
+            })
 
     # 전체 조직의 물량 정보
     quotas_query = MonthlyQuota.query.filter_by(year_month=year_month)
@@ -681,81 +2581,249 @@ def get_calendar_data_all(year_month):
 
     all_quotas = quotas_query.all()
     total_quota = sum(q.total_quota for q in all_quotas)
-    total_requested = sum(req.quantity for req in requests)
 
-    return jsonify({
-        'calendar_data': calendar_data,
+    # 신청 물량 합계 (사용량 원장)
+    usage_query = db.session.query(func.sum(MonthlyUsage.requested)).filter(
+        MonthlyUsage.year_month == year_month
+    )
+    if channel != 'all':
+        usage_query = usage_query.filter(MonthlyUsage.channel == channel)
+    total_requested = usage_query.scalar() or 0
+
+    result = {
         'total_quota': total_quota,
         'total_requested': total_requested,
         'remaining': total_quota - total_requested
-    })
+    }
+    if is_calendar_summary():
+        result['daily_summary'] = calendar_daily_summary(*criteria)
+    else:
+        result['calendar_data'] = calendar_data
+    return result
 
 # API: 달력용 물량 현황 조회 (서비스별)
-@app.route('/api/calendar/service/<int:service_id>/<year_month>')
+@bp.route('/api/calendar/service/<int:service_id>/<year_month>')
 def get_calendar_data_by_service(service_id, year_month):
-    month_start = datetime.strptime(year_month + '-01', '%Y-%m-%d').date()
-    year = int(year_month.split('-')[0])
-    month = int(year_month.split('-')[1])
-
-    if month == 12:
-        month_end = date(year + 1, 1, 1)
-    else:
-        month_end = date(year, month + 1, 1)
-
-    service = Service.query.get(service_id)
+    service = cached_service(service_id)
     if not service:
         return jsonify({'error': '서비스를 찾을 수 없습니다.'}), 404
 
-    requests = db.session.query(
-        SendRequest.send_date,
-        Service.name,
-        SendRequest.quantity,
-        SendRequest.channel,
-        SendRequest.send_time,
-        SendRequest.campaign_name
-    ).join(Service).filter(
+    return calendar_response(f'service:{service_id}', year_month, service['organization_id'],
+                             lambda: build_calendar_data_by_service(service, year_month))
+
+def build_calendar_data_by_service(service, year_month):
+    service_id = service['id']
+    month_start, month_end = month_range(year_month)
+    period_start, period_end = calendar_period(year_month)
+
+    criteria = [
         SendRequest.service_id == service_id,
-        SendRequest.send_date >= month_start,
-        SendRequest.send_date < month_end
-    ).all()
+        SendRequest.send_date >= period_start,
+        SendRequest.send_date < period_end
+    ]
 
-    calendar_data = {}
-    for req in requests:
-        date_str = req.send_date.strftime('%Y-%m-%d')
-        if date_str not in calendar_data:
-            calendar_data[date_str] = []
-        calendar_data[date_str].append({
-            'service': req.name,
-            'quantity': req.quantity,
-            'channel': req.channel,
-            'time': req.send_time,
-            'campaign_name': req.campaign_name
-        })
+    if is_calendar_summary():
+        requests = []
+    else:
+        requests = db.session.query(
+            SendRequest.send_date,
+            SendRequest.quantity,
+            SendRequest.channel,
+            SendRequest.send_time,
+            SendRequest.campaign_name
+        ).filter(*criteria).all()
+
+    if is_columnar():
+        # 서비스는 URL로 정해지므로 열에서 생략
+        calendar_data = columnar_payload([
+            ('date', 'day'), ('quantity', None), ('channel', 'dict'), ('time', None), ('campaign_name', None)
+        ], requests, month_start, labels={'channel': CHANNEL_NAMES})
+    else:
+        calendar_data = {}
+        for req in requests:
+            date_str = req.send_date.strftime('%Y-%m-%d')
+            if date_str not in calendar_data:
+                calendar_data[date_str] = []
+            calendar_data[date_str].append({
+                'service': service['name'],
+                'quantity': req.quantity,
+                'channel': req.channel,
+                'time': req.send_time,
+                'campaign_name': req.campaign_name
+            })
 
     # 해당 서비스의 조직 물량 정보
     quota = MonthlyQuota.query.filter_by(
-        organization_id=service.organization_id,
+        organization_id=service['organization_id'],
         year_month=year_month
     ).first()
 
-    total_requested = sum(req.quantity for req in requests)
+    if is_calendar_summary() or (period_start, period_end) != (month_start, month_end):
+        total_requested = db.session.query(func.sum(SendRequest.quantity)).filter(
+            SendRequest.service_id == service_id,
+            SendRequest.send_date >= month_start,
+            SendRequest.send_date < month_end
+        ).scalar() or 0
+    else:
+        total_requested = sum(req.quantity for req in requests)
 
-    return jsonify({
-        'calendar_data': calendar_data,
+    result = {
         'total_quota': quota.total_quota if quota else 0,
         'total_requested': total_requested,
         'remaining': (quota.total_quota if quota else 0) - total_requested
-    })
+    }
+    if is_calendar_summary():
+        result['daily_summary'] = calendar_daily_summary(*criteria)
+    else:
+        result['calendar_data'] = calendar_data
+    return result
+
+# 실시간 변경 스트림 (Server-Sent Events)
+# - 워커마다 change_event 테이블을 조회하므로 어느 워커에서 커밋된 변경이든 전달됨
+# - 처음 연결하면 현재 합계(snapshot), Last-Event-ID로 재연결하면 그 이후의 변경(change)을 최신 합계와 함께 전송
+# - 기본(STREAM_MAX_SECONDS=0)은 한 번 조회하고 바로 종료하며, 브라우저 EventSource가 retry 간격 후
+#   Last-Event-ID로 재연결함 (gthread / sync 워커에서 연결마다 스레드를 붙잡지 않도록)
+# - STREAM_MAX_SECONDS > 0이면 그 시간 동안 연결을 유지하며 STREAM_POLL_SECONDS마다 조회하고 직전 대비 증감(delta)도 전송
+#   (연결당 스레드 하나를 계속 쓰므로 gevent 워커에서만 사용, gunicorn.conf.py 참고)
+# - org_id = 0 이면 해당 월 전체 조직
+STREAM_POLL_SECONDS = 1
+STREAM_HEARTBEAT_SECONDS = 15
+STREAM_MAX_SECONDS = int(os.environ.get('STREAM_MAX_SECONDS', 0))
+STREAM_RETRY_MS = int(os.environ.get('STREAM_RETRY_MS', 3000))
+STREAM_REORDER_WINDOW = 100
+
+# 스트림 커서 (SSE id / Last-Event-ID) - '마지막 id' 또는 '마지막 id:최근 전달한 id,...'
+# PostgreSQL은 id를 INSERT 시점에 배정하므로 id N의 트랜잭션이 N+1보다 늦게 커밋될 수 있음
+# 그래서 마지막 id 아래 STREAM_REORDER_WINDOW개 범위를 매번 다시 조회하고, 그 범위에서 이미 보낸 id는 커서에 담아 제외
+# (창 범위보다 오래 커밋되지 않은 트랜잭션의 이벤트는 놓칠 수 있음)
+def parse_stream_cursor(value):
+    last_id, _, seen = (value or '').partition(':')
+    try:
+        return int(last_id), {int(i) for i in seen.split(',') if i}
+    except ValueError:
+        return None, set()
+
+def format_stream_cursor(last_id, seen):
+    recent = sorted(i for i in seen if last_id - STREAM_REORDER_WINDOW < i < last_id)
+    return f'{last_id}:{",".join(map(str, recent))}' if recent else str(last_id)
+
+def stream_totals(organization_id, year_month):
+    if organization_id:
+        condition = lambda model: (model.organization_id == organization_id) & (model.year_month == year_month)
+    else:
+        condition = lambda model: model.year_month == year_month
+    summary_query = quota_usage_subquery(condition)
+    channels = {
+        channel: (int(q or 0), int(r or 0))
+        for channel, q, r in db.session.query(
+            summary_query.c.channel,
+            func.sum(summary_query.c.total_quota),
+            func.sum(summary_query.c.requested)
+        ).group_by(summary_query.c.channel).all()
+    }
+    total_quota = sum(q for q, _ in channels.values())
+    total_requested = sum(r for _, r in channels.values())
+    return {
+        'organization_id': organization_id,
+        'year_month': year_month,
+        'channels': {
+            channel: {
+                'total_quota': q,
+                'requested': r,
+                'remaining': q - r
+            } for channel, (q, r) in sorted(channels.items())
+        },
+        'total_quota': total_quota,
+        'total_requested': total_requested,
+        'remaining': total_quota - total_requested,
+        'is_frozen': is_frozen(year_month)
+    }
+
+def sse_message(event, data, event_id):
+    return f'id: {event_id}\nevent: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n'
+
+# API: 조직/월 실시간 변경 스트림
+@bp.route('/api/stream/<int:org_id>/<year_month>')
+def stream_changes(org_id, year_month):
+    try:
+        datetime.strptime(year_month, '%Y-%m')
+    except ValueError:
+        return jsonify({'success': False, 'message': '연월(YYYY-MM)을 올바르게 입력해주세요.'}), 400
+
+    latest_id = db.session.query(func.max(ChangeEvent.id)).scalar() or 0
+    last_event_id, seen_ids = parse_stream_cursor(request.headers.get('Last-Event-ID'))
+    resumed = last_event_id is not None and last_event_id <= latest_id
+    if not resumed:
+        last_event_id, seen_ids = latest_id, set()
+    # 커서의 마지막 id는 이미 보냈거나 스냅샷에 포함된 변경
+    seen_ids.add(last_event_id)
+
+    # 커서 이후 + 재조회 범위 안에서 아직 보내지 않은 변경
+    def pending_changes():
+        query = db.session.query(ChangeEvent.id, ChangeEvent.kind).filter(
+            ChangeEvent.year_month == year_month,
+            ChangeEvent.id > last_event_id - STREAM_REORDER_WINDOW
+        )
+        if org_id:
+            query = query.filter(ChangeEvent.organization_id.in_([org_id, 0]))
+        return [row for row in query.order_by(ChangeEvent.id).all() if row.id not in seen_ids]
+
+    # 보낸 변경을 커서에 반영하고 SSE id 반환
+    def advance(rows):
+        nonlocal last_event_id
+        last_event_id = max(last_event_id, rows[-1].id) if rows else last_event_id
+        seen_ids.update(row.id for row in rows)
+        seen_ids.difference_update([i for i in seen_ids if i <= last_event_id - STREAM_REORDER_WINDOW])
+        return format_stream_cursor(last_event_id, seen_ids)
+
+    def generate():
+        yield f'retry: {STREAM_RETRY_MS}\n\n'
+        if resumed:
+            kinds = pending_changes()
+            # 변경이 없으면 합계를 조회하지 않음 (한 번 조회 후 종료하는 기본 모드에서는 재연결마다 실행되므로)
+            totals = stream_totals(org_id, year_month) if kinds or STREAM_MAX_SECONDS else None
+            if kinds:
+                yield sse_message('change', dict(totals, kinds=sorted({k.kind for k in kinds})), advance(kinds))
+        else:
+            # 스냅샷 합계에 이미 포함된 변경은 다시 보내지 않도록 커서에 기록
+            event_id = advance(pending_changes())
+            totals = stream_totals(org_id, year_month)
+            yield sse_message('snapshot', totals, event_id)
+        # 트랜잭션을 끝내 커넥션을 반납하고, 다음 조회에서 최신 커밋이 보이도록 함
+        db.session.rollback()
+
+        started = last_sent = time.monotonic()
+        while time.monotonic() - started < STREAM_MAX_SECONDS:
+            time.sleep(STREAM_POLL_SECONDS)
+            kinds = pending_changes()
+
+            if kinds:
+                g.pop('cache_generations', None)
+                previous, totals = totals, stream_totals(org_id, year_month)
+                yield sse_message('change', dict(totals, kinds=sorted({k.kind for k in kinds}), delta={
+                    'total_quota': totals['total_quota'] - previous['total_quota'],
+                    'total_requested': totals['total_requested'] - previous['total_requested']
+                }), advance(kinds))
+                last_sent = time.monotonic()
+            elif time.monotonic() - last_sent >= STREAM_HEARTBEAT_SECONDS:
+                yield ': keepalive\n\n'
+                last_sent = time.monotonic()
+            db.session.rollback()
+
+    response = Response(stream_with_context(generate()), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
 
 # API: 서비스별 신청 목록 조회
-@app.route('/api/requests/service/<int:service_id>')
+@bp.route('/api/requests/service/<int:service_id>')
 def get_requests_by_service(service_id):
-    from datetime import datetime, time as dt_time
+    from datetime import time as dt_time
 
     # 오늘 날짜 (KST)
-    kst_now = datetime.now(KST)
-    today = kst_now.date()
-    current_time = kst_now.time()
+    now = kst_now()
+    today = now.date()
+    current_time = now.time()
 
     # 오늘 이후의 캠페인만 조회
     requests = SendRequest.query.filter_by(service_id=service_id).filter(
@@ -788,27 +2856,88 @@ def get_requests_by_service(service_id):
             # 미래 날짜는 모두 포함
             filtered_requests.append(r)
 
-    channel_names = {
-        'naver': '네이버앱',
-        'payco': '페이앱',
-        'talktalk': '톡톡'
-    }
+    if is_columnar():
+        return jsonify(columnar_payload(SEND_REQUEST_COLUMNS[:7], [
+            (r.id, r.send_date, r.send_time, r.channel, r.campaign_name, r.quantity, r.created_at)
+            for r in filtered_requests
+        ], labels={'channel': CHANNEL_NAMES}))
 
     return jsonify([{
         'id': r.id,
-        'send_date': r.send_date.strftime('%Y-%m-%d'),
+        'send_date': r.send_date.isoformat(),
         'send_time': r.send_time or '-',
         'channel': r.channel,
-        'channel_name': channel_names.get(r.channel, r.channel),
+        'channel_name': CHANNEL_NAMES.get(r.channel, r.channel),
         'campaign_name': r.campaign_name or '-',
         'quantity': r.quantity,
-        'created_at': r.created_at.strftime('%Y-%m-%d %H:%M')
+        'created_at': format_minutes(r.created_at)
     } for r in filtered_requests])
 
-# API: 조직별 신청 목록 조회
-@app.route('/api/requests/org/<int:org_id>')
-def get_requests_by_org(org_id):
-    requests = db.session.query(
+# 목록 응답용 날짜 / 시각 문자열 - strftime 대신 C로 구현된 isoformat 사용
+# (날짜는 한 페이지 안에서 반복되므로 응답마다 한 번만 변환)
+class DateStrings(dict):
+    def __missing__(self, value):
+        text = self[value] = value.isoformat()
+        return text
+
+def format_minutes(value):
+    return value.isoformat(' ', 'minutes') if value else None
+
+# 열 단위 응답 (?format=columnar, 목록 / 달력 API 공통)
+# 행 객체 배열 대신 필드별 병렬 배열로 응답해 반복되는 키와 이름을 없앰
+#   columns: {필드: [값, ...]} - 모든 배열의 i번째 값이 i번째 행
+#   dictionaries: 사전 인코딩 필드(조직, 서비스, 채널 등)의 값 목록 - 열에는 이 목록의 인덱스가 들어감
+#   labels: 사전 값의 표시명 (dictionaries와 같은 순서)
+#   base_date: 날짜 필드의 기준일(월 1일) - 열에는 기준일로부터의 일수가 들어감
+# 필드 인코딩: None(값 그대로), 'dict'(사전 인코딩), 'day'(기준일로부터 일수), 'minutes'('YYYY-MM-DD HH:MM')
+def is_columnar():
+    return request.args.get('format') == 'columnar'
+
+class ValueDictionary(dict):
+    def __missing__(self, value):
+        index = self[value] = len(self)
+        return index
+
+# fields: [(필드, 인코딩)] - rows의 열 순서와 같음
+# base_date가 없으면 날짜 필드 중 가장 이른 날짜가 속한 달의 1일
+def columnar_payload(fields, rows, base_date=None, labels=None):
+    columns = list(zip(*rows)) or [()] * len(fields)
+    if base_date is None:
+        days = [value for (_, encoding), column in zip(fields, columns) if encoding == 'day'
+                for value in column if value]
+        base_date = min(days).replace(day=1) if days else None
+    base = base_date.toordinal() if base_date else 0
+
+    payload = {
+        'format': 'columnar',
+        'count': len(rows),
+        'base_date': base_date.isoformat() if base_date else None,
+        'columns': {},
+        'dictionaries': {}
+    }
+    for (name, encoding), column in zip(fields, columns):
+        if encoding == 'dict':
+            lookup = ValueDictionary()
+            values = [lookup[value] if value is not None else None for value in column]
+            payload['dictionaries'][name] = list(lookup)
+        elif encoding == 'day':
+            values = [value.toordinal() - base if value else None for value in column]
+        elif encoding == 'minutes':
+            values = [format_minutes(value) for value in column]
+        else:
+            values = list(column)
+        payload['columns'][name] = values
+
+    if labels:
+        payload['labels'] = {
+            name: [names.get(value, value) for value in payload['dictionaries'][name]]
+            for name, names in labels.items()
+        }
+    return payload
+
+# 캠페인 목록 조회 (조직별 / 전체 목록 공통, 컬럼 순서는 send_request_items / SEND_REQUEST_COLUMNS와 같음)
+def send_request_list_query():
+    return db.session.query(
         SendRequest.id,
         SendRequest.send_date,
         SendRequest.send_time,
@@ -819,34 +2948,105 @@ def get_requests_by_org(org_id):
         Service.name.label('service_name'),
         Organization.name.label('org_name')
     ).join(Service, SendRequest.service_id == Service.id
-    ).join(Organization, Service.organization_id == Organization.id
-    ).filter(Organization.id == org_id
-    ).order_by(SendRequest.send_date.desc(), SendRequest.created_at.desc()).all()
-
-    channel_names = {
-        'naver': '네이버앱',
-        'payco': '페이앱',
-        'talktalk': '톡톡'
-    }
+    ).join(Organization, SendRequest.organization_id == Organization.id)
+
+# 캠페인 목록 행 - Row 속성 조회(행마다 이름 검색)보다 빠른 튜플 언패킹 사용
+def send_request_items(rows):
+    dates = DateStrings()
+    channel_names = CHANNEL_NAMES
+    return [{
+        'id': request_id,
+        'send_date': dates[send_date],
+        'send_time': send_time or '-',
+        'channel': channel,
+        'channel_name': channel_names.get(channel, channel),
+        'campaign_name': campaign_name or '-',
+        'quantity': quantity,
+        'created_at': format_minutes(created_at),
+        'service_name': service_name,
+        'org_name': org_name
+    } for request_id, send_date, send_time, channel, campaign_name, quantity, created_at, service_name, org_name
+        in rows]
+
+SEND_REQUEST_COLUMNS = [
+    ('id', None),
+    ('send_date', 'day'),
+    ('send_time', None),
+    ('channel', 'dict'),
+    ('campaign_name', None),
+    ('quantity', None),
+    ('created_at', 'minutes'),
+    ('service_name', 'dict'),
+    ('org_name', 'dict')
+]
+
+def send_request_list_response(rows, next_cursor):
+    if is_columnar():
+        return paginated_response(
+            columnar_payload(SEND_REQUEST_COLUMNS, rows, labels={'channel': CHANNEL_NAMES}), next_cursor
+        )
+    return paginated_response(send_request_items(rows), next_cursor)
 
-    return jsonify([{
-        'id': r.id,
-        'send_date': r.send_date.strftime('%Y-%m-%d'),
-        'send_time': r.send_time or '-',
-        'channel': r.channel,
-        'channel_name': channel_names.get(r.channel, r.channel),
-        'campaign_name': r.campaign_name or '-',
-        'quantity': r.quantity,
-        'created_at': r.created_at.strftime('%Y-%m-%d %H:%M'),
-        'service_name': r.service_name,
-        'org_name': r.org_name
-    } for r in requests])
+# API: 조직별 신청 목록 조회
+@bp.route('/api/requests/org/<int:org_id>')
+def get_requests_by_org(org_id):
+    query = send_request_list_query().filter(SendRequest.organization_id == org_id)
+
+    requests, next_cursor = paginate(
+        filter_send_requests(query), SEND_REQUEST_LIST_KEYS,
+        lambda r: (r.send_date, r.created_at, r.id)
+    )
+
+    return send_request_list_response(requests, next_cursor)
 
 # API: 전체 신청 목록 조회
-@app.route('/api/requests/all')
+@bp.route('/api/requests/all')
 def get_all_requests():
-    requests = db.session.query(
-        SendRequest.id,
+    query = send_request_list_query()
+
+    requests, next_cursor = paginate(
+        filter_send_requests(query), SEND_REQUEST_LIST_KEYS,
+        lambda r: (r.send_date, r.created_at, r.id)
+    )
+
+    return send_request_list_response(requests, next_cursor)
+
+# 내보내기용 표시명
+CHANNEL_NAMES = {
+    'naver': '네이버앱',
+    'payco': '페이앱',
+    'talktalk': '톡톡'
+}
+REQUEST_TYPE_NAMES = {
+    'add': '신규 추가',
+    'modify': '수정',
+    'delete': '삭제'
+}
+STATUS_NAMES = {
+    'pending': '대기중',
+    'approved': '승인',
+    'rejected': '거부'
+}
+
+EXPORT_CHUNK_SIZE = 1000
+
+# CSV 스트리밍 (Excel 호환을 위해 UTF-8 BOM 포함)
+def stream_csv(header, rows):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    buffer.write('\ufeff')
+    writer.writerow(header)
+    for i, row in enumerate(rows, start=1):
+        writer.writerow(row)
+        if i % EXPORT_CHUNK_SIZE == 0:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode()
+
+# 캠페인 목록 시트 (헤더, 행, 열 너비) - 조회 범위에 따라 조직/서비스 열 포함
+def export_request_sheet(org_id, service_id):
+    query = db.session.query(
         SendRequest.send_date,
         SendRequest.send_time,
         SendRequest.channel,
@@ -856,30 +3056,110 @@ def get_all_requests():
         Service.name.label('service_name'),
         Organization.name.label('org_name')
     ).join(Service, SendRequest.service_id == Service.id
-    ).join(Organization, Service.organization_id == Organization.id
-    ).order_by(SendRequest.send_date.desc(), SendRequest.created_at.desc()).all()
+    ).join(Organization, SendRequest.organization_id == Organization.id)
+
+    if org_id:
+        query = query.filter(SendRequest.organization_id == org_id)
+    query = filter_send_requests(query).order_by(
+        SendRequest.send_date.desc(), SendRequest.created_at.desc(), SendRequest.id.desc()
+    ).yield_per(EXPORT_CHUNK_SIZE)
+
+    header = ['발송일자', '발송시간', '채널', '캠페인명', '물량', '등록일시']
+    widths = [12, 10, 10, 30, 12, 18]
+    if service_id:
+        prefix = lambda r: []
+    elif org_id:
+        header, widths = ['서비스'] + header, [20] + widths
+        prefix = lambda r: [r.service_name]
+    else:
+        header, widths = ['조직', '서비스'] + header, [15, 20] + widths
+        prefix = lambda r: [r.org_name, r.service_name]
+
+    rows = (prefix(r) + [
+        r.send_date.strftime('%Y-%m-%d'),
+        r.send_time or '-',
+        CHANNEL_NAMES.get(r.channel, r.channel),
+        r.campaign_name or '-',
+        r.quantity,
+        r.created_at.strftime('%Y-%m-%d %H:%M')
+    ] for r in query)
+    return header, rows, widths
+
+# 변경요청 이력 시트 (헤더, 행, 열 너비)
+def export_change_request_sheet(org_id, service_id):
+    query = db.session.query(
+        ChangeRequest,
+        Service.name.label('service_name'),
+        Organization.name.label('org_name')
+    ).join(Service, ChangeRequest.service_id == Service.id
+    ).join(Organization, Service.organization_id == Organization.id)
 
-    channel_names = {
-        'naver': '네이버앱',
-        'payco': '페이앱',
-        'talktalk': '톡톡'
-    }
+    if org_id:
+        query = query.filter(Service.organization_id == org_id)
+    if service_id:
+        query = query.filter(ChangeRequest.service_id == service_id)
+    query = query.order_by(ChangeRequest.created_at.desc(), ChangeRequest.id.desc()).yield_per(EXPORT_CHUNK_SIZE)
+
+    header = ['요청일시', '유형', '조직', '서비스', '발송일자', '발송시간', '채널', '캠페인명', '물량',
+              '변경사유', '요청자', '상태', '처리일시', '처리자', '관리자메모']
+    widths = [18, 10, 15, 20, 12, 10, 10, 30, 12, 40, 12, 10, 18, 12, 30]
+    rows = ([
+        cr.created_at.strftime('%Y-%m-%d %H:%M'),
+        REQUEST_TYPE_NAMES.get(cr.request_type, cr.request_type),
+        org_name,
+        service_name,
+        cr.send_date.strftime('%Y-%m-%d') if cr.send_date else '-',
+        cr.send_time or '-',
+        CHANNEL_NAMES.get(cr.channel, cr.channel) if cr.channel else '-',
+        cr.campaign_name or '-',
+        cr.quantity if cr.quantity is not None else '-',
+        cr.reason,
+        cr.requester_name,
+        STATUS_NAMES.get(cr.status, cr.status),
+        cr.processed_at.strftime('%Y-%m-%d %H:%M') if cr.processed_at else '-',
+        cr.processed_by or '-',
+        cr.admin_memo or '-'
+    ] for cr, service_name, org_name in query)
+    return header, rows, widths
+
+# API: 캠페인 목록 / 변경요청 이력 내보내기 (DB에서 나눠 읽으며 스트리밍)
+# format: xlsx (캠페인목록 + 변경요청이력 시트) / csv (dataset=requests | change_requests)
+@bp.route('/api/export')
+def export_requests():
+    file_format = request.args.get('format', 'xlsx')
+    dataset = request.args.get('dataset', 'requests')
+    org_id = request.args.get('org_id', type=int)
+    service_id = request.args.get('service_id', type=int)
+    name = request.args.get('name', '전체')
+    today = kst_now().strftime('%Y-%m-%d')
+
+    if file_format == 'xlsx':
+        header, rows, widths = export_request_sheet(org_id, service_id)
+        change_header, change_rows, change_widths = export_change_request_sheet(org_id, service_id)
+        body = stream_xlsx([
+            ('캠페인목록', header, rows, widths),
+            ('변경요청이력', change_header, change_rows, change_widths),
+        ], chunk_rows=EXPORT_CHUNK_SIZE)
+        filename = f'{name}_캠페인목록_{today}.xlsx'
+        mimetype = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+    elif file_format == 'csv' and dataset in ('requests', 'change_requests'):
+        if dataset == 'requests':
+            header, rows, _ = export_request_sheet(org_id, service_id)
+            filename = f'{name}_캠페인목록_{today}.csv'
+        else:
+            header, rows, _ = export_change_request_sheet(org_id, service_id)
+            filename = f'{name}_변경요청이력_{today}.csv'
+        body = stream_csv(header, rows)
+        mimetype = 'text/csv; charset=utf-8'
+    else:
+        return jsonify({'success': False, 'message': '지원하지 않는 내보내기 형식입니다.'}), 400
 
-    return jsonify([{
-        'id': r.id,
-        'send_date': r.send_date.strftime('%Y-%m-%d'),
-        'send_time': r.send_time or '-',
-        'channel': r.channel,
-        'channel_name': channel_names.get(r.channel, r.channel),
-        'campaign_name': r.campaign_name or '-',
-        'quantity': r.quantity,
-        'created_at': r.created_at.strftime('%Y-%m-%d %H:%M'),
-        'service_name': r.service_name,
-        'org_name': r.org_name
-    } for r in requests])
+    response = Response(stream_with_context(body), mimetype=mimetype)
+    response.headers['Content-Disposition'] = f"attachment; filename*=UTF-8''{quote(filename)}"
+    return response
 
 # API: 신청 삭제
-@app.route('/api/request/<int:request_id>', methods=['DELETE'])
+@bp.route('/api/request/<int:request_id>', methods=['DELETE'])
 def delete_request(request_id):
     req = SendRequest.query.get(request_id)
     if not req:
@@ -887,29 +3167,31 @@ def delete_request(request_id):
 
     # 프리징 체크
     year_month = req.send_date.strftime('%Y-%m')
-    freeze = MonthlyFreeze.query.filter_by(year_month=year_month).first()
-    if freeze and freeze.is_frozen:
+    if is_frozen(year_month):
         return jsonify({'success': False, 'message': f'{year_month}은(는) 프리징되었습니다. 변경 요청을 이용해주세요.'}), 403
 
     db.session.delete(req)
+    adjust_usage(req.organization_id, year_month, req.channel, -req.quantity)
+    adjust_rollup(req.service_id, req.organization_id, year_month, req.channel, -req.quantity, -1)
+    record_change(req.organization_id, year_month, 'delete')
     db.session.commit()
 
     return jsonify({'success': True, 'message': '신청이 삭제되었습니다.'})
 
 # API: 프리징 상태 조회
-@app.route('/api/freeze/<year_month>')
+@bp.route('/api/freeze/<year_month>')
 def get_freeze_status(year_month):
-    freeze = MonthlyFreeze.query.filter_by(year_month=year_month).first()
+    freeze = cached_freezes().get(year_month)
     if freeze:
         return jsonify({
-            'is_frozen': freeze.is_frozen,
-            'frozen_at': freeze.frozen_at.strftime('%Y-%m-%d %H:%M') if freeze.frozen_at else None,
-            'frozen_by': freeze.frozen_by
+            'is_frozen': freeze['is_frozen'],
+            'frozen_at': freeze['frozen_at'].strftime('%Y-%m-%d %H:%M') if freeze['frozen_at'] else None,
+            'frozen_by': freeze['frozen_by']
         })
     return jsonify({'is_frozen': False})
 
 # API: 프리징 설정 (관리자)
-@app.route('/api/freeze', methods=['POST'])
+@bp.route('/api/freeze', methods=['POST'])
 def set_freeze():
     if not session.get('admin_logged_in'):
         return jsonify({'success': False, 'message': '권한이 없습니다.'}), 403
@@ -934,13 +3216,19 @@ def set_freeze():
         )
         db.session.add(freeze)
 
+    # 프리징된 월은 롤업을 SendRequest 기준으로 확정
+    if is_frozen:
+        rebuild_monthly_rollup(year_month)
+
+    record_change(0, year_month, 'freeze')
+    bump_cache_generation(CACHE_FREEZES)
     db.session.commit()
 
     status_text = '프리징' if is_frozen else '프리징 해제'
     return jsonify({'success': True, 'message': f'{year_month}이(가) {status_text}되었습니다.'})
 
 # API: 모든 프리징 목록 조회
-@app.route('/api/freezes')
+@bp.route('/api/freezes')
 def get_all_freezes():
     if not session.get('admin_logged_in'):
         return jsonify({'success': False, 'message': '권한이 없습니다.'}), 403
@@ -954,7 +3242,7 @@ def get_all_freezes():
     } for f in freezes])
 
 # API: 변경 요청 생성
-@app.route('/api/change-request', methods=['POST'])
+@bp.route('/api/change-request', methods=['POST'])
 def create_change_request():
     data = request.json
 
@@ -988,13 +3276,49 @@ def create_change_request():
 
     return jsonify({'success': True, 'message': '변경 요청이 등록되었습니다.'})
 
+# 변경 요청 목록 열 단위 응답 필드 (조회 컬럼 순서와 같음)
+CHANGE_REQUEST_COLUMNS = [
+    ('id', None),
+    ('year_month', None),
+    ('request_type', 'dict'),
+    ('send_date', 'day'),
+    ('send_time', None),
+    ('channel', 'dict'),
+    ('campaign_name', None),
+    ('quantity', None),
+    ('reason', None),
+    ('requester_name', None),
+    ('status', 'dict'),
+    ('admin_memo', None),
+    ('processed_by', None),
+    ('processed_at', 'minutes'),
+    ('created_at', 'minutes'),
+    ('service_name', 'dict'),
+    ('org_name', 'dict')
+]
+
 # API: 변경 요청 목록 조회
-@app.route('/api/change-requests')
+@bp.route('/api/change-requests')
 def get_change_requests():
     status_filter = request.args.get('status')
 
+    # ORM 객체 대신 필요한 컬럼만 조회
     query = db.session.query(
-        ChangeRequest,
+        ChangeRequest.id,
+        ChangeRequest.year_month,
+        ChangeRequest.request_type,
+        ChangeRequest.send_date,
+        ChangeRequest.send_time,
+        ChangeRequest.channel,
+        ChangeRequest.campaign_name,
+        ChangeRequest.quantity,
+        ChangeRequest.reason,
+        ChangeRequest.requester_name,
+        ChangeRequest.status,
+        ChangeRequest.admin_memo,
+        ChangeRequest.processed_by,
+        ChangeRequest.processed_at,
+        ChangeRequest.created_at,
         Service.name.label('service_name'),
         Organization.name.label('org_name')
     ).join(Service, ChangeRequest.service_id == Service.id
@@ -1003,51 +3327,137 @@ def get_change_requests():
     if status_filter:
         query = query.filter(ChangeRequest.status == status_filter)
 
-    change_requests = query.order_by(ChangeRequest.created_at.desc()).all()
-
-    request_type_names = {
-        'add': '신규 추가',
-        'modify': '수정',
-        'delete': '삭제'
-    }
+    date_from, date_to = date_filter_args()
+    channel = request.args.get('channel')
+    service_id = request.args.get('service_id', type=int)
 
-    status_names = {
-        'pending': '대기중',
-        'approved': '승인',
-        'rejected': '거부'
-    }
+    if date_from:
+        query = query.filter(ChangeRequest.created_at >= datetime.combine(date_from, datetime.min.time()))
+    if date_to:
+        query = query.filter(ChangeRequest.created_at < datetime.combine(date_to + timedelta(days=1), datetime.min.time()))
+    if channel:
+        query = query.filter(ChangeRequest.channel == channel)
+    if service_id:
+        query = query.filter(ChangeRequest.service_id == service_id)
 
-    channel_names = {
-        'naver': '네이버앱',
-        'payco': '페이앱',
-        'talktalk': '톡톡'
-    }
+    change_requests, next_cursor = paginate(
+        query, (ChangeRequest.created_at, ChangeRequest.id),
+        lambda row: (row.created_at, row.id)
+    )
 
-    return jsonify([{
-        'id': cr.id,
-        'year_month': cr.year_month,
-        'request_type': cr.request_type,
-        'request_type_name': request_type_names.get(cr.request_type, cr.request_type),
+    if is_columnar():
+        return paginated_response(columnar_payload(CHANGE_REQUEST_COLUMNS, change_requests, labels={
+            'request_type': REQUEST_TYPE_NAMES,
+            'channel': CHANNEL_NAMES,
+            'status': STATUS_NAMES
+        }), next_cursor)
+
+    dates = DateStrings()
+    return paginated_response([{
+        'id': change_id,
+        'year_month': year_month,
+        'request_type': request_type,
+        'request_type_name': REQUEST_TYPE_NAMES.get(request_type, request_type),
         'org_name': org_name,
         'service_name': service_name,
-        'send_date': cr.send_date.strftime('%Y-%m-%d') if cr.send_date else None,
-        'send_time': cr.send_time or '-',
-        'channel': cr.channel,
-        'channel_name': channel_names.get(cr.channel, cr.channel) if cr.channel else '-',
-        'campaign_name': cr.campaign_name or '-',
-        'quantity': cr.quantity,
-        'reason': cr.reason,
-        'requester_name': cr.requester_name,
-        'status': cr.status,
-        'status_name': status_names.get(cr.status, cr.status),
-        'admin_memo': cr.admin_memo,
-        'processed_by': cr.processed_by,
-        'processed_at': cr.processed_at.strftime('%Y-%m-%d %H:%M') if cr.processed_at else None,
-        'created_at': cr.created_at.strftime('%Y-%m-%d %H:%M')
-    } for cr, service_name, org_name in change_requests])
+        'send_date': dates[send_date] if send_date else None,
+        'send_time': send_time or '-',
+        'channel': channel,
+        'channel_name': CHANNEL_NAMES.get(channel, channel) if channel else '-',
+        'campaign_name': campaign_name or '-',
+        'quantity': quantity,
+        'reason': reason,
+        'requester_name': requester_name,
+        'status': status,
+        'status_name': STATUS_NAMES.get(status, status),
+        'admin_memo': admin_memo,
+        'processed_by': processed_by,
+        'processed_at': format_minutes(processed_at),
+        'created_at': format_minutes(created_at)
+    } for (change_id, year_month, request_type, send_date, send_time, channel, campaign_name, quantity, reason,
+           requester_name, status, admin_memo, processed_by, processed_at, created_at, service_name, org_name)
+        in change_requests], next_cursor)
+
+# 변경 요청이 신청 내역에 주는 영향 - [(서비스, 조직, 월, 채널, 물량 증감, 건수 증감)]
+# (수정은 기존 캠페인 차감 + 변경 후 캠페인 추가로 계산)
+def change_request_effects(change_req, original, organization_id):
+    if change_req.request_type == 'add':
+        return [(change_req.service_id, organization_id, change_req.send_date.strftime('%Y-%m'),
+                 change_req.channel, change_req.quantity, 1)]
+    if not original or change_req.request_type not in ('modify', 'delete'):
+        return []
+
+    effects = [(original.service_id, original.organization_id, original.send_date.strftime('%Y-%m'),
+                original.channel, -original.quantity, -1)]
+    if change_req.request_type == 'modify':
+        send_date = change_req.send_date or original.send_date
+        effects.append((original.service_id, original.organization_id, send_date.strftime('%Y-%m'),
+                        change_req.channel or original.channel, change_req.quantity or original.quantity, 1))
+    return effects
+
+# 변경 요청 내용을 캠페인에 반영
+def apply_change_request(change_req, original, organization_id):
+    if change_req.request_type == 'add':
+        # 신규 캠페인 추가
+        db.session.add(SendRequest(
+            service_id=change_req.service_id,
+            organization_id=organization_id,
+            send_date=change_req.send_date,
+            send_time=change_req.send_time,
+            channel=change_req.channel,
+            campaign_name=change_req.campaign_name,
+            quantity=change_req.quantity
+        ))
+    elif change_req.request_type == 'modify' and original:
+        # 기존 캠페인 수정
+        if change_req.send_date:
+            original.send_date = change_req.send_date
+        if change_req.send_time:
+            original.send_time = change_req.send_time
+        if change_req.channel:
+            original.channel = change_req.channel
+        if change_req.campaign_name:
+            original.campaign_name = change_req.campaign_name
+        if change_req.quantity:
+            original.quantity = change_req.quantity
+    elif change_req.request_type == 'delete' and original:
+        # 기존 캠페인 삭제
+        db.session.delete(original)
+
+# 변경 영향을 (조직, 월, 채널)별 순증감으로 합산
+def net_change_effects(effects):
+    net = {}
+    for _, organization_id, year_month, channel, quantity, _ in effects:
+        key = (organization_id, year_month, channel)
+        net[key] = net.get(key, 0) + quantity
+    return net
+
+# 변경 영향을 사용량 원장 / 롤업 / 변경 로그에 반영 (커밋은 호출한 쪽에서)
+# reserve=True면 물량이 늘어나는 그룹은 남은 물량 안에서만 원자적으로 예약하고, 실패 시 False 반환
+def apply_change_effects(effects, reserve=False):
+    net = net_change_effects(effects)
+    if reserve:
+        if not reserve_usages({key: delta for key, delta in net.items() if delta > 0}):
+            return False
+        adjust_usages({key: delta for key, delta in net.items() if delta < 0})
+    else:
+        adjust_usages(net)
+
+    rollup = {}
+    for service_id, organization_id, year_month, channel, quantity, count in effects:
+        key = (service_id, organization_id, year_month, channel)
+        total_quantity, total_count = rollup.get(key, (0, 0))
+        rollup[key] = (total_quantity + quantity, total_count + count)
+    adjust_rollups(rollup)
+
+    # 합계가 그대로인 그룹도 캠페인 내용이 바뀌었으므로 달력 캐시 무효화
+    for organization_id, year_month, _ in net:
+        bump_data_version(organization_id, year_month)
+        record_change(organization_id, year_month, 'approval')
+    return True
 
 # API: 변경 요청 처리 (승인/거부)
-@app.route('/api/change-request/<int:request_id>', methods=['PUT'])
+@bp.route('/api/change-request/<int:request_id>', methods=['PUT'])
 def process_change_request(request_id):
     if not session.get('admin_logged_in'):
         return jsonify({'success': False, 'message': '권한이 없습니다.'}), 403
@@ -1063,36 +3473,11 @@ def process_change_request(request_id):
 
     if action == 'approve':
         # 변경 요청 승인 처리
-        if change_req.request_type == 'add':
-            # 신규 캠페인 추가
-            new_request = SendRequest(
-                service_id=change_req.service_id,
-                send_date=change_req.send_date,
-                send_time=change_req.send_time,
-                channel=change_req.channel,
-                campaign_name=change_req.campaign_name,
-                quantity=change_req.quantity
-            )
-            db.session.add(new_request)
-        elif change_req.request_type == 'modify':
-            # 기존 캠페인 수정
-            original = SendRequest.query.get(change_req.original_request_id)
-            if original:
-                if change_req.send_date:
-                    original.send_date = change_req.send_date
-                if change_req.send_time:
-                    original.send_time = change_req.send_time
-                if change_req.channel:
-                    original.channel = change_req.channel
-                if change_req.campaign_name:
-                    original.campaign_name = change_req.campaign_name
-                if change_req.quantity:
-                    original.quantity = change_req.quantity
-        elif change_req.request_type == 'delete':
-            # 기존 캠페인 삭제
-            original = SendRequest.query.get(change_req.original_request_id)
-            if original:
-                db.session.delete(original)
+        organization_id = change_req.service.organization_id
+        original = SendRequest.query.get(change_req.original_request_id) if change_req.original_request_id else None
+        effects = change_request_effects(change_req, original, organization_id)
+        apply_change_request(change_req, original, organization_id)
+        apply_change_effects(effects)
 
         change_req.status = 'approved'
         change_req.admin_memo = admin_memo
@@ -1113,101 +3498,311 @@ def process_change_request(request_id):
 
     return jsonify({'success': False, 'message': '잘못된 요청입니다.'}), 400
 
-# 초기 데이터 생성
-@app.route('/init')
-def init_data():
-    db.drop_all()
-    db.create_all()
+CHANGE_REQUEST_BATCH_MAX_ITEMS = 500
 
-    # 조직 생성
-    orgs = {
-        'AD사업개발': Organization(name='AD사업개발'),
-        '내부제휴서비스': Organization(name='내부제휴서비스'),
-        '내자산': Organization(name='내자산'),
-        '대출': Organization(name='대출'),
-        '마이카': Organization(name='마이카'),
-        '마케팅스튜디오': Organization(name='마케팅스튜디오'),
-        '보험': Organization(name='보험'),
-        '외부제휴서비스': Organization(name='외부제휴서비스'),
-        '증권': Organization(name='증권'),
-        '카드CPA': Organization(name='카드CPA'),
-        '페이앱': Organization(name='페이앱'),
-        '현장결제': Organization(name='현장결제'),
+# API: 변경 요청 일괄 처리 (관리자)
+# 승인 대상의 (조직, 월, 채널)별 순증감을 계산해 물량을 초과하는 그룹에 물량을 늘리는 요청은
+# on_exceed에 따라 보류(flag, 대기 상태 유지) 또는 거부(reject)하고 나머지는 한 트랜잭션으로 처리
+@bp.route('/api/change-requests/process', methods=['POST'])
+def process_change_requests_batch():
+    if not session.get('admin_logged_in'):
+        return jsonify({'success': False, 'message': '권한이 없습니다.'}), 403
+
+    data = request.json or {}
+    items = data.get('items') or []
+    on_exceed = data.get('on_exceed', 'flag')
+
+    if on_exceed not in ('flag', 'reject'):
+        return jsonify({'success': False, 'message': '잘못된 초과 처리 방식입니다.'}), 400
+    if not isinstance(items, list):
+        return jsonify({'success': False, 'message': '처리 목록(items)은 배열이어야 합니다.'}), 400
+    if not items:
+        return jsonify({'success': False, 'message': '처리할 변경 요청이 없습니다.'}), 400
+    if len(items) > CHANGE_REQUEST_BATCH_MAX_ITEMS:
+        return jsonify({'success': False, 'message': f'한 번에 최대 {CHANGE_REQUEST_BATCH_MAX_ITEMS:,}건까지 처리할 수 있습니다.'}), 400
+
+    # 객체가 아닌 항목은 아래 항목 검증에서 항목별 오류로 처리
+    item_ids = [item.get('id') if isinstance(item, dict) else None for item in items]
+    request_ids = [request_id for request_id in item_ids if isinstance(request_id, int)]
+    change_reqs = {cr.id: cr for cr in ChangeRequest.query.filter(ChangeRequest.id.in_(request_ids))} if request_ids else {}
+    original_ids = [cr.original_request_id for cr in change_reqs.values() if cr.original_request_id]
+    originals = {sr.id: sr for sr in SendRequest.query.filter(SendRequest.id.in_(original_ids))} if original_ids else {}
+    services = cached_services()['by_id']
+
+    # 항목 검증 - 같은 요청/같은 캠페인이 한 번에 두 번 처리되지 않도록 함
+    results = [None] * len(items)
+    approvals = {}
+    rejections = []
+    seen_ids = set()
+    seen_originals = set()
+    for index, item in enumerate(items):
+        request_id = item_ids[index]
+        change_req = change_reqs.get(request_id) if isinstance(request_id, int) else None
+        action = item.get('action') if isinstance(item, dict) else None
+        message = None
+        if not isinstance(item, dict):
+            message = '잘못된 요청입니다.'
+        elif not change_req:
+            message = '변경 요청을 찾을 수 없습니다.'
+        elif change_req.id in seen_ids:
+            message = '중복된 변경 요청입니다.'
+        elif change_req.status != 'pending':
+            message = '이미 처리된 변경 요청입니다.'
+        elif action not in ('approve', 'reject'):
+            message = '잘못된 요청입니다.'
+        elif action == 'approve' and change_req.service_id not in services:
+            message = '서비스를 찾을 수 없습니다.'
+        elif action == 'approve' and change_req.original_request_id in seen_originals:
+            message = '같은 캠페인에 대한 다른 변경 요청과 함께 승인할 수 없습니다.'
+        if message:
+            results[index] = {'index': index, 'id': request_id, 'status': 'error', 'message': message}
+            continue
+
+        seen_ids.add(change_req.id)
+        if action == 'reject':
+            rejections.append(index)
+            continue
+        if change_req.original_request_id:
+            seen_originals.add(change_req.original_request_id)
+        organization_id = services[change_req.service_id]['organization_id']
+        original = originals.get(change_req.original_request_id)
+        approvals[index] = (change_req, original, organization_id,
+                            change_request_effects(change_req, original, organization_id))
+
+    # 영향받는 그룹의 물량 / 사용량을 한 번에 조회
+    groups = list({key for *_, effects in approvals.values() for key in net_change_effects(effects)})
+    quota_rows = db.session.query(
+        MonthlyQuota.organization_id,
+        MonthlyQuota.year_month,
+        MonthlyQuota.channel,
+        MonthlyQuota.total_quota,
+        func.coalesce(MonthlyUsage.requested, 0)
+    ).outerjoin(MonthlyUsage, db.and_(
+        MonthlyUsage.organization_id == MonthlyQuota.organization_id,
+        MonthlyUsage.year_month == MonthlyQuota.year_month,
+        MonthlyUsage.channel == MonthlyQuota.channel
+    )).filter(
+        tuple_(MonthlyQuota.organization_id, MonthlyQuota.year_month, MonthlyQuota.channel).in_(groups)
+    ).all() if groups else []
+    quota_by_group = {
+        (org_id, ym, channel): (total_quota, requested)
+        for org_id, ym, channel, total_quota, requested in quota_rows
     }
 
-    for org in orgs.values():
-        db.session.add(org)
-    db.session.commit()
+    # 초과 그룹에 물량을 더하는 요청을 제외하고 다시 계산 (수정 요청은 다른 그룹의 차감분도 함께 빠지므로 반복)
+    exceeded = {}
+    while True:
+        net = net_change_effects([effect for *_, effects in approvals.values() for effect in effects])
+        over = {}
+        for key, delta in net.items():
+            total_quota, requested = quota_by_group.get(key, (0, 0))
+            if delta > 0 and requested + delta > total_quota:
+                over[key] = {'total_quota': total_quota, 'requested': requested, 'net_delta': delta}
+        if not over:
+            break
+        for key, group in over.items():
+            exceeded.setdefault(key, group)
+        for index, (change_req, _, _, effects) in list(approvals.items()):
+            increases = [key for key, delta in net_change_effects(effects).items() if delta > 0 and key in over]
+            if not increases:
+                continue
+            del approvals[index]
+            org_id, year_month, channel = increases[0]
+            total_quota, requested = quota_by_group.get(increases[0], (0, 0))
+            results[index] = {
+                'index': index,
+                'id': change_req.id,
+                'status': 'rejected' if on_exceed == 'reject' else 'flagged',
+                'message': f'{year_month} {channel} 채널 물량을 초과합니다. 남은 물량: {total_quota - requested:,}건'
+            }
+            if on_exceed == 'reject':
+                rejections.append(index)
+
+    processed_at = kst_now()
+    try:
+        for index, (change_req, original, organization_id, effects) in approvals.items():
+            apply_change_request(change_req, original, organization_id)
+            change_req.status = 'approved'
+            change_req.admin_memo = items[index].get('admin_memo', '')
+            change_req.processed_by = '관리자'
+            change_req.processed_at = processed_at
+        # 조회 이후 다른 신청이 들어온 경우 대비해 늘어나는 그룹은 원자적으로 예약
+        if not apply_change_effects([effect for *_, effects in approvals.values() for effect in effects], reserve=True):
+            return conflict_response()
+
+        for index in rejections:
+            change_req = change_reqs[items[index]['id']]
+            change_req.status = 'rejected'
+            change_req.admin_memo = items[index].get('admin_memo', '')
+            change_req.processed_by = '관리자'
+            change_req.processed_at = processed_at
+        db.session.commit()
+    except OperationalError:
+        return conflict_response()
+
+    # 커밋 후 만료된 ORM 객체를 다시 읽지 않도록 요청 본문의 id 사용
+    for index in approvals:
+        results[index] = {'index': index, 'id': items[index]['id'], 'status': 'approved', 'message': '변경 요청이 승인되었습니다.'}
+    for index in rejections:
+        if results[index] is None:
+            results[index] = {'index': index, 'id': items[index]['id'], 'status': 'rejected', 'message': '변경 요청이 거부되었습니다.'}
+
+    counts = {status: 0 for status in ('approved', 'rejected', 'flagged', 'error')}
+    for result in results:
+        counts[result['status']] += 1
+    return jsonify({
+        'success': counts['flagged'] == 0 and counts['error'] == 0,
+        'message': f"승인 {counts['approved']:,}건, 거부 {counts['rejected']:,}건, 보류 {counts['flagged']:,}건, 오류 {counts['error']:,}건",
+        'approved_count': counts['approved'],
+        'rejected_count': counts['rejected'],
+        'flagged_count': counts['flagged'],
+        'error_count': counts['error'],
+        'exceeded_groups': [{
+            'organization_id': org_id,
+            'year_month': ym,
+            'channel': channel,
+            **group,
+            'remaining': group['total_quota'] - group['requested']
+        } for (org_id, ym, channel), group in exceeded.items()],
+        'results': results
+    })
 
-    # 서비스 생성
-    services = [
-        # AD사업개발
-        Service(name='프리미엄패키지', organization_id=orgs['AD사업개발'].id, manager_name='박종호'),
-
-        # 내부제휴서비스
-        Service(name='사용자마케팅', organization_id=orgs['내부제휴서비스'].id, manager_name='유진'),
-
-        # 내자산
-        Service(name='내자산 신규 등록', organization_id=orgs['내자산'].id, manager_name='김정희'),
-
-        # 대출
-        Service(name='신용대출비교', organization_id=orgs['대출'].id, manager_name='정채연'),
-        Service(name='신용대환대출', organization_id=orgs['대출'].id, manager_name='정채연'),
-        Service(name='신용점수', organization_id=orgs['대출'].id, manager_name='서원교'),
-        Service(name='신차리스', organization_id=orgs['대출'].id, manager_name='허호필'),
-        Service(name='전월세대출비교', organization_id=orgs['대출'].id, manager_name='정채연'),
-        Service(name='주택담보대출비교', organization_id=orgs['대출'].id, manager_name='정채연'),
-        Service(name='중고차론', organization_id=orgs['대출'].id, manager_name='허호필'),
-
-        # 마이카
-        Service(name='내차등록', organization_id=orgs['마이카'].id, manager_name='허호필'),
-
-        # 마케팅스튜디오
-        Service(name='마케팅부스팅', organization_id=orgs['마케팅스튜디오'].id, manager_name='오인숙'),
-        Service(name='애플', organization_id=orgs['마케팅스튜디오'].id, manager_name='최승민'),
-        Service(name='프로모션', organization_id=orgs['마케팅스튜디오'].id, manager_name='최용우'),
-
-        # 보험
-        Service(name='내자산 신규 등록(보험)', organization_id=orgs['보험'].id, manager_name='조은수'),
-        Service(name='보험가입', organization_id=orgs['보험'].id, manager_name='이은혜'),
-        Service(name='자동차보험중개', organization_id=orgs['보험'].id, manager_name='강경필'),
-        Service(name='해외여행보험중개', organization_id=orgs['보험'].id, manager_name='강경필'),
-
-        # 외부제휴서비스
-        Service(name='외부제휴_서비스', organization_id=orgs['외부제휴서비스'].id, manager_name='임태경'),
-        Service(name='외부제휴_쇼핑', organization_id=orgs['외부제휴서비스'].id, manager_name='임태경'),
-
-        # 증권
-        Service(name='증권토론', organization_id=orgs['증권'].id, manager_name='정인아'),
-
-        # 카드CPA
-        Service(name='KB카드', organization_id=orgs['카드CPA'].id, manager_name='강창민'),
-        Service(name='네이버페이 머니카드', organization_id=orgs['카드CPA'].id, manager_name='정민주'),
-        Service(name='롯데카드 CPA', organization_id=orgs['카드CPA'].id, manager_name='강창민'),
-        Service(name='삼성카드 제휴 CPA', organization_id=orgs['카드CPA'].id, manager_name='강창민'),
-        Service(name='신한카드 CPA', organization_id=orgs['카드CPA'].id, manager_name='강창민'),
-        Service(name='신한카드 제휴 CPA', organization_id=orgs['카드CPA'].id, manager_name='강창민'),
-        Service(name='우리카드 CPA', organization_id=orgs['카드CPA'].id, manager_name='강창민'),
-        Service(name='현대카드 CPA', organization_id=orgs['카드CPA'].id, manager_name='강창민'),
-
-        # 페이앱
-        Service(name='페이앱설치', organization_id=orgs['페이앱'].id, manager_name='이재형'),
-
-        # 현장결제
-        Service(name='오프라인 현장결제', organization_id=orgs['현장결제'].id, manager_name='신현확'),
-        Service(name='오프라인 해외결제', organization_id=orgs['현장결제'].id, manager_name='김민지'),
-    ]
+# 운영 지표 (Prometheus)
+# - 요청별 지연시간 / SQL 실행 횟수·시간 / 응답 크기를 엔드포인트별 히스토그램으로 수집
+# - 워커마다 METRICS_DIR에 자기 파일을 1초마다 기록하고 /metrics 조회 시 합산 (gunicorn 멀티 워커 대응)
+# - 스트리밍 응답(내보내기, 변경 스트림)은 헤더를 보낸 시점까지만 측정되고 응답 크기는 제외됨
+METRICS_DIR = os.environ.get('METRICS_DIR') or os.path.join(tempfile.gettempdir(), 'noti_plan_metrics')
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN')
+
+metrics = Metrics(METRICS_DIR)
+metrics.histogram('noti_plan_http_request_duration_seconds', '엔드포인트별 요청 처리 시간',
+                  (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10))
+metrics.counter('noti_plan_http_requests_total', '엔드포인트 / 상태 코드별 요청 수')
+metrics.histogram('noti_plan_http_response_bytes', '엔드포인트별 응답 본문 크기',
+                  (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304))
+metrics.histogram('noti_plan_sql_statements_per_request', '요청당 SQL 실행 횟수',
+                  (0, 1, 2, 3, 5, 10, 20, 50, 100))
+metrics.counter('noti_plan_sql_statements_total', '엔드포인트별 SQL 실행 횟수')
+metrics.counter('noti_plan_sql_duration_seconds_total', '엔드포인트별 SQL 실행 시간 합계')
+metrics.counter('noti_plan_cache_requests_total', '캐시 조회 수 (result=hit|miss)')
+
+@metrics.collector
+def collect_cache_metrics():
+    for name, cache in (('reference', reference_cache), ('calendar', calendar_cache)):
+        metrics.set_total('noti_plan_cache_requests_total', (('cache', name), ('result', 'hit')), cache.hits)
+        metrics.set_total('noti_plan_cache_requests_total', (('cache', name), ('result', 'miss')), cache.misses)
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info['metrics_query_start'] = time.perf_counter()
+
+@event.listens_for(Engine, 'after_cursor_execute')
+def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if has_request_context() and 'metrics_started' in g:
+        g.metrics_sql_count += 1
+        g.metrics_sql_time += time.perf_counter() - conn.info.pop('metrics_query_start')
+
+@bp.before_app_request
+def start_request_metrics():
+    g.metrics_started = time.perf_counter()
+    g.metrics_sql_count = 0
+    g.metrics_sql_time = 0.0
+
+@bp.after_app_request
+def record_request_metrics(response):
+    if 'metrics_started' not in g:
+        return response
+    # 블루프린트 접두사(noti_plan.)는 빼고 뷰 함수 이름만 라벨로 사용
+    endpoint = (('endpoint', request.endpoint.rpartition('.')[2] if request.endpoint else 'unmatched'),)
+    metrics.observe('noti_plan_http_request_duration_seconds', endpoint, time.perf_counter() - g.metrics_started)
+    metrics.inc('noti_plan_http_requests_total', endpoint + (('method', request.method), ('status', response.status_code)))
+    if not response.is_streamed:
+        metrics.observe('noti_plan_http_response_bytes', endpoint, response.content_length or 0)
+    metrics.observe('noti_plan_sql_statements_per_request', endpoint, g.metrics_sql_count)
+    metrics.inc('noti_plan_sql_statements_total', endpoint, g.metrics_sql_count)
+    metrics.inc('noti_plan_sql_duration_seconds_total', endpoint, g.metrics_sql_time)
+    return response
+
+# API: 운영 지표 (Prometheus 텍스트 형식, METRICS_TOKEN 설정 시 Bearer 토큰 필요)
+@bp.route('/metrics')
+def get_metrics():
+    if METRICS_TOKEN and request.headers.get('Authorization') != f'Bearer {METRICS_TOKEN}':
+        return jsonify({'success': False, 'message': '권한이 없습니다.'}), 403
 
-    db.session.add_all(services)
-    db.session.commit()
+    totals = metrics.aggregate()
+    cache_requests = {}
+    for (name, labels), value in totals.items():
+        if name == 'noti_plan_cache_requests_total':
+            labels = dict(labels)
+            hit, total = cache_requests.get(labels['cache'], (0, 0))
+            cache_requests[labels['cache']] = (hit + (value if labels['result'] == 'hit' else 0), total + value)
+    hit_ratio = [((('cache', cache),), hit / total) for cache, (hit, total) in sorted(cache_requests.items()) if total]
+
+    body = metrics.render(totals, gauges=[('noti_plan_cache_hit_ratio', '캐시 적중률 (전체 워커 누적)', hit_ratio)])
+    return Response(body, mimetype='text/plain', content_type='text/plain; version=0.0.4; charset=utf-8')
+
+# 응답 압축 (Accept-Encoding 협상) - COMPRESS_MIN_SIZE 바이트 이상인 JSON / 텍스트 응답만
+# brotli 패키지가 설치되어 있으면 br을 우선 사용하고, 스트리밍 응답(SSE, 내보내기)과 정적 파일은 제외
+# (지표 훅보다 나중에 등록되어 먼저 실행되므로 응답 크기 지표는 압축 후 크기)
+COMPRESS_MIN_SIZE = int(os.environ.get('COMPRESS_MIN_SIZE', 1024))
+COMPRESS_MIMETYPES = {
+    'application/json', 'application/javascript', 'text/css', 'text/csv', 'text/html', 'text/javascript', 'text/plain'
+}
+COMPRESS_ENCODINGS = (['br'] if brotli else []) + ['gzip']
+GZIP_LEVEL = 5
+BROTLI_QUALITY = 5
+
+def compress_body(body, encoding):
+    if encoding == 'br':
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)  # wbits 31 = gzip 헤더
+    return compressor.compress(body) + compressor.flush()
+
+@bp.after_app_request
+def compress_response(response):
+    if (response.status_code != 200 or response.direct_passthrough or response.is_streamed
+            or 'Content-Encoding' in response.headers or response.mimetype not in COMPRESS_MIMETYPES):
+        return response
+    response.vary.add('Accept-Encoding')
+    if (response.content_length or 0) < COMPRESS_MIN_SIZE:
+        return response
+    encoding = request.accept_encodings.best_match(COMPRESS_ENCODINGS)
+    if not encoding:
+        return response
+
+    response.set_data(compress_body(response.get_data(), encoding))
+    response.headers['Content-Encoding'] = encoding
+    # 압축된 표현은 바이트가 달라지므로 강한 ETag를 약한 ETag로 (If-None-Match는 약한 비교)
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+# 앱 생성 - 설정과 확장 / 블루프린트 등록만 하고 DB에는 접속하지 않음
+# (스키마는 `flask --app app db upgrade`로 배포 시 한 번 적용하므로 워커 시작은 import 시간뿐)
+def create_app(config=None):
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = database_uri()
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    app.config['SECRET_KEY'] = 'noti_plan_secret_key_2848'
+    app.config.update(config or {})
+    if 'SQLALCHEMY_ENGINE_OPTIONS' not in app.config:
+        app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options(app.config['SQLALCHEMY_DATABASE_URI'], db_profile())
+
+    db.init_app(app)
+    with app.app_context():
+        if db.engine.dialect.name == 'sqlite':
+            event.listen(db.engine, 'connect', configure_sqlite_connection)
 
-    return jsonify({'success': True, 'message': '초기 데이터가 생성되었습니다.'})
+    app.json = create_json_provider(app, app.config.get('JSON_PROVIDER'))
+    app.register_blueprint(bp)
+    return app
+
+# gunicorn app:app / flask --app app 진입점
+app = create_app()
 
 if __name__ == '__main__':
+    # 로컬 개발 서버는 시작 시 스키마도 최신으로 맞춤
     with app.app_context():
-        db.create_all()
-    app.run(debug=True, port=5000)
-else:
-    # Production: Initialize database when imported by gunicorn
-    with app.app_context():
-        db.create_all()
\ No newline at end of file
+        run_migrations()
+    app.run(debug=True, port=5000)
\ No newline at end of file
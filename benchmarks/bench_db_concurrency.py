@@ -0,0 +1,161 @@
+# DB 동시 쓰기 처리량 벤치마크
+#
+# 여러 프로세스가 같은 DB에 동시에 캠페인 신청(POST /api/request)과 달력 조회를 섞어 보내고,
+# 워커 수별 쓰기/읽기 처리량, 지연시간, 실패(database is locked 등) 건수를 측정합니다.
+# SQLite는 설정마다 새 DB 파일을 만들어 롤백 저널(DELETE + synchronous=FULL)과
+# WAL(+ synchronous=NORMAL)을 비교하고, --database-url을 주면 해당 DB(PostgreSQL 등)만 측정합니다.
+#
+# 사용법:
+#   python benchmarks/bench_db_concurrency.py --workers 1,2,4,8 --duration 10
+#   python benchmarks/bench_db_concurrency.py --configs wal --workers 8 --read-ratio 0.8
+#   DB_POOL_SIZE=10 python benchmarks/bench_db_concurrency.py --database-url postgresql://localhost/noti_plan_bench
+import argparse
+import multiprocessing
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from collections import Counter
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+YEAR_MONTH = '2030-01'
+CHANNELS = ['naver', 'payco', 'talktalk']
+
+# 설정 이름 -> 워커 프로세스 환경 변수
+SQLITE_CONFIGS = {
+    'rollback-journal': {'SQLITE_JOURNAL_MODE': 'DELETE', 'SQLITE_SYNCHRONOUS': 'FULL'},
+    'wal': {'SQLITE_JOURNAL_MODE': 'WAL', 'SQLITE_SYNCHRONOUS': 'NORMAL'},
+}
+
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--workers', default='1,2,4,8', help='동시 워커 프로세스 수 목록 (쉼표 구분)')
+    parser.add_argument('--duration', type=float, default=10, help='측정 시간 (초)')
+    parser.add_argument('--read-ratio', type=float, default=0.5, help='요청 중 달력 조회 비율')
+    parser.add_argument('--configs', default=','.join(SQLITE_CONFIGS), help='비교할 SQLite 설정 (쉼표 구분)')
+    parser.add_argument('--database-url', help='SQLite 대신 측정할 DB (미리 만든 빈 DB, 데이터를 지우고 다시 생성)')
+    return parser.parse_args()
+
+
+# app은 import 시점의 DATABASE_URL로 엔진을 만들므로 설정마다 별도 프로세스에서 준비
+def setup(database_url, env):
+    os.environ.update(env)
+    os.environ['DATABASE_URL'] = database_url
+    from app import app, db, run_migrations, seed_reference, MonthlyQuota, Organization, Service
+
+    with app.app_context():
+        db.drop_all()
+        run_migrations()
+        seed_reference()
+        # 신청이 물량에 막히지 않도록 충분히 큰 물량
+        db.session.execute(MonthlyQuota.__table__.insert(), [{
+            'organization_id': org_id,
+            'year_month': YEAR_MONTH,
+            'channel': channel,
+            'total_quota': 10 ** 12
+        } for org_id, in db.session.query(Organization.id) for channel in CHANNELS])
+        db.session.commit()
+        return (
+            [org_id for org_id, in db.session.query(Organization.id)],
+            [service_id for service_id, in db.session.query(Service.id)]
+        )
+
+
+def worker(payload):
+    database_url, env, org_ids, service_ids, start_at, duration, read_ratio, seed = payload
+    os.environ.update(env)
+    os.environ['DATABASE_URL'] = database_url
+    from app import app
+
+    client = app.test_client()
+    rng = random.Random(seed)
+    latencies = {'write': [], 'read': []}
+    statuses = Counter()
+
+    time.sleep(max(0, start_at - time.time()))
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        if rng.random() < read_ratio:
+            kind = 'read'
+            response = client.get(f'/api/calendar/{rng.choice(org_ids)}/{YEAR_MONTH}')
+        else:
+            kind = 'write'
+            response = client.post('/api/request', json={
+                'service_id': rng.choice(service_ids),
+                'send_date': f'{YEAR_MONTH}-{rng.randrange(1, 29):02d}',
+                'send_time': '10:00',
+                'channel': rng.choice(CHANNELS),
+                'campaign_name': 'concurrency',
+                'quantity': 1000
+            })
+        elapsed = (time.perf_counter() - started) * 1000
+        if response.status_code < 300:
+            latencies[kind].append(elapsed)
+        statuses[(kind, response.status_code)] += 1
+    return latencies, statuses
+
+
+def percentile(samples, p):
+    return samples[min(len(samples) - 1, int(len(samples) * p))] if samples else 0
+
+
+def run(database_url, env, workers, args, org_ids, service_ids):
+    # 워커가 app을 import하는 시간을 측정에서 빼기 위해 같은 시각에 시작
+    start_at = time.time() + 3 + workers * 0.5
+    payloads = [(database_url, env, org_ids, service_ids, start_at, args.duration, args.read_ratio, seed)
+                for seed in range(workers)]
+    with multiprocessing.get_context('spawn').Pool(workers) as pool:
+        results = pool.map(worker, payloads)
+
+    writes = sorted(sum((latencies['write'] for latencies, _ in results), []))
+    reads = sorted(sum((latencies['read'] for latencies, _ in results), []))
+    statuses = sum((s for _, s in results), Counter())
+    errors = sum(count for (_, status), count in statuses.items() if status >= 300)
+    return {
+        'writes_per_s': len(writes) / args.duration,
+        'reads_per_s': len(reads) / args.duration,
+        'write_p50': statistics.median(writes) if writes else 0,
+        'write_p95': percentile(writes, 0.95),
+        'read_p95': percentile(reads, 0.95),
+        'errors': errors,
+        'statuses': {f'{kind} {status}': count for (kind, status), count in sorted(statuses.items())}
+    }
+
+
+def main():
+    args = parse_args()
+    worker_counts = [int(w) for w in args.workers.split(',')]
+
+    if args.database_url:
+        targets = [(args.database_url.split('@')[-1], args.database_url, {})]
+    else:
+        directory = tempfile.mkdtemp()
+        targets = []
+        for name in args.configs.split(','):
+            if name not in SQLITE_CONFIGS:
+                sys.exit(f'알 수 없는 설정: {name} ({", ".join(SQLITE_CONFIGS)})')
+            targets.append((name, f'sqlite:///{os.path.join(directory, name)}.db', SQLITE_CONFIGS[name]))
+
+    print(f'{"config":<18}{"workers":>8}{"write/s":>10}{"read/s":>10}{"write p50":>11}{"write p95":>11}'
+          f'{"read p95":>10}{"errors":>8}')
+    for name, database_url, env in targets:
+        for workers in worker_counts:
+            # 워커 수마다 같은 초기 상태에서 시작
+            with multiprocessing.get_context('spawn').Pool(1) as pool:
+                org_ids, service_ids = pool.apply(setup, (database_url, env))
+            stats = run(database_url, env, workers, args, org_ids, service_ids)
+            print(f'{name:<18}{workers:>8}{stats["writes_per_s"]:>10.1f}{stats["reads_per_s"]:>10.1f}'
+                  f'{stats["write_p50"]:>9.1f}ms{stats["write_p95"]:>9.1f}ms{stats["read_p95"]:>8.1f}ms'
+                  f'{stats["errors"]:>8}')
+            if stats['errors']:
+                print(f'  {stats["statuses"]}')
+
+
+if __name__ == '__main__':
+    main()
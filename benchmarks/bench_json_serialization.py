@@ -0,0 +1,132 @@
+# 목록 응답 직렬화 / 압축 벤치마크
+#
+# 캠페인 목록 10만 행(전체 목록 API와 같은 쿼리)을 대상으로 단계별 시간을 측정합니다.
+#   행 변환: 기존 방식(Row 속성 조회 + strftime + 인라인 채널명 dict) vs send_request_items (튜플 언패킹 + isoformat + 날짜 재사용)
+#   직렬화: Flask 기본 JSON 제공자 vs orjson 제공자
+#   압축: gzip / brotli(설치된 경우) 압축 시간과 전송 바이트
+# 마지막으로 실제 API(한 페이지, limit=1000)를 Accept-Encoding별로 호출해 응답 크기와 지연시간을 비교하고,
+# 행 형식과 열 형식(?format=columnar)의 응답 크기, 서버 지연시간, 클라이언트 파싱(json.loads) 시간을 비교합니다.
+#
+# 사용법:
+#   python benchmarks/bench_json_serialization.py --rows 100000
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=100000, help='직렬화할 목록 행 수')
+    parser.add_argument('--iterations', type=int, default=5, help='단계별 반복 횟수')
+    parser.add_argument('--db', help='SQLite 파일 경로 (기본: 임시 파일)')
+    return parser.parse_args()
+
+
+def measure(fn, iterations):
+    samples = []
+    result = None
+    for _ in range(iterations):
+        started = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples), result
+
+
+# 변경 전 목록 행 변환 (비교 기준)
+def legacy_items(rows):
+    channel_names = {
+        'naver': '네이버앱',
+        'payco': '페이앱',
+        'talktalk': '톡톡'
+    }
+    return [{
+        'id': r.id,
+        'send_date': r.send_date.strftime('%Y-%m-%d'),
+        'send_time': r.send_time or '-',
+        'channel': r.channel,
+        'channel_name': channel_names.get(r.channel, r.channel),
+        'campaign_name': r.campaign_name or '-',
+        'quantity': r.quantity,
+        'created_at': r.created_at.strftime('%Y-%m-%d %H:%M'),
+        'service_name': r.service_name,
+        'org_name': r.org_name
+    } for r in rows]
+
+
+def main():
+    args = parse_args()
+    db_path = args.db or os.path.join(tempfile.mkdtemp(), 'bench_json.db')
+    os.environ['DATABASE_URL'] = f'sqlite:///{db_path}'
+
+    from flask.json.provider import DefaultJSONProvider
+    from app import (app, db, brotli, compress_body, rebuild_monthly_usage, run_migrations, seed_generated,
+                     send_request_items, send_request_list_query, SendRequest)
+    from json_provider import OrjsonProvider, orjson
+
+    with app.app_context():
+        db.drop_all()
+        run_migrations()
+        seed_generated(20, 200, args.rows, args.rows // 20, start_month='2030-01', quota=10 ** 12)
+        rebuild_monthly_usage()
+        db.session.commit()
+
+        rows = send_request_list_query().order_by(
+            SendRequest.send_date.desc(), SendRequest.created_at.desc(), SendRequest.id.desc()
+        ).all()
+        print(f'{len(rows):,}행\n')
+
+        print(f'{"단계":<36}{"시간":>12}{"바이트":>14}')
+        legacy_ms, items = measure(lambda: legacy_items(rows), args.iterations)
+        print(f'{"행 변환 - 기존 (strftime)":<34}{legacy_ms:>10.1f}ms')
+        new_ms, new_items = measure(lambda: send_request_items(rows), args.iterations)
+        print(f'{"행 변환 - send_request_items":<34}{new_ms:>10.1f}ms')
+        assert items == new_items, '행 변환 결과가 다릅니다.'
+
+        providers = [('Flask 기본', DefaultJSONProvider(app))]
+        if orjson is not None:
+            providers.append(('orjson', OrjsonProvider(app)))
+        bodies = {}
+        for name, provider in providers:
+            ms, body = measure(lambda: provider.response(items).get_data(), args.iterations)
+            bodies[name] = body
+            print(f'{"직렬화 - " + name:<34}{ms:>10.1f}ms{len(body):>14,}')
+
+        body = bodies[providers[-1][0]]
+        for encoding in (['br'] if brotli else []) + ['gzip']:
+            ms, compressed = measure(lambda: compress_body(body, encoding), args.iterations)
+            print(f'{"압축 - " + encoding:<34}{ms:>10.1f}ms{len(compressed):>14,}')
+        if brotli is None:
+            print('압축 - br (건너뜀 - brotli가 설치되어 있지 않음)')
+
+    # 실제 API 한 페이지 (행 변환 + 직렬화 + 압축 포함)
+    client = app.test_client()
+    print(f'\n{"GET /api/requests/all?limit=1000":<36}{"p50":>12}{"바이트":>14}')
+    for accept in ['identity', 'gzip'] + (['br'] if brotli else []):
+        def call():
+            response = client.get('/api/requests/all?limit=1000', headers={'Accept-Encoding': accept})
+            return response.get_data()
+        ms, data = measure(call, args.iterations * 4)
+        print(f'{"Accept-Encoding: " + accept:<34}{ms:>10.1f}ms{len(data):>14,}')
+
+    # 행 형식 vs 열 형식 (목록 한 페이지, 달력 전체 조직 한 달)
+    year_month = '2030-01'
+    print(f'\n{"응답 형식":<32}{"p50":>12}{"바이트":>14}{"gzip":>12}{"파싱":>10}')
+    for path in ['/api/requests/all?limit=1000', '/api/change-requests?limit=1000', f'/api/calendar/all/{year_month}']:
+        for label, url in [('행', path), ('열', path + ('&' if '?' in path else '?') + 'format=columnar')]:
+            def call():
+                return client.get(url, headers={'Accept-Encoding': 'identity'}).get_data()
+            ms, data = measure(call, args.iterations * 4)
+            gzipped = len(compress_body(data, 'gzip'))
+            parse_ms, _ = measure(lambda: json.loads(data), args.iterations * 4)
+            print(f'{label + " " + path.split("?")[0]:<34}{ms:>10.1f}ms{len(data):>14,}{gzipped:>12,}{parse_ms:>8.1f}ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,298 @@
+# 주요 API 라우트 지연시간 / 처리량 벤치마크
+#
+# 지정한 규모의 합성 데이터(조직, 서비스, 물량, 캠페인, 변경 요청)를 SQLite에 생성한 뒤
+# Flask test client와 실제 gunicorn 서버로 각 라우트를 호출해 p50/p95/p99 지연시간과 처리량을 측정합니다.
+# 결과는 JSON으로 저장하고, 저장된 기준(baseline)과 비교해 허용 범위를 넘게 느려지면 실패로 종료합니다.
+#
+# 사용법:
+#   # 기준 저장 (변경 전 코드에서)
+#   python benchmarks/bench_routes.py --db /tmp/bench_routes.db --save-baseline benchmarks/baseline.json
+#   # 변경 후 같은 데이터로 다시 측정해 비교 (p95 20% 이상 느려지거나 처리량 20% 이상 줄면 실패)
+#   python benchmarks/bench_routes.py --db /tmp/bench_routes.db --reuse --baseline benchmarks/baseline.json
+#   # 대규모 데이터
+#   python benchmarks/bench_routes.py --orgs 100 --services 2000 --requests 5000000 --change-requests 200000
+import argparse
+import http.client
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+CHANNELS = ['naver', 'payco', 'talktalk']
+
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--orgs', type=int, default=20)
+    parser.add_argument('--services', type=int, default=200, help='전체 서비스 수')
+    parser.add_argument('--requests', type=int, default=200000, help='SendRequest 행 수')
+    parser.add_argument('--change-requests', type=int, default=10000, help='ChangeRequest 행 수')
+    parser.add_argument('--months', type=int, default=12, help='데이터를 분포시킬 개월 수 (2030-01부터)')
+    parser.add_argument('--db', help='SQLite 파일 경로 (기본: 임시 파일)')
+    parser.add_argument('--reuse', action='store_true', help='--db에 이미 생성된 데이터를 그대로 사용')
+    parser.add_argument('--iterations', type=int, default=200, help='라우트별 요청 수')
+    parser.add_argument('--mode', choices=['client', 'gunicorn', 'both'], default='both')
+    parser.add_argument('--workers', type=int, default=2, help='gunicorn 워커 수')
+    parser.add_argument('--threads', type=int, default=8, help='gunicorn 워커당 스레드 수')
+    parser.add_argument('--concurrency', type=int, default=8, help='gunicorn 측정 시 동시 클라이언트 수')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--output', default='bench_routes.json', help='결과 JSON 경로')
+    parser.add_argument('--baseline', help='비교할 기준 JSON 경로')
+    parser.add_argument('--save-baseline', help='이번 결과를 기준으로 저장할 경로')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='허용 성능 저하 비율')
+    return parser.parse_args()
+
+
+def month_list(months):
+    return [f'{2030 + i // 12}-{i % 12 + 1:02d}' for i in range(months)]
+
+
+def seed(args):
+    from app import (app, db, bump_cache_generation, rebuild_monthly_rollup, rebuild_monthly_usage,
+                     run_migrations, seed_generated, CACHE_FREEZES, CACHE_ORGANIZATIONS, CACHE_SERVICES)
+
+    def progress(table_name, inserted):
+        print(f'\r{table_name} {inserted:,}', end='', flush=True)
+
+    with app.app_context():
+        db.drop_all()
+        run_migrations()
+        # 신청이 물량에 막히지 않도록 물량은 충분히 크게
+        seed_generated(args.orgs, args.services, args.requests, args.change_requests, args.months,
+                       start_month='2030-01', quota=10 ** 12, progress=progress)
+        print()
+        rebuild_monthly_usage()
+        rebuild_monthly_rollup()
+        bump_cache_generation(CACHE_ORGANIZATIONS, CACHE_SERVICES, CACHE_FREEZES)
+        db.session.commit()
+
+
+def load_targets():
+    from app import app, db, Organization, Service
+
+    with app.app_context():
+        org_ids = [org_id for org_id, in db.session.query(Organization.id)]
+        service_ids = [service_id for service_id, in db.session.query(Service.id)]
+    return org_ids, service_ids
+
+
+# 라우트 이름 -> 요청 생성 함수 (rng -> (메서드, 경로, JSON 본문))
+def build_routes(org_ids, service_ids, year_months):
+    return {
+        'GET /api/calendar/<org_id>/<year_month>': lambda rng: (
+            'GET', f'/api/calendar/{rng.choice(org_ids)}/{rng.choice(year_months)}', None),
+        'GET /api/calendar/all/<year_month>?detail=summary': lambda rng: (
+            'GET', f'/api/calendar/all/{rng.choice(year_months)}?detail=summary', None),
+        'GET /api/calendar/service/<service_id>/<year_month>': lambda rng: (
+            'GET', f'/api/calendar/service/{rng.choice(service_ids)}/{rng.choice(year_months)}', None),
+        'GET /api/quota/summary': lambda rng: (
+            'GET', f'/api/quota/summary?org_id={rng.choice(org_ids)}&year_month={rng.choice(year_months)}', None),
+        'GET /api/requests/all': lambda rng: ('GET', '/api/requests/all', None),
+        'GET /api/requests/org/<org_id>': lambda rng: ('GET', f'/api/requests/org/{rng.choice(org_ids)}', None),
+        'GET /api/change-requests?status=pending': lambda rng: ('GET', '/api/change-requests?status=pending', None),
+        # 쓰기 라우트는 조회 측정 뒤에 실행 (달력 캐시 무효화 영향 배제)
+        'POST /api/request': lambda rng: ('POST', '/api/request', {
+            'service_id': rng.choice(service_ids),
+            'send_date': f'{rng.choice(year_months)}-{rng.randrange(1, 29):02d}',
+            'send_time': '10:00',
+            'channel': rng.choice(CHANNELS),
+            'campaign_name': '벤치마크',
+            'quantity': 1000
+        }),
+    }
+
+
+def summarize(samples, elapsed, errors):
+    samples = sorted(samples)
+
+    def percentile(p):
+        return samples[min(len(samples) - 1, int(len(samples) * p))] if samples else None
+
+    return {
+        'count': len(samples),
+        'errors': errors,
+        'p50_ms': round(statistics.median(samples), 3) if samples else None,
+        'p95_ms': round(percentile(0.95), 3) if samples else None,
+        'p99_ms': round(percentile(0.99), 3) if samples else None,
+        'throughput_rps': round(len(samples) / elapsed, 1) if elapsed else None
+    }
+
+
+def bench_client(routes, iterations):
+    from app import app
+
+    client = app.test_client()
+    results = {}
+    for name, make_request in routes.items():
+        rng = random.Random(name)
+        samples, errors = [], 0
+        started = time.perf_counter()
+        for _ in range(iterations):
+            method, path, body = make_request(rng)
+            request_started = time.perf_counter()
+            response = client.open(path, method=method, json=body)
+            response.get_data()
+            samples.append((time.perf_counter() - request_started) * 1000)
+            errors += response.status_code >= 400
+        results[name] = summarize(samples, time.perf_counter() - started, errors)
+        print_row('client', name, results[name])
+    return results
+
+
+def start_gunicorn(args, db_path):
+    env = dict(os.environ, DATABASE_URL=f'sqlite:///{db_path}')
+    process = subprocess.Popen([
+        sys.executable, '-m', 'gunicorn', 'app:app',
+        '--workers', str(args.workers), '--threads', str(args.threads),
+        '--bind', f'127.0.0.1:{args.port}', '--log-level', 'warning'
+    ], cwd=ROOT, env=env)
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        try:
+            connection = http.client.HTTPConnection('127.0.0.1', args.port, timeout=5)
+            connection.request('GET', '/api/organizations')
+            connection.getresponse().read()
+            return process
+        except OSError:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError('gunicorn 서버가 시작되지 않았습니다.')
+
+
+def bench_gunicorn(routes, args, db_path):
+    process = start_gunicorn(args, db_path)
+    local = threading.local()
+
+    def send(method, path, body):
+        if not hasattr(local, 'connection'):
+            local.connection = http.client.HTTPConnection('127.0.0.1', args.port, timeout=60)
+        payload = json.dumps(body).encode() if body is not None else None
+        headers = {'Content-Type': 'application/json'} if body is not None else {}
+        started = time.perf_counter()
+        try:
+            local.connection.request(method, path, body=payload, headers=headers)
+            response = local.connection.getresponse()
+            response.read()
+            status = response.status
+        except (OSError, http.client.HTTPException):
+            local.connection.close()
+            del local.connection
+            status = 599
+        return (time.perf_counter() - started) * 1000, status
+
+    results = {}
+    try:
+        with ThreadPoolExecutor(args.concurrency) as pool:
+            for name, make_request in routes.items():
+                rng = random.Random(name)
+                requests = [make_request(rng) for _ in range(args.iterations)]
+                started = time.perf_counter()
+                outcomes = list(pool.map(lambda r: send(*r), requests))
+                elapsed = time.perf_counter() - started
+                results[name] = summarize(
+                    [ms for ms, _ in outcomes], elapsed, sum(status >= 400 for _, status in outcomes)
+                )
+                print_row('gunicorn', name, results[name])
+    finally:
+        process.terminate()
+        process.wait()
+    return results
+
+
+def print_row(mode, name, stats):
+    print(f'{mode:<10}{name:<52}{stats["p50_ms"]:>9.2f}{stats["p95_ms"]:>9.2f}{stats["p99_ms"]:>9.2f}'
+          f'{stats["throughput_rps"]:>10.1f}{stats["errors"]:>8}')
+
+
+# 기준 대비 p95 지연시간 증가 / 처리량 감소가 허용 범위를 넘는 항목
+def compare(results, baseline, tolerance):
+    regressions = []
+    for mode, routes in results['results'].items():
+        for name, stats in routes.items():
+            base = baseline.get('results', {}).get(mode, {}).get(name)
+            if not base:
+                continue
+            if stats['p95_ms'] > base['p95_ms'] * (1 + tolerance):
+                regressions.append(f'{mode} {name}: p95 {base["p95_ms"]:.2f}ms -> {stats["p95_ms"]:.2f}ms')
+            if stats['throughput_rps'] < base['throughput_rps'] * (1 - tolerance):
+                regressions.append(
+                    f'{mode} {name}: 처리량 {base["throughput_rps"]:.1f} -> {stats["throughput_rps"]:.1f} req/s'
+                )
+            if stats['errors'] > base['errors']:
+                regressions.append(f'{mode} {name}: 오류 {base["errors"]} -> {stats["errors"]}')
+    return regressions
+
+
+def main():
+    args = parse_args()
+    db_path = args.db or os.path.join(tempfile.mkdtemp(), 'bench_routes.db')
+    os.environ['DATABASE_URL'] = f'sqlite:///{db_path}'
+
+    if not args.reuse:
+        started = time.perf_counter()
+        seed(args)
+        print(f'데이터 생성 {time.perf_counter() - started:.1f}s ({db_path})')
+
+    org_ids, service_ids = load_targets()
+    routes = build_routes(org_ids, service_ids, month_list(args.months))
+
+    print(f'{"mode":<10}{"route":<52}{"p50":>9}{"p95":>9}{"p99":>9}{"req/s":>10}{"errors":>8}')
+    results = {}
+    if args.mode in ('client', 'both'):
+        results['client'] = bench_client(routes, args.iterations)
+    if args.mode in ('gunicorn', 'both'):
+        results['gunicorn'] = bench_gunicorn(routes, args, db_path)
+
+    output = {
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'dataset': {
+            'orgs': len(org_ids),
+            'services': len(service_ids),
+            'requests': args.requests,
+            'change_requests': args.change_requests,
+            'months': args.months
+        },
+        'settings': {
+            'iterations': args.iterations,
+            'workers': args.workers,
+            'threads': args.threads,
+            'concurrency': args.concurrency
+        },
+        'results': results
+    }
+    with open(args.output, 'w') as f:
+        json.dump(output, f, ensure_ascii=False, indent=2)
+    print(f'결과 저장: {args.output}')
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as f:
+            json.dump(output, f, ensure_ascii=False, indent=2)
+        print(f'기준 저장: {args.save_baseline}')
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline.get('dataset') != output['dataset']:
+            print('경고: 기준과 데이터 규모가 다릅니다.')
+        regressions = compare(output, baseline, args.tolerance)
+        if regressions:
+            print(f'\n성능 저하 {len(regressions)}건 (허용 범위 {args.tolerance:.0%}):')
+            for line in regressions:
+                print('  ' + line)
+            sys.exit(1)
+        print(f'기준 대비 성능 저하 없음 (허용 범위 {args.tolerance:.0%})')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,166 @@
+# SendRequest 조회 인덱스 벤치마크
+#
+# 대량의 SendRequest 데이터를 SQLite에 생성한 뒤, 기존 방식(Service 조인 + 인덱스 없음)과
+# 개선 방식(SendRequest.organization_id + 복합 인덱스)의 물량 체크 / 달력 조회 지연시간을 비교합니다.
+#
+# 사용법:
+#   python benchmarks/bench_send_request_indexes.py --rows 1000000
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--months', type=int, default=24)
+    parser.add_argument('--iterations', type=int, default=50)
+    parser.add_argument('--db', help='SQLite 파일 경로 (기본: 임시 파일)')
+    return parser.parse_args()
+
+
+def seed(db, SendRequest, Service, rows, months):
+    services = [(s.id, s.organization_id) for s in Service.query.all()]
+    first_day = date(2025, 1, 1)
+    days = months * 30
+    channels = ['naver', 'payco', 'talktalk']
+    table = SendRequest.__table__
+
+    batch_size = 50000
+    inserted = 0
+    while inserted < rows:
+        batch = []
+        for _ in range(min(batch_size, rows - inserted)):
+            service_id, org_id = random.choice(services)
+            batch.append({
+                'service_id': service_id,
+                'organization_id': org_id,
+                'send_date': first_day + timedelta(days=random.randrange(days)),
+                'send_time': f'{random.randrange(8, 21):02d}:00',
+                'channel': random.choice(channels),
+                'campaign_name': 'bench',
+                'quantity': random.randrange(1000, 100000),
+            })
+        db.session.execute(table.insert(), batch)
+        inserted += len(batch)
+    db.session.commit()
+    return services
+
+
+def measure(fn, iterations):
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        'p50': statistics.median(samples),
+        'p95': samples[int(len(samples) * 0.95) - 1],
+    }
+
+
+def main():
+    args = parse_args()
+    db_path = args.db or os.path.join(tempfile.mkdtemp(), 'bench.db')
+    os.environ['DATABASE_URL'] = f'sqlite:///{db_path}'
+
+    from sqlalchemy import func, text
+    from app import app, db, month_range, Service, SendRequest, run_migrations, seed_reference
+
+    with app.app_context():
+        db.drop_all()
+        run_migrations()
+        seed_reference()
+        db.session.commit()
+
+        started = time.perf_counter()
+        services = seed(db, SendRequest, Service, args.rows, args.months)
+        print(f'seeded {args.rows:,} rows in {time.perf_counter() - started:.1f}s ({db_path})')
+
+        org_id = services[0][1]
+        year_month = '2025-06'
+        month_start, month_end = month_range(year_month)
+
+        def legacy_quota_check():
+            db.session.query(func.sum(SendRequest.quantity)).join(Service).filter(
+                Service.organization_id == org_id,
+                SendRequest.channel == 'naver',
+                SendRequest.send_date >= month_start,
+                SendRequest.send_date < month_end
+            ).scalar()
+
+        def legacy_calendar():
+            db.session.query(
+                SendRequest.send_date, Service.name, SendRequest.channel,
+                SendRequest.quantity, SendRequest.send_time, SendRequest.campaign_name
+            ).join(Service).filter(
+                Service.organization_id == org_id,
+                SendRequest.send_date >= month_start,
+                SendRequest.send_date < month_end
+            ).all()
+
+        def quota_check():
+            db.session.query(func.sum(SendRequest.quantity)).filter(
+                SendRequest.organization_id == org_id,
+                SendRequest.channel == 'naver',
+                SendRequest.send_date >= month_start,
+                SendRequest.send_date < month_end
+            ).scalar()
+
+        def calendar():
+            db.session.query(
+                SendRequest.send_date, Service.name, SendRequest.channel,
+                SendRequest.quantity, SendRequest.send_time, SendRequest.campaign_name
+            ).join(Service).filter(
+                SendRequest.organization_id == org_id,
+                SendRequest.send_date >= month_start,
+                SendRequest.send_date < month_end
+            ).all()
+
+        client = app.test_client()
+
+        def calendar_endpoint():
+            client.get(f'/api/calendar/{org_id}/{year_month}')
+
+        # before: 인덱스 없이 Service 조인
+        db.session.execute(text('DROP INDEX IF EXISTS ix_send_request_org_channel_date'))
+        db.session.execute(text('DROP INDEX IF EXISTS ix_send_request_service_date'))
+        db.session.commit()
+        before = {
+            'quota_check': measure(legacy_quota_check, args.iterations),
+            'calendar': measure(legacy_calendar, args.iterations),
+        }
+
+        # after: 마이그레이션 인덱스 + 비정규화 컬럼
+        db.session.execute(text(
+            'CREATE INDEX ix_send_request_org_channel_date ON send_request (organization_id, channel, send_date)'
+        ))
+        db.session.execute(text(
+            'CREATE INDEX ix_send_request_service_date ON send_request (service_id, send_date)'
+        ))
+        db.session.execute(text('ANALYZE'))
+        db.session.commit()
+        after = {
+            'quota_check': measure(quota_check, args.iterations),
+            'calendar': measure(calendar, args.iterations),
+            'calendar_endpoint': measure(calendar_endpoint, args.iterations),
+        }
+
+    print(f'{"query":<20}{"before p50":>12}{"before p95":>12}{"after p50":>12}{"after p95":>12}')
+    for name, stats in after.items():
+        prev = before.get(name)
+        before_cols = f'{prev["p50"]:>10.2f}ms{prev["p95"]:>10.2f}ms' if prev else f'{"-":>12}{"-":>12}'
+        print(f'{name:<20}{before_cols}{stats["p50"]:>10.2f}ms{stats["p95"]:>10.2f}ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,198 @@
+# gunicorn 워커 종류별 처리량 / 꼬리 지연시간 비교
+#
+# gunicorn.conf.py로 sync / gthread / gevent(설치된 경우) 서버를 차례로 띄우고,
+# 여러 클라이언트가 달력 조회, 캠페인 신청, 전체 신청 목록(느린 요청)을 섞어 보내는 동안
+# 라우트별 p50/p95/p99 지연시간과 처리량을 측정합니다.
+# sync 워커는 느린 요청 하나가 워커를 붙잡아 다른 요청의 꼬리 지연시간이 크게 늘어납니다.
+#
+# 사용법:
+#   python benchmarks/bench_worker_models.py --requests 200000 --duration 15
+#   python benchmarks/bench_worker_models.py --models gthread,gevent --workers 2 --threads 16 --concurrency 64
+import argparse
+import http.client
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+YEAR_MONTHS = ['2030-01', '2030-02', '2030-03']
+CHANNELS = ['naver', 'payco', 'talktalk']
+
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--models', default='sync,gthread,gevent', help='비교할 워커 종류 (쉼표 구분)')
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--threads', type=int, default=16, help='gthread 워커당 스레드 수')
+    parser.add_argument('--worker-connections', type=int, default=100, help='gevent 워커당 동시 연결 수')
+    parser.add_argument('--concurrency', type=int, default=32, help='동시 클라이언트 수')
+    parser.add_argument('--duration', type=float, default=15, help='워커 종류별 측정 시간 (초)')
+    parser.add_argument('--slow-ratio', type=float, default=0.02, help='전체 신청 목록(느린 요청) 비율')
+    parser.add_argument('--write-ratio', type=float, default=0.2, help='캠페인 신청 비율')
+    parser.add_argument('--orgs', type=int, default=20)
+    parser.add_argument('--requests', type=int, default=100000, help='SendRequest 행 수')
+    parser.add_argument('--db', help='SQLite 파일 경로 (기본: 임시 파일)')
+    parser.add_argument('--port', type=int, default=8766)
+    return parser.parse_args()
+
+
+def seed(args):
+    from app import (app, db, bump_cache_generation, rebuild_monthly_rollup, rebuild_monthly_usage,
+                     run_migrations, seed_generated, CACHE_FREEZES, CACHE_ORGANIZATIONS, CACHE_SERVICES,
+                     Organization, Service)
+
+    with app.app_context():
+        db.drop_all()
+        run_migrations()
+        seed_generated(args.orgs, args.orgs * 10, args.requests, months=len(YEAR_MONTHS),
+                       start_month=YEAR_MONTHS[0], quota=10 ** 12)
+        rebuild_monthly_usage()
+        rebuild_monthly_rollup()
+        bump_cache_generation(CACHE_ORGANIZATIONS, CACHE_SERVICES, CACHE_FREEZES)
+        db.session.commit()
+        return (
+            [org_id for org_id, in db.session.query(Organization.id)],
+            [service_id for service_id, in db.session.query(Service.id)]
+        )
+
+
+def start_server(model, args, db_path):
+    env = dict(
+        os.environ,
+        DATABASE_URL=f'sqlite:///{db_path}',
+        GUNICORN_WORKER_CLASS=model,
+        GUNICORN_BIND=f'127.0.0.1:{args.port}',
+        WEB_CONCURRENCY=str(args.workers),
+        GUNICORN_THREADS=str(args.threads),
+        GUNICORN_WORKER_CONNECTIONS=str(args.worker_connections),
+    )
+    process = subprocess.Popen([
+        sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', '--log-level', 'warning', 'app:app'
+    ], cwd=ROOT, env=env)
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f'{model} 서버가 종료되었습니다. (코드 {process.returncode})')
+        try:
+            connection = http.client.HTTPConnection('127.0.0.1', args.port, timeout=5)
+            connection.request('GET', '/api/organizations')
+            connection.getresponse().read()
+            return process
+        except OSError:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError(f'{model} 서버가 시작되지 않았습니다.')
+
+
+def make_request(rng, args, org_ids, service_ids):
+    roll = rng.random()
+    if roll < args.slow_ratio:
+        return 'GET /api/requests/all', 'GET', '/api/requests/all', None
+    if roll < args.slow_ratio + args.write_ratio:
+        return 'POST /api/request', 'POST', '/api/request', {
+            'service_id': rng.choice(service_ids),
+            'send_date': f'{rng.choice(YEAR_MONTHS)}-{rng.randrange(1, 29):02d}',
+            'send_time': '10:00',
+            'channel': rng.choice(CHANNELS),
+            'campaign_name': '워커 비교',
+            'quantity': 1000
+        }
+    return ('GET /api/calendar/<org_id>/<year_month>', 'GET',
+            f'/api/calendar/{rng.choice(org_ids)}/{rng.choice(YEAR_MONTHS)}', None)
+
+
+# 클라이언트 스레드마다 keep-alive 연결로 측정 시간 동안 계속 요청
+def run_clients(args, org_ids, service_ids):
+    samples = defaultdict(list)
+    errors = defaultdict(int)
+    lock = threading.Lock()
+    deadline = time.perf_counter() + args.duration
+
+    def client(seed):
+        rng = random.Random(seed)
+        connection = http.client.HTTPConnection('127.0.0.1', args.port, timeout=120)
+        local_samples = defaultdict(list)
+        local_errors = defaultdict(int)
+        while time.perf_counter() < deadline:
+            name, method, path, body = make_request(rng, args, org_ids, service_ids)
+            payload = json.dumps(body).encode() if body is not None else None
+            headers = {'Content-Type': 'application/json'} if body is not None else {}
+            started = time.perf_counter()
+            try:
+                connection.request(method, path, body=payload, headers=headers)
+                response = connection.getresponse()
+                response.read()
+                status = response.status
+            except (OSError, http.client.HTTPException):
+                connection.close()
+                connection = http.client.HTTPConnection('127.0.0.1', args.port, timeout=120)
+                status = 599
+            local_samples[name].append((time.perf_counter() - started) * 1000)
+            if status >= 400:
+                local_errors[name] += 1
+        connection.close()
+        with lock:
+            for name, values in local_samples.items():
+                samples[name].extend(values)
+            for name, count in local_errors.items():
+                errors[name] += count
+
+    threads = [threading.Thread(target=client, args=(seed,)) for seed in range(args.concurrency)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return samples, errors, time.perf_counter() - started
+
+
+def print_results(model, samples, errors, elapsed):
+    total = sum(len(values) for values in samples.values())
+    for name in sorted(samples):
+        values = sorted(samples[name])
+
+        def percentile(p):
+            return values[min(len(values) - 1, int(len(values) * p))]
+
+        print(f'{model:<9}{name:<42}{statistics.median(values):>9.1f}{percentile(0.95):>9.1f}'
+              f'{percentile(0.99):>9.1f}{len(values) / elapsed:>9.1f}{errors[name]:>8}')
+    print(f'{model:<9}{"(전체)":<40}{"":>27}{total / elapsed:>9.1f}{sum(errors.values()):>8}')
+
+
+def main():
+    args = parse_args()
+    db_path = args.db or os.path.join(tempfile.mkdtemp(), 'bench_workers.db')
+    os.environ['DATABASE_URL'] = f'sqlite:///{db_path}'
+
+    started = time.perf_counter()
+    org_ids, service_ids = seed(args)
+    print(f'데이터 생성 {time.perf_counter() - started:.1f}s ({db_path})')
+
+    print(f'{"model":<9}{"route":<42}{"p50":>9}{"p95":>9}{"p99":>9}{"req/s":>9}{"errors":>8}')
+    for model in args.models.split(','):
+        if model == 'gevent':
+            try:
+                import gevent  # noqa: F401
+            except ImportError:
+                print('gevent     (건너뜀 - gevent가 설치되어 있지 않음)')
+                continue
+        process = start_server(model, args, db_path)
+        try:
+            samples, errors, elapsed = run_clients(args, org_ids, service_ids)
+        finally:
+            process.terminate()
+            process.wait()
+        print_results(model, samples, errors, elapsed)
+
+
+if __name__ == '__main__':
+    main()
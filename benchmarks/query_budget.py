@@ -0,0 +1,262 @@
+# API 라우트별 SQL 실행 횟수 점검 (N+1 쿼리 회귀 방지)
+#
+# 작은 데이터셋과 큰 데이터셋을 차례로 생성하고 각 라우트를 호출하며 실행된 SQL 문 수를 셉니다.
+# - 라우트마다 정해둔 최대 횟수(QUERY_BUDGETS)를 넘거나
+# - 데이터 크기에 따라 횟수가 달라지면 (행 수에 비례하는 지연 로딩 등) 실패로 종료합니다.
+# 참조 데이터 / 달력 캐시는 호출 전에 비워 캐시가 없는 경우(최악)를 측정합니다.
+#
+# 사용법:
+#   python benchmarks/query_budget.py
+#   python benchmarks/query_budget.py --orgs 50 --services 20 --requests 20000 --verbose
+import argparse
+import os
+import random
+import sys
+import tempfile
+from datetime import date, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+YEAR_MONTH = '2030-01'
+CHANNELS = ['naver', 'payco', 'talktalk']
+
+# 라우트 이름 -> 최대 SQL 실행 횟수
+QUERY_BUDGETS = {
+    'GET /api/organizations': 2,
+    'GET /api/services': 2,
+    'GET /api/services/<org_id>': 2,
+    'GET /api/quota/<org_id>/<year_month>': 1,
+    'GET /api/quota/summary': 1,
+    'GET /api/quotas': 1,
+    'GET /api/utilization/<year_month>': 1,
+    'GET /api/usage': 3,
+    'GET /api/freeze/<year_month>': 2,
+    'GET /api/freezes': 1,
+    'GET /api/calendar/<org_id>/<year_month>': 5,
+    'GET /api/calendar/all/<year_month>': 5,
+    'GET /api/calendar/service/<service_id>/<year_month>': 5,
+    'GET /api/calendar/all/<year_month>?detail=summary': 5,
+    'GET /api/requests/service/<service_id>': 1,
+    'GET /api/requests/org/<org_id>': 1,
+    'GET /api/requests/all': 1,
+    'GET /api/change-requests': 1,
+    'GET /api/change-requests?status=pending': 1,
+    'GET /api/export?format=csv': 1,
+    'GET /api/export?format=xlsx': 2,
+    'POST /api/request': 10,
+    'POST /api/requests/batch': 10,
+    'DELETE /api/request/<request_id>': 9,
+    'POST /api/quota': 4,
+    'PUT /api/quota/<quota_id>': 4,
+    'POST /api/quotas/copy': 4,
+    'POST /api/quotas/bulk': 6,
+    'POST /api/change-request': 1,
+    'PUT /api/change-request/<id>': 9,
+    'POST /api/change-requests/process': 12,
+    'POST /api/freeze': 6,
+    'PUT /api/service/<service_id>': 10,
+    'PUT /api/organization/<org_id>': 5,
+}
+
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--orgs', type=int, default=30, help='큰 데이터셋의 조직 수')
+    parser.add_argument('--services', type=int, default=10, help='큰 데이터셋의 조직당 서비스 수')
+    parser.add_argument('--requests', type=int, default=5000, help='큰 데이터셋의 캠페인 수')
+    parser.add_argument('--verbose', action='store_true', help='라우트별 SQL 문 출력')
+    return parser.parse_args()
+
+
+def seed(db, models, orgs, services_per_org, requests):
+    Organization, Service, MonthlyQuota, SendRequest, ChangeRequest = models
+    rng = random.Random(0)
+
+    db.session.execute(Organization.__table__.insert(), [{'name': f'조직{i}'} for i in range(orgs)])
+    org_ids = [o.id for o in Organization.query.all()]
+    db.session.execute(Service.__table__.insert(), [
+        {'name': f'서비스{org_id}-{i}', 'organization_id': org_id, 'manager_name': '담당자'}
+        for org_id in org_ids for i in range(services_per_org)
+    ])
+    services = [(s.id, s.organization_id) for s in Service.query.all()]
+    db.session.execute(MonthlyQuota.__table__.insert(), [
+        {'organization_id': org_id, 'year_month': YEAR_MONTH, 'channel': channel, 'total_quota': 10 ** 9}
+        for org_id in org_ids for channel in CHANNELS
+    ])
+
+    first_day = date(2030, 1, 1)
+    rows = []
+    for _ in range(requests):
+        service_id, org_id = rng.choice(services)
+        rows.append({
+            'service_id': service_id,
+            'organization_id': org_id,
+            'send_date': first_day + timedelta(days=rng.randrange(28)),
+            'send_time': f'{rng.randrange(8, 21):02d}:00',
+            'channel': rng.choice(CHANNELS),
+            'campaign_name': 'budget',
+            'quantity': rng.randrange(100, 1000),
+        })
+    db.session.execute(SendRequest.__table__.insert(), rows)
+
+    originals = SendRequest.query.limit(max(requests // 10, 1)).all()
+    db.session.execute(ChangeRequest.__table__.insert(), [{
+        'year_month': YEAR_MONTH,
+        'request_type': 'modify',
+        'service_id': sr.service_id,
+        'original_request_id': sr.id,
+        'send_date': sr.send_date,
+        'quantity': sr.quantity + 1,
+        'reason': 'budget',
+        'requester_name': '요청자',
+        'status': 'pending'
+    } for sr in originals])
+    db.session.commit()
+    return org_ids, services
+
+
+# 라우트 이름 -> (메서드, 경로, JSON 본문)
+def build_calls(models, org_ids, services):
+    Organization, Service, MonthlyQuota, SendRequest, ChangeRequest = models
+    org_id = org_ids[0]
+    service_id = next(s for s, o in services if o == org_id)
+    quota_id = MonthlyQuota.query.filter_by(organization_id=org_id).first().id
+    request_id = SendRequest.query.filter_by(organization_id=org_id).order_by(SendRequest.id.desc()).first().id
+    pending = [cr.id for cr in ChangeRequest.query.filter_by(status='pending').order_by(ChangeRequest.id).limit(21)]
+
+    return {
+        'GET /api/organizations': ('GET', '/api/organizations', None),
+        'GET /api/services': ('GET', '/api/services', None),
+        'GET /api/services/<org_id>': ('GET', f'/api/services/{org_id}', None),
+        'GET /api/quota/<org_id>/<year_month>': ('GET', f'/api/quota/{org_id}/{YEAR_MONTH}', None),
+        'GET /api/quota/summary': ('GET', f'/api/quota/summary?org_id={org_id}&year_month={YEAR_MONTH}', None),
+        'GET /api/quotas': ('GET', f'/api/quotas?year_month={YEAR_MONTH}', None),
+        'GET /api/utilization/<year_month>': ('GET', f'/api/utilization/{YEAR_MONTH}', None),
+        'GET /api/usage': ('GET', '/api/usage?from=2029-07&to=2030-06&group_by=service', None),
+        'GET /api/freeze/<year_month>': ('GET', f'/api/freeze/{YEAR_MONTH}', None),
+        'GET /api/freezes': ('GET', '/api/freezes', None),
+        'GET /api/calendar/<org_id>/<year_month>': ('GET', f'/api/calendar/{org_id}/{YEAR_MONTH}', None),
+        'GET /api/calendar/all/<year_month>': ('GET', f'/api/calendar/all/{YEAR_MONTH}', None),
+        'GET /api/calendar/service/<service_id>/<year_month>':
+            ('GET', f'/api/calendar/service/{service_id}/{YEAR_MONTH}', None),
+        'GET /api/calendar/all/<year_month>?detail=summary':
+            ('GET', f'/api/calendar/all/{YEAR_MONTH}?detail=summary', None),
+        'GET /api/requests/service/<service_id>': ('GET', f'/api/requests/service/{service_id}', None),
+        'GET /api/requests/org/<org_id>': ('GET', f'/api/requests/org/{org_id}', None),
+        'GET /api/requests/all': ('GET', '/api/requests/all', None),
+        'GET /api/change-requests': ('GET', '/api/change-requests', None),
+        'GET /api/change-requests?status=pending': ('GET', '/api/change-requests?status=pending', None),
+        'GET /api/export?format=csv': ('GET', f'/api/export?format=csv&org_id={org_id}', None),
+        'GET /api/export?format=xlsx': ('GET', f'/api/export?format=xlsx&org_id={org_id}', None),
+        'POST /api/request': ('POST', '/api/request', {
+            'service_id': service_id, 'send_date': f'{YEAR_MONTH}-15', 'channel': 'naver', 'quantity': 10
+        }),
+        'POST /api/requests/batch': ('POST', '/api/requests/batch', {'items': [{
+            'service_id': s, 'send_date': f'{YEAR_MONTH}-{i % 28 + 1:02d}', 'channel': CHANNELS[i % 3], 'quantity': 10
+        } for i, (s, _) in enumerate(services[:50])]}),
+        'DELETE /api/request/<request_id>': ('DELETE', f'/api/request/{request_id}', None),
+        'POST /api/quota': ('POST', '/api/quota', {
+            'organization_id': org_id, 'year_month': YEAR_MONTH, 'channel': 'naver', 'total_quota': 10 ** 9 + 1
+        }),
+        'PUT /api/quota/<quota_id>': ('PUT', f'/api/quota/{quota_id}', {'total_quota': 10 ** 9 + 2}),
+        'POST /api/quotas/copy': ('POST', '/api/quotas/copy', {
+            'source_year_month': YEAR_MONTH, 'target_from': '2030-02', 'target_to': '2030-04'
+        }),
+        'POST /api/quotas/bulk': ('POST', '/api/quotas/bulk', {'quotas': [
+            {'organization_id': o, 'year_month': '2030-05', 'channel': 'naver', 'total_quota': 100}
+            for o in org_ids
+        ]}),
+        'POST /api/change-request': ('POST', '/api/change-request', {
+            'request_type': 'add', 'service_id': service_id, 'send_date': f'{YEAR_MONTH}-20',
+            'channel': 'payco', 'quantity': 5, 'reason': 'budget', 'requester_name': '요청자'
+        }),
+        'PUT /api/change-request/<id>': ('PUT', f'/api/change-request/{pending[0]}', {'action': 'approve'}),
+        'POST /api/change-requests/process': ('POST', '/api/change-requests/process', {'items': [
+            {'id': i, 'action': 'approve'} for i in pending[1:]
+        ]}),
+        'POST /api/freeze': ('POST', '/api/freeze', {'year_month': YEAR_MONTH, 'is_frozen': True}),
+        'PUT /api/service/<service_id>': ('PUT', f'/api/service/{service_id}', {
+            'name': '이동된 서비스', 'organization_id': org_ids[1], 'manager_name': '담당자'
+        }),
+        'PUT /api/organization/<org_id>': ('PUT', f'/api/organization/{org_id}', {'name': '바뀐 조직'}),
+    }
+
+
+def run(size):
+    from sqlalchemy import event
+    import app as app_module
+    from app import (app, db, calendar_cache, reference_cache, rebuild_monthly_rollup, rebuild_monthly_usage,
+                     run_migrations, ChangeRequest, MonthlyQuota, Organization, SendRequest, Service)
+
+    models = (Organization, Service, MonthlyQuota, SendRequest, ChangeRequest)
+    app_module.CHANGE_EVENT_PRUNE_RATE = 0  # 확률적으로 실행되는 변경 로그 정리는 제외
+    orgs, services_per_org, requests = size
+    with app.app_context():
+        db.drop_all()
+        run_migrations()
+        org_ids, services = seed(db, models, orgs, services_per_org, requests)
+        rebuild_monthly_usage()
+        rebuild_monthly_rollup()
+        db.session.commit()
+        calls = build_calls(models, org_ids, services)
+        engine = db.engine
+
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    client = app.test_client()
+    with client.session_transaction() as session:
+        session['admin_logged_in'] = True
+
+    results = {}
+    event.listen(engine, 'before_cursor_execute', count)
+    try:
+        for name, (method, path, body) in calls.items():
+            reference_cache.clear()
+            calendar_cache.clear()
+            statements.clear()
+            response = client.open(path, method=method, json=body)
+            response.get_data()  # 스트리밍 응답까지 모두 소비
+            results[name] = (response.status_code, list(statements))
+    finally:
+        event.remove(engine, 'before_cursor_execute', count)
+    return results
+
+
+def main():
+    args = parse_args()
+    os.environ['DATABASE_URL'] = f'sqlite:///{os.path.join(tempfile.mkdtemp(), "budget.db")}'
+
+    small = run((3, 3, 100))
+    large = run((args.orgs, args.services, args.requests))
+
+    failures = []
+    print(f'{"route":<56}{"status":>8}{"small":>8}{"large":>8}{"budget":>8}')
+    for name, budget in QUERY_BUDGETS.items():
+        small_status, small_statements = small[name]
+        status, statements = large[name]
+        problems = []
+        if status >= 400 or small_status >= 400:
+            problems.append(f'status {small_status}/{status}')
+        if len(statements) > budget:
+            problems.append('over budget')
+        if len(statements) != len(small_statements):
+            problems.append('grows with data')
+        print(f'{name:<56}{status:>8}{len(small_statements):>8}{len(statements):>8}{budget:>8}  {", ".join(problems)}')
+        if args.verbose or problems:
+            for statement in statements:
+                print('    ' + ' '.join(statement.split())[:160])
+        if problems:
+            failures.append(name)
+
+    if failures:
+        print(f'\n{len(failures)}개 라우트가 SQL 실행 횟수 기준을 통과하지 못했습니다.')
+        sys.exit(1)
+    print('\n모든 라우트가 SQL 실행 횟수 기준을 통과했습니다.')
+
+
+if __name__ == '__main__':
+    main()
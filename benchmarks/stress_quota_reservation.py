@@ -0,0 +1,163 @@
+# 물량 예약 동시성 스트레스 테스트
+#
+# 여러 프로세스에서 동시에 캠페인 신청(POST /api/request)을 보내고,
+# 끝난 뒤 어떤 조직/채널도 월간 물량을 초과하지 않았는지 검증합니다.
+#
+# 사용법:
+#   # 프로세스마다 Flask test client로 같은 SQLite 파일에 직접 신청
+#   python benchmarks/stress_quota_reservation.py --processes 8 --requests 4000
+#
+#   # 실행 중인 서버(gunicorn 멀티 워커 등)에 HTTP로 신청 - 서버와 같은 DB를 --db로 지정
+#   python benchmarks/stress_quota_reservation.py --db /tmp/stress.db --setup-only
+#   DATABASE_URL=sqlite:////tmp/stress.db gunicorn -w 4 app:app &
+#   python benchmarks/stress_quota_reservation.py --db /tmp/stress.db --url http://127.0.0.1:8000
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+YEAR_MONTH = '2030-01'
+CHANNELS = ['naver', 'payco', 'talktalk']
+
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--processes', type=int, default=8)
+    parser.add_argument('--requests', type=int, default=4000, help='전체 신청 건수')
+    parser.add_argument('--orgs', type=int, default=2, help='물량을 설정할 조직 수')
+    parser.add_argument('--quota', type=int, default=200000, help='조직/채널별 월간 물량')
+    parser.add_argument('--db', help='SQLite 파일 경로 (기본: 임시 파일)')
+    parser.add_argument('--url', help='신청을 보낼 서버 주소 (없으면 test client 사용)')
+    parser.add_argument('--setup-only', action='store_true', help='데이터만 준비하고 종료')
+    return parser.parse_args()
+
+
+def setup(args):
+    from app import app, db, run_migrations, seed_reference, MonthlyQuota, Organization
+
+    with app.app_context():
+        db.drop_all()
+        run_migrations()
+        seed_reference()
+        orgs = Organization.query.order_by(Organization.id).limit(args.orgs).all()
+        for org in orgs:
+            for channel in CHANNELS:
+                db.session.add(MonthlyQuota(
+                    organization_id=org.id,
+                    year_month=YEAR_MONTH,
+                    channel=channel,
+                    total_quota=args.quota
+                ))
+        db.session.commit()
+
+
+def load_service_ids():
+    from app import app, MonthlyQuota, Service
+
+    with app.app_context():
+        org_ids = MonthlyQuota.query.with_entities(MonthlyQuota.organization_id).filter_by(year_month=YEAR_MONTH)
+        return [s.id for s in Service.query.filter(Service.organization_id.in_(org_ids)).all()]
+
+
+def worker(payload):
+    db_path, url, service_ids, count, seed = payload
+    os.environ['DATABASE_URL'] = f'sqlite:///{db_path}'
+    rng = random.Random(seed)
+
+    if url:
+        def post(body):
+            req = urllib.request.Request(
+                url.rstrip('/') + '/api/request',
+                data=json.dumps(body).encode(),
+                headers={'Content-Type': 'application/json'},
+                method='POST'
+            )
+            try:
+                with urllib.request.urlopen(req, timeout=30) as response:
+                    return response.status
+            except urllib.error.HTTPError as e:
+                return e.code
+    else:
+        from app import app
+        client = app.test_client()
+
+        def post(body):
+            return client.post('/api/request', json=body).status_code
+
+    statuses = Counter()
+    for _ in range(count):
+        statuses[post({
+            'service_id': rng.choice(service_ids),
+            'send_date': f'{YEAR_MONTH}-{rng.randrange(1, 29):02d}',
+            'channel': rng.choice(CHANNELS),
+            'campaign_name': 'stress',
+            'quantity': rng.randrange(100, 2000)
+        })] += 1
+    return statuses
+
+
+def verify(db_path):
+    os.environ['DATABASE_URL'] = f'sqlite:///{db_path}'
+    from sqlalchemy import func
+    from app import app, db, month_range, verify_monthly_usage, MonthlyQuota, SendRequest
+
+    month_start, month_end = month_range(YEAR_MONTH)
+    violations = []
+    with app.app_context():
+        for quota in MonthlyQuota.query.filter_by(year_month=YEAR_MONTH).all():
+            requested = db.session.query(func.sum(SendRequest.quantity)).filter(
+                SendRequest.organization_id == quota.organization_id,
+                SendRequest.channel == quota.channel,
+                SendRequest.send_date >= month_start,
+                SendRequest.send_date < month_end
+            ).scalar() or 0
+            print(f'조직 {quota.organization_id} / {quota.channel}: {requested:,} / {quota.total_quota:,}')
+            if requested > quota.total_quota:
+                violations.append(quota)
+        ledger_mismatches = verify_monthly_usage()
+    return violations, ledger_mismatches
+
+
+def main():
+    args = parse_args()
+    db_path = args.db or os.path.join(tempfile.mkdtemp(), 'stress.db')
+    os.environ['DATABASE_URL'] = f'sqlite:///{db_path}'
+
+    if not args.url or args.setup_only:
+        setup(args)
+        if args.setup_only:
+            print(f'준비 완료: {db_path}')
+            return
+    service_ids = load_service_ids()
+
+    per_process = args.requests // args.processes
+    payloads = [(db_path, args.url, service_ids, per_process, seed) for seed in range(args.processes)]
+
+    started = time.perf_counter()
+    with multiprocessing.get_context('spawn').Pool(args.processes) as pool:
+        results = pool.map(worker, payloads)
+    elapsed = time.perf_counter() - started
+
+    statuses = sum(results, Counter())
+    total = sum(statuses.values())
+    print(f'{total:,}건 신청 / {elapsed:.1f}s ({total / elapsed:,.0f} req/s) - 상태 코드: {dict(statuses)}')
+
+    violations, ledger_mismatches = verify(db_path)
+    if violations or ledger_mismatches:
+        print(f'실패: 물량 초과 {len(violations)}건, 원장 불일치 {len(ledger_mismatches)}건')
+        sys.exit(1)
+    print('성공: 물량 초과 없음')
+
+
+if __name__ == '__main__':
+    main()
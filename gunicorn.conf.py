@@ -0,0 +1,51 @@
+# gunicorn 설정 - `gunicorn -c gunicorn.conf.py app:app`
+#
+# GUNICORN_WORKER_CLASS로 워커 종류를 고릅니다.
+#   gthread (기본): 워커마다 스레드 풀, 느린 요청이 있어도 다른 요청은 다른 스레드에서 처리
+#   gevent: 워커마다 greenlet으로 많은 동시 연결 처리 (SSE 연결이 많을 때), `pip install gevent psycogreen` 필요
+# 열려 있는 요청은 gthread / sync 워커의 스레드를 하나씩 차지합니다. (gthread 기본: 2 x 16 = 동시 32개)
+# 변경 스트림(/api/stream)을 열어 두면 탭마다 스레드를 쓰므로, gevent가 아니면 스트림은 한 번 조회 후 바로 끝나고
+# 브라우저가 Last-Event-ID로 재연결합니다. (STREAM_MAX_SECONDS=0)
+#   sync: 워커당 요청 하나씩
+# 앱은 마스터에서 한 번 import한 뒤(preload) fork하므로 워커는 import 없이 바로 요청을 받고,
+# 읽기 전용 객체는 copy-on-write로 공유됩니다.
+import gc
+import os
+
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gthread')
+
+if worker_class == 'gevent':
+    # preload로 앱을 import하기 전에 패치해야 app/SQLAlchemy의 잠금과 소켓이 greenlet용이 됨
+    from gevent import monkey
+    monkey.patch_all()
+    try:
+        from psycogreen.gevent import patch_psycopg
+        patch_psycopg()  # psycopg2 쿼리 대기 중에도 다른 greenlet이 실행되도록
+    except ImportError:
+        pass
+    # greenlet은 연결을 오래 유지해도 스레드를 차지하지 않으므로 변경 스트림을 열어 둠
+    os.environ.setdefault('STREAM_MAX_SECONDS', '300')
+
+bind = os.environ.get('GUNICORN_BIND') or f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+workers = int(os.environ.get('WEB_CONCURRENCY', 2))
+# sync 워커에 threads > 1을 주면 gunicorn이 gthread로 바꾸므로 gthread일 때만 적용
+threads = int(os.environ.get('GUNICORN_THREADS', 16)) if worker_class == 'gthread' else 1
+worker_connections = int(os.environ.get('GUNICORN_WORKER_CONNECTIONS', 100))
+preload_app = os.environ.get('GUNICORN_PRELOAD', '1').lower() in ('1', 'true', 'yes', 'on')
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 60))
+graceful_timeout = 30
+keepalive = 5
+
+
+def pre_fork(server, worker):
+    # preload된 객체를 GC 대상에서 빼서, 자식의 GC가 참조 정보를 건드려 페이지를 복사하지 않도록
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    # 마스터에서 열린 DB 커넥션이 있더라도 자식이 같이 쓰지 않도록 풀을 비움
+    # (close=False: 부모의 소켓은 닫지 않고 참조만 버림)
+    from app import app, db
+
+    with app.app_context():
+        db.engine.dispose(close=False)
@@ -0,0 +1,54 @@
+# Flask JSON 제공자 선택
+#
+# JSON_PROVIDER 설정(또는 환경 변수)으로 고릅니다.
+#   auto (기본): orjson이 설치되어 있으면 orjson, 아니면 Flask 기본 제공자
+#   orjson: orjson 사용 (설치되어 있지 않으면 시작 시 오류)
+#   default: Flask 기본 제공자 (표준 json 모듈)
+# orjson 제공자도 기본 제공자와 같은 값을 내도록 키를 정렬하고, date/datetime은 Flask 기본 형식(HTTP 날짜)으로,
+# Decimal 등은 기본 제공자의 default()로 변환합니다. 한글은 \uXXXX로 이스케이프하지 않고 UTF-8로 씁니다.
+import os
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    def _dumps(self, obj, indent=False):
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option)
+
+    def dumps(self, obj, **kwargs):
+        return self._dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = self.compact is False or (self.compact is None and self._app.debug)
+        return self._app.response_class(self._dumps(obj, indent) + b'\n', mimetype=self.mimetype)
+
+
+JSON_PROVIDERS = {
+    'default': DefaultJSONProvider,
+    'orjson': OrjsonProvider,
+}
+
+
+def create_json_provider(app, name=None):
+    name = name or os.environ.get('JSON_PROVIDER') or 'auto'
+    if name == 'auto':
+        name = 'orjson' if orjson is not None else 'default'
+    if name not in JSON_PROVIDERS:
+        raise ValueError(f'알 수 없는 JSON_PROVIDER: {name} (auto, {", ".join(JSON_PROVIDERS)})')
+    if name == 'orjson' and orjson is None:
+        raise RuntimeError('JSON_PROVIDER=orjson 이지만 orjson이 설치되어 있지 않습니다.')
+    return JSON_PROVIDERS[name](app)
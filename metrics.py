@@ -0,0 +1,171 @@
+# 프로메테우스 텍스트 형식 지표 수집기
+#
+# 외부 라이브러리 없이 카운터 / 히스토그램을 프로세스 메모리에 모으고,
+# 백그라운드 스레드가 공유 디렉터리의 워커별 파일(pid + 난수)에 주기적으로 기록합니다.
+# /metrics 조회 시 디렉터리의 모든 파일을 합산하므로 gunicorn 워커가 여러 개여도 전체 값이 나옵니다.
+# (종료된 워커의 파일도 남겨두어 카운터가 줄어들지 않음 - 배포 시 디렉터리를 비우면 초기화)
+import json
+import math
+import os
+import random
+import threading
+import time
+
+COUNTER = 'counter'
+HISTOGRAM = 'histogram'
+
+
+def _format_value(value):
+    if value == math.inf:
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{k}="{_escape(v)}"' for k, v in labels) + '}'
+
+
+class Metrics:
+    def __init__(self, directory, flush_interval=1.0):
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self._definitions = {}  # name -> (type, help, buckets)
+        self._collectors = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._reset()
+
+    # fork 이후에는 부모 프로세스의 값을 버리고 새 파일에 기록
+    def _reset(self):
+        self._pid = os.getpid()
+        self._path = os.path.join(self.directory, f'{self._pid}-{random.getrandbits(32):08x}.json')
+        self._values = {}  # (name, labels) -> 카운터 값 또는 [버킷별 개수..., 합계, 개수]
+        self._flusher = None
+
+    # 값이 처음 기록될 때 프로세스마다 기록 스레드를 시작 (fork된 자식에는 스레드가 복제되지 않음)
+    def _check_fork(self):
+        if self._pid != os.getpid():
+            self._reset()
+        if self._flusher is None:
+            self._flusher = threading.Thread(target=self._flush_loop, name='metrics-flush', daemon=True)
+            self._flusher.start()
+
+    def _flush_loop(self):
+        pid = os.getpid()
+        while self._pid == pid:
+            time.sleep(self.flush_interval)
+            try:
+                self.flush()
+            except OSError:
+                pass
+
+    def counter(self, name, help_text):
+        self._definitions[name] = (COUNTER, help_text, None)
+
+    def histogram(self, name, help_text, buckets):
+        self._definitions[name] = (HISTOGRAM, help_text, tuple(sorted(buckets)))
+
+    # flush 직전에 호출되어 외부 카운터(캐시 적중 수 등)의 현재 누적값을 반영
+    def collector(self, func):
+        self._collectors.append(func)
+        return func
+
+    def inc(self, name, labels=(), value=1):
+        key = (name, tuple(labels))
+        with self._lock:
+            self._check_fork()
+            self._values[key] = self._values.get(key, 0) + value
+
+    def set_total(self, name, labels, value):
+        with self._lock:
+            self._check_fork()
+            self._values[(name, tuple(labels))] = value
+
+    def observe(self, name, labels, value):
+        buckets = self._definitions[name][2]
+        key = (name, tuple(labels))
+        with self._lock:
+            self._check_fork()
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [0] * (len(buckets) + 2)
+            for i, bound in enumerate(buckets):
+                if value <= bound:
+                    entry[i] += 1
+            entry[-2] += value
+            entry[-1] += 1
+
+    # 이 워커의 현재 값을 파일로 기록
+    def flush(self):
+        for func in self._collectors:
+            func()
+        with self._lock:
+            self._check_fork()
+            rows = [[name, list(labels), list(value) if isinstance(value, list) else value]
+                    for (name, labels), value in self._values.items()]
+            path = self._path
+        with self._flush_lock:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp_path = path + '.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump(rows, f)
+            os.replace(tmp_path, path)
+
+    # 모든 워커 파일 합산
+    def aggregate(self):
+        self.flush()
+        totals = {}
+        for filename in os.listdir(self.directory):
+            if not filename.endswith('.json'):
+                continue
+            try:
+                with open(os.path.join(self.directory, filename)) as f:
+                    rows = json.load(f)
+            except (OSError, ValueError):
+                continue
+            for name, labels, value in rows:
+                if name not in self._definitions:
+                    continue
+                key = (name, tuple(tuple(label) for label in labels))
+                if isinstance(value, list):
+                    entry = totals.setdefault(key, [0] * len(value))
+                    if len(entry) != len(value):
+                        continue  # 버킷 구성이 바뀐 이전 버전 파일
+                    for i, v in enumerate(value):
+                        entry[i] += v
+                else:
+                    totals[key] = totals.get(key, 0) + value
+        return totals
+
+    # 프로메테우스 텍스트 형식 (gauges: 조회 시점에 계산한 [(이름, 설명, [(라벨, 값)])])
+    def render(self, totals=None, gauges=()):
+        if totals is None:
+            totals = self.aggregate()
+        lines = []
+        for name, (kind, help_text, buckets) in self._definitions.items():
+            series = sorted((labels, value) for (n, labels), value in totals.items() if n == name)
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} {kind}')
+            for labels, value in series:
+                if kind == COUNTER:
+                    lines.append(f'{name}{_format_labels(labels)} {_format_value(value)}')
+                    continue
+                for bound, count in zip(buckets + (math.inf,), value[:-2] + [value[-1]]):
+                    bucket_labels = labels + (('le', _format_value(bound)),)
+                    lines.append(f'{name}_bucket{_format_labels(bucket_labels)} {count}')
+                lines.append(f'{name}_sum{_format_labels(labels)} {_format_value(value[-2])}')
+                lines.append(f'{name}_count{_format_labels(labels)} {value[-1]}')
+        for name, help_text, series in gauges:
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} gauge')
+            for labels, value in series:
+                lines.append(f'{name}{_format_labels(labels)} {_format_value(value)}')
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,31 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# app은 import 시점의 DATABASE_URL로 엔진을 만들므로 import 전에 임시 DB 지정
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'test.db')
+
+from app import app as flask_app, calendar_cache, db, reference_cache, run_migrations, seed_reference  # noqa: E402
+
+
+@pytest.fixture
+def app():
+    with flask_app.app_context():
+        db.drop_all()
+        run_migrations()
+        seed_reference()
+        db.session.commit()
+        reference_cache.clear()
+        calendar_cache.clear()
+        yield flask_app
+        db.session.remove()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
@@ -0,0 +1,30 @@
+import pytest
+
+from app import db, seed_generated
+
+YEAR_MONTH = '2030-03'
+
+
+@pytest.fixture
+def calendar_url(app):
+    seed_generated(1, 3, 200, months=1, start_month=YEAR_MONTH, quota=10 ** 9)
+    db.session.commit()
+    return f'/api/calendar/all/{YEAR_MONTH}'
+
+
+def test_gzip_calendar_etag_revalidates_with_304(client, calendar_url):
+    response = client.get(calendar_url, headers={'Accept-Encoding': 'gzip'})
+    assert response.status_code == 200
+    assert response.headers['Content-Encoding'] == 'gzip'
+    etag = response.headers['ETag']
+    assert etag.startswith('W/')
+
+    conditional = client.get(calendar_url, headers={'Accept-Encoding': 'gzip', 'If-None-Match': etag})
+    assert conditional.status_code == 304
+    assert conditional.headers['ETag'] == etag
+
+    # 압축하지 않은 응답도 같은 검증자
+    identity = client.get(calendar_url, headers={'Accept-Encoding': 'identity'})
+    assert 'Content-Encoding' not in identity.headers
+    assert identity.headers['ETag'] == etag
+    assert client.get(calendar_url, headers={'If-None-Match': etag}).status_code == 304
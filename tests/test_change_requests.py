@@ -0,0 +1,42 @@
+import pytest
+
+from app import db, ChangeRequest, Service
+
+
+@pytest.fixture
+def admin_client(client):
+    with client.session_transaction() as session:
+        session['admin_logged_in'] = True
+    return client
+
+
+@pytest.fixture
+def change_request(app):
+    service = db.session.get(Service, 1)
+    change_request = ChangeRequest(
+        year_month='2030-03', request_type='delete', service_id=service.id, reason='테스트', requester_name='담당자'
+    )
+    db.session.add(change_request)
+    db.session.commit()
+    return change_request.id
+
+
+def test_process_batch_reports_non_object_items(admin_client, change_request):
+    response = admin_client.post('/api/change-requests/process', json={
+        'items': [1, 'x', None, {'id': [change_request], 'action': 'reject'}, {'id': change_request, 'action': 'reject'}]
+    })
+
+    assert response.status_code == 200
+    results = response.get_json()['results']
+    assert [(r['index'], r['status']) for r in results] == [
+        (0, 'error'), (1, 'error'), (2, 'error'), (3, 'error'), (4, 'rejected')
+    ]
+    db.session.expire_all()
+    assert db.session.get(ChangeRequest, change_request).status == 'rejected'
+
+
+@pytest.mark.parametrize('items', [{'id': 1}, 'x'])
+def test_process_batch_rejects_non_list_items(admin_client, items):
+    response = admin_client.post('/api/change-requests/process', json={'items': items})
+
+    assert response.status_code == 400
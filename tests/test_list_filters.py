@@ -0,0 +1,18 @@
+import pytest
+
+
+@pytest.mark.parametrize('url', ['/api/requests/all', '/api/requests/org/1', '/api/change-requests'])
+@pytest.mark.parametrize('query', ['date_from=2024-13-01', 'date_to=abc', 'date_from=2024-01-01&date_to=2024-02-30'])
+def test_invalid_date_filter_returns_400(client, url, query):
+    response = client.get(f'{url}?{query}')
+
+    assert response.status_code == 400
+    assert response.get_json()['success'] is False
+
+
+@pytest.mark.parametrize('url', ['/api/requests/all', '/api/requests/org/1', '/api/change-requests'])
+def test_valid_date_filter(client, url):
+    response = client.get(f'{url}?date_from=2024-01-01&date_to=2024-01-31')
+
+    assert response.status_code == 200
+    assert response.get_json() == []
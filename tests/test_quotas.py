@@ -0,0 +1,51 @@
+import pytest
+
+
+@pytest.fixture
+def admin_client(client):
+    with client.session_transaction() as session:
+        session['admin_logged_in'] = True
+    return client
+
+
+def test_bulk_quotas_reports_non_object_rows(admin_client):
+    response = admin_client.post('/api/quotas/bulk', json={'quotas': [
+        1, {'organization_id': 1, 'year_month': '2030-03', 'channel': 'naver', 'total_quota': 1000},
+        'x', {'organization': [1], 'year_month': '2030-03', 'channel': ['naver'], 'total_quota': 5}
+    ]})
+
+    assert response.status_code == 400
+    results = response.get_json()['results']
+    assert [(r['index'], r.get('status')) for r in results if r.get('status') == 'error'] == [(0, 'error'), (2, 'error'), (3, 'error')]
+
+
+@pytest.mark.parametrize('quotas', [{'a': 1}, 'x', 5])
+def test_bulk_quotas_rejects_non_list(admin_client, quotas):
+    response = admin_client.post('/api/quotas/bulk', json={'quotas': quotas})
+
+    assert response.status_code == 400
+    assert response.get_json()['success'] is False
+
+
+@pytest.mark.parametrize('query', [
+    'org_id=1&year_month=2030-3', 'org_id=1&year_month=2030-03-01', 'org_id=1&year_month=30-03', 'pairs=1:2030-03,2:2030-4'
+])
+def test_quota_summary_requires_padded_year_month(client, query):
+    response = client.get(f'/api/quota/summary?{query}')
+
+    assert response.status_code == 400
+
+
+def test_quota_summary_accepts_year_month(client):
+    response = client.get('/api/quota/summary?pairs=1:2030-03,2:2030-04')
+
+    assert response.status_code == 200
+
+
+def test_bulk_quotas_rejects_unpadded_year_month(admin_client):
+    response = admin_client.post('/api/quotas/bulk', json={'quotas': [
+        {'organization_id': 1, 'year_month': '2030-3', 'channel': 'naver', 'total_quota': 1000}
+    ]})
+
+    assert response.status_code == 400
+    assert response.get_json()['results'][0]['status'] == 'error'
@@ -0,0 +1,9 @@
+from app import db, Service
+
+
+def test_services_include_organization_id(client):
+    services = client.get('/api/services').get_json()
+
+    assert services
+    expected = dict(db.session.query(Service.id, Service.organization_id))
+    assert {s['id']: s['organization_id'] for s in services} == expected
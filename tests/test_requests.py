@@ -0,0 +1,92 @@
+import pytest
+
+from app import db, get_usage, MonthlyQuota, Service
+
+YEAR_MONTH = '2030-03'
+
+
+@pytest.fixture
+def service(app):
+    service = db.session.get(Service, 1)
+    db.session.add(MonthlyQuota(
+        organization_id=service.organization_id, year_month=YEAR_MONTH, channel='naver', total_quota=1000
+    ))
+    db.session.commit()
+    return service
+
+
+def request_body(service, **overrides):
+    body = {
+        'service_id': service.id,
+        'send_date': f'{YEAR_MONTH}-10',
+        'send_time': '10:00',
+        'channel': 'naver',
+        'campaign_name': '테스트',
+        'quantity': 300
+    }
+    body.update(overrides)
+    return body
+
+
+@pytest.mark.parametrize('quantity', [-5000, 0, None, '300', 1.5, True, False])
+def test_create_request_rejects_invalid_quantity(client, service, quantity):
+    assert client.post('/api/request', json=request_body(service)).status_code == 200
+
+    body = request_body(service, quantity=quantity)
+    if quantity is None:
+        del body['quantity']
+    response = client.post('/api/request', json=body)
+
+    assert response.status_code == 400
+    assert response.get_json()['success'] is False
+    db.session.expire_all()
+    assert get_usage(service.organization_id, YEAR_MONTH, 'naver') == 300
+
+
+def test_batch_reports_non_object_items(client, service):
+    response = client.post('/api/requests/batch', json={
+        'mode': 'best_effort',
+        'items': [1, 'x', None, [service.id], request_body(service), {'service_id': [service.id], 'quantity': 1},
+                  request_body(service, send_date=20300310), request_body(service, channel=['naver'])]
+    })
+
+    assert response.status_code == 200
+    results = response.get_json()['results']
+    assert [r['index'] for r in results] == list(range(8))
+    assert [r['success'] for r in results] == [False, False, False, False, True, False, False, False]
+    db.session.expire_all()
+    assert get_usage(service.organization_id, YEAR_MONTH, 'naver') == 300
+
+
+@pytest.mark.parametrize('items', [{'service_id': 1}, 'x'])
+def test_batch_rejects_non_list_items(client, items):
+    response = client.post('/api/requests/batch', json={'items': items})
+
+    assert response.status_code == 400
+
+
+def test_create_request_accepts_string_service_id(client, service):
+    response = client.post('/api/request', json=request_body(service, service_id=str(service.id)))
+
+    assert response.status_code == 200
+    db.session.expire_all()
+    assert get_usage(service.organization_id, YEAR_MONTH, 'naver') == 300
+
+
+@pytest.mark.parametrize('service_id', ['abc', None, [1]])
+def test_create_request_rejects_invalid_service_id(client, service, service_id):
+    response = client.post('/api/request', json=request_body(service, service_id=service_id))
+
+    assert response.status_code == 400
+    assert response.get_json()['success'] is False
+
+
+@pytest.mark.parametrize('quantity', [True, False, '300', -1])
+def test_batch_rejects_invalid_quantity(client, service, quantity):
+    response = client.post('/api/requests/batch', json={
+        'mode': 'best_effort', 'items': [request_body(service, quantity=quantity)]
+    })
+
+    assert response.get_json()['results'][0]['success'] is False
+    db.session.expire_all()
+    assert get_usage(service.organization_id, YEAR_MONTH, 'naver') == 0
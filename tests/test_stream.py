@@ -0,0 +1,77 @@
+from app import db, ChangeEvent, MonthlyQuota, Service
+
+YEAR_MONTH = '2030-03'
+
+
+def event_id(body):
+    return body.split('id: ')[1].split('\n')[0]
+
+
+def test_stream_closes_after_one_poll_and_resumes_from_last_event_id(client):
+    service = db.session.get(Service, 1)
+    db.session.add(MonthlyQuota(
+        organization_id=service.organization_id, year_month=YEAR_MONTH, channel='naver', total_quota=1000
+    ))
+    db.session.commit()
+    url = f'/api/stream/{service.organization_id}/{YEAR_MONTH}'
+
+    body = client.get(url).get_data(as_text=True)
+    assert body.startswith('retry: ')
+    assert 'event: snapshot' in body
+    last_event_id = event_id(body)
+
+    # 변경이 없으면 재연결 간격만 보내고 종료
+    assert client.get(url, headers={'Last-Event-ID': last_event_id}).get_data(as_text=True).count('event:') == 0
+
+    client.post('/api/request', json={
+        'service_id': service.id, 'send_date': f'{YEAR_MONTH}-10', 'channel': 'naver', 'quantity': 300
+    })
+    body = client.get(url, headers={'Last-Event-ID': last_event_id}).get_data(as_text=True)
+    assert 'event: change' in body
+    assert '"total_requested": 300' in body
+    assert int(event_id(body).partition(':')[0]) > int(last_event_id.partition(':')[0])
+
+
+def test_resumed_stream_without_changes_skips_totals(client, monkeypatch):
+    import app as app_module
+
+    url = f'/api/stream/1/{YEAR_MONTH}'
+    last_event_id = event_id(client.get(url).get_data(as_text=True))
+    calls = []
+    monkeypatch.setattr(app_module, 'stream_totals', lambda *args: calls.append(args))
+
+    body = client.get(url, headers={'Last-Event-ID': last_event_id}).get_data(as_text=True)
+
+    assert 'event:' not in body
+    assert calls == []
+
+
+def test_stream_delivers_events_committed_out_of_id_order(client):
+    url = f'/api/stream/1/{YEAR_MONTH}'
+    cursor = event_id(client.get(url).get_data(as_text=True))
+    latest = int(cursor.partition(':')[0])
+
+    def add_event(event_id_, kind):
+        db.session.add(ChangeEvent(id=event_id_, organization_id=1, year_month=YEAR_MONTH, kind=kind))
+        db.session.commit()
+
+    def reconnect(cursor):
+        body = client.get(url, headers={'Last-Event-ID': cursor}).get_data(as_text=True)
+        return body, (event_id(body) if 'event:' in body else cursor)
+
+    # id가 더 큰 트랜잭션이 먼저 커밋
+    add_event(latest + 5, 'create')
+    body, cursor = reconnect(cursor)
+    assert '"kinds": ["create"]' in body
+
+    # 더 작은 id가 늦게 커밋되어도 전달
+    add_event(latest + 3, 'delete')
+    body, cursor = reconnect(cursor)
+    assert '"kinds": ["delete"]' in body
+    last_id, _, seen = cursor.partition(':')
+    assert last_id == str(latest + 5)
+    assert str(latest + 3) in seen.split(',')
+
+    # 이미 보낸 변경은 다시 보내지 않음
+    body, cursor = reconnect(cursor)
+    assert 'event:' not in body
@@ -0,0 +1,131 @@
+# 스트리밍 XLSX 작성기
+#
+# 외부 라이브러리 없이 XLSX(zip + SpreadsheetML)를 조각 단위로 생성합니다.
+# 행을 받는 즉시 압축해서 내보내므로 행 수와 관계없이 메모리 사용량이 일정합니다.
+import io
+import re
+import zipfile
+from xml.sax.saxutils import escape, quoteattr
+
+# XML 1.0에서 허용되지 않는 제어 문자
+_ILLEGAL_XML_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '{sheets}'
+    '</Types>'
+)
+_SHEET_CONTENT_TYPE = (
+    '<Override PartName="/xl/worksheets/sheet{index}.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+)
+_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets>{sheets}</sheets>'
+    '</workbook>'
+)
+_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '{sheets}'
+    '</Relationships>'
+)
+_SHEET_REL = (
+    '<Relationship Id="rId{index}" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet{index}.xml"/>'
+)
+_SHEET_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '{cols}<sheetData>'
+)
+_SHEET_FOOTER = '</sheetData></worksheet>'
+
+
+# zipfile이 쓰는 바이트를 모아두었다가 drain() 시 비워서 돌려주는 비탐색(unseekable) 스트림
+class _Sink(io.RawIOBase):
+    def __init__(self):
+        self._chunks = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _cell(value):
+    if value is None:
+        return '<c/>'
+    if isinstance(value, bool):
+        return f'<c t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float)):
+        return f'<c><v>{value}</v></c>'
+    text = _ILLEGAL_XML_CHARS.sub('', str(value))
+    return f'<c t="inlineStr"><is><t xml:space="preserve">{escape(text)}</t></is></c>'
+
+
+def _row(values):
+    return '<row>' + ''.join(_cell(v) for v in values) + '</row>'
+
+
+# XLSX 파일을 bytes 조각으로 생성
+# sheets: [(시트명, 헤더 목록, 행 iterable, 열 너비 목록 또는 None)]
+def stream_xlsx(sheets, chunk_rows=1000):
+    sink = _Sink()
+    with zipfile.ZipFile(sink, 'w', zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr('[Content_Types].xml', _CONTENT_TYPES.format(sheets=''.join(
+            _SHEET_CONTENT_TYPE.format(index=i) for i in range(1, len(sheets) + 1)
+        )))
+        zf.writestr('_rels/.rels', _ROOT_RELS)
+        zf.writestr('xl/workbook.xml', _WORKBOOK.format(sheets=''.join(
+            f'<sheet name={quoteattr(name[:31])} sheetId="{i}" r:id="rId{i}"/>'
+            for i, (name, _, _, _) in enumerate(sheets, start=1)
+        )))
+        zf.writestr('xl/_rels/workbook.xml.rels', _WORKBOOK_RELS.format(sheets=''.join(
+            _SHEET_REL.format(index=i) for i in range(1, len(sheets) + 1)
+        )))
+        yield sink.drain()
+
+        for index, (_, header, rows, widths) in enumerate(sheets, start=1):
+            cols = ''
+            if widths:
+                cols = '<cols>' + ''.join(
+                    f'<col min="{i}" max="{i}" width="{w}" customWidth="1"/>'
+                    for i, w in enumerate(widths, start=1)
+                ) + '</cols>'
+
+            with zf.open(f'xl/worksheets/sheet{index}.xml', 'w', force_zip64=True) as sheet:
+                sheet.write((_SHEET_HEADER.format(cols=cols) + _row(header)).encode())
+                buffer = []
+                for row in rows:
+                    buffer.append(_row(row))
+                    if len(buffer) >= chunk_rows:
+                        sheet.write(''.join(buffer).encode())
+                        buffer.clear()
+                        yield sink.drain()
+                sheet.write((''.join(buffer) + _SHEET_FOOTER).encode())
+            yield sink.drain()
+    yield sink.drain()